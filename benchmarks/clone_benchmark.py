@@ -0,0 +1,115 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Compares the cost of copying pokemons with `copy.deepcopy`, like the trainer used to do, against
+`Pokemon.clone` when catching a fainted pokemon and when a pokemon faints. The deepcopy copies a
+`BaselinePokemon`, with the attributes of a pokemon of that version, because deep-copying the current
+pokemon would also copy its species and the random generator of the session.
+
+Run it from the root of the project: python -m benchmarks.clone_benchmark
+"""
+
+import random
+import timeit
+from copy import deepcopy
+from modules.poke_system import PokeSystem
+from modules.pokemon import Pokemon
+from modules.trainer import Trainer
+
+__FILE = './assets/configs/pokemons_data.json'
+__ROUNDS = 20000
+
+def __fainted_pokemon():
+    """
+    The function returns a fainted pokemon, ready to be caught.
+    :return: A Pokemon with no hp.
+    """
+    pokemon = PokeSystem.parse_objects(PokeSystem.load_file(__FILE))[0]
+    pokemon.do_faint()
+    return pokemon
+
+class BaselinePokemon:
+    """
+    The BaselinePokemon keeps the attributes that a pokemon had before it shared its species and its
+    random generator, so `copy.deepcopy` copies the same state that the trainer used to copy
+    """
+
+    def __init__(self, pokemon: Pokemon) -> None:
+        """
+        The constructor copies the species data and the battle state of a pokemon into plain attributes.
+        :param pokemon: The pokemon to copy
+        """
+        self.id, self.power, self.name = pokemon.id, pokemon.power, pokemon.name
+        self.icon, self.icon_el = pokemon.icon, pokemon.icon_el
+        self.types, self.evolutions = list(pokemon.types), list(pokemon.evolutions)
+        self.weakness, self.strenghts, self.attacks = list(pokemon.weakness), list(pokemon.strenghts), list(pokemon.attacks)
+        self._current_attack, self._attack_damage = pokemon.current_attack, pokemon.dmg_current_attack
+        self._life, self._msg_efectivity = pokemon.hp, pokemon.efectivity_message
+        self._effectivity, self._critical_hit = pokemon.effectivity, pokemon.is_critical_damage
+
+    def has_hp(self) -> bool:
+        """
+        It returns whether the pokemon has hp left.
+        :return: a boolean value.
+        """
+        return self._life > 0
+
+    def heal(self) -> None:
+        """
+        It sets a random hp, like the pokemon did with the `random` module.
+        """
+        self._life = random.randint(Pokemon._MIN_HP, Pokemon._MAX_HP)
+
+def __measure(statement) -> float:
+    """
+    The function measures the average cost in microseconds of running the statement.
+    :param statement: A callable without arguments
+    :return: The average microseconds per call.
+    """
+    return 1e6 * min(timeit.repeat(statement, number=__ROUNDS, repeat=5)) / __ROUNDS
+
+def run_benchmark() -> None:
+    """
+    The function measures and prints the per-catch and per-faint cost before (deepcopy) and after
+    (clone).
+    """
+    pokemon = __fainted_pokemon()
+    baseline = BaselinePokemon(pokemon)
+    trainer = Trainer('Benchmark', headless=True)
+    cases = {
+        'catch': (
+            lambda: trainer.try_catch_pokemon(deepcopy(baseline)),
+            lambda: trainer.try_catch_pokemon(pokemon.clone())),
+        'faint': (
+            lambda: trainer.defeated_pokemons.append(deepcopy(baseline)),
+            lambda: trainer.defeated_pokemons.append(pokemon.clone()))
+    }
+    for name, (before, after) in cases.items():
+        before_us, after_us = __measure(before), __measure(after)
+        trainer.pokemons.clear()
+        trainer.defeated_pokemons.clear()
+        print(f'{name:6s} deepcopy: {before_us:7.2f} us | clone: {after_us:7.2f} us | {before_us / after_us:5.1f}x')
+
+
+if __name__ == '__main__':
+    run_benchmark()
@@ -0,0 +1,81 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Compares the cost of logging the errors of a game by opening, appending and closing the log file for
+every message, like `PokeSystem.write_file` used to do, against queueing them in a `LogSink`.
+
+Run it from the root of the project: python -m benchmarks.log_benchmark [--messages N] [--capacity N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from modules.log_sink import LogRecord, LogSink
+
+def __write_file(path: str, message: str) -> None:
+    """
+    The function appends a message to the log file the way the game used to do it.
+    :param path: The path of the log file
+    :param message: The message to append
+    """
+    with open(path, 'a+', encoding='utf-8', newline='\n') as file:
+        file.write(message)
+
+def run_benchmark(messages: int, capacity: int = None) -> None:
+    """
+    The function logs the given amount of messages with both approaches and prints the time spent by
+    the game, and for the sink also the time until every message is on disk. The times of the sink are
+    measured per record written, so the dropped records never make it look faster.
+    :param messages: The amount of messages to log
+    :param capacity: The capacity of the buffer of the sink, defaults to the amount of messages so
+    nothing is dropped
+    """
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'before.txt')
+        start = time.perf_counter()
+        for turn in range(messages):
+            __write_file(path, f'{time.time()} - ("list index out of range",)\n')
+        before = time.perf_counter() - start
+
+        sink = LogSink(os.path.join(folder, 'after.txt'), capacity=capacity or messages, max_bytes=1024 * 1024)
+        start = time.perf_counter()
+        for turn in range(messages):
+            sink.emit(LogRecord(time.time(), 'ERROR', 1, turn, '("list index out of range",)'))
+        queued = time.perf_counter() - start
+        sink.close()
+        written = time.perf_counter() - start
+        rotated = len([file for file in os.listdir(folder) if file.endswith('.gz')])
+    kept = max(1, messages - sink.dropped)
+    print(f'open per message: {before * 1e6 / messages:6.2f} us/msg | sink: {queued * 1e6 / kept:6.2f} us/msg '
+          f'queued, {written * 1e6 / kept:6.2f} us/msg written | {before / messages / (queued / kept):5.1f}x')
+    print(f'{messages} messages, {sink.dropped} dropped ({100 * sink.dropped / messages:.2f}%), '
+          f'{rotated} rotated files kept')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Game log benchmark')
+    parser.add_argument('--messages', type=int, default=200000, help='amount of messages logged (default: 200000)')
+    parser.add_argument('--capacity', type=int, help='capacity of the buffer of the sink (default: the amount of messages)')
+    args = parser.parse_args()
+    run_benchmark(args.messages, args.capacity)
@@ -0,0 +1,91 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Measures how long the game takes to show the main menu, discounting the startup of a bare Python
+interpreter, and fails if it goes over the budget. pandas and pygame must not be imported before
+the menu is shown.
+
+Run it from the root of the project: python -m benchmarks.startup_benchmark [--budget MS]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+__PROMPT = b'select:'
+__ROUNDS = 5
+
+def __time_to(code: str, prompt: bytes = b'') -> float:
+    """
+    The function starts a Python interpreter running the code and measures the time until it
+    writes the prompt, or until it finishes when there is no prompt.
+    
+    :param code: The Python code to run
+    :param prompt: The bytes expected in the standard output, defaults to b''
+    :return: The elapsed milliseconds.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, '-u', '-c', code],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    output = b''
+    while prompt and prompt not in output:
+        chunk = os.read(process.stdout.fileno(), 4096)
+        if not chunk:
+            break
+        output += chunk
+    if not prompt:
+        process.communicate()
+    elapsed = 1e3 * (time.perf_counter() - start)
+    if prompt and prompt not in output:
+        process.kill()
+        raise RuntimeError('The main menu was never shown')
+    process.kill()
+    process.communicate()
+    return elapsed
+
+def run_benchmark(budget: float) -> bool:
+    """
+    The function measures the best time to the main menu and compares it against the budget.
+    
+    :param budget: The allowed milliseconds over a bare interpreter startup
+    :return: True if the startup is within the budget.
+    """
+    bare = min(__time_to('pass') for _ in range(__ROUNDS))
+    menu = min(__time_to('import main; main.main_game()', __PROMPT) for _ in range(__ROUNDS))
+    check = "import sys, main; sys.exit(any(m in sys.modules for m in ('pandas', 'pygame')))"
+    heavy = subprocess.run([sys.executable, '-c', check]).returncode != 0
+    startup = menu - bare
+    print(f'interpreter: {bare:7.1f} ms | menu: {menu:7.1f} ms | startup: {startup:7.1f} ms | budget: {budget:7.1f} ms')
+    if heavy:
+        print('pandas or pygame were imported before the menu')
+    return startup <= budget and not heavy
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Main menu startup benchmark')
+    parser.add_argument('--budget', type=float, default=150.0, help='allowed milliseconds over a bare interpreter')
+    args = parser.parse_args()
+    sys.exit(0 if run_benchmark(args.budget) else 1)
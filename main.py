@@ -20,116 +20,153 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import datetime
-import time
-import pygame.mixer as mixer
-from modules.trainer import Trainer
-from modules.poke_system import PokeSystem
+import argparse
+from modules.audio import AudioManager
+from modules.game_clock import RealClock, VirtualClock, make_clock
 from modules.database.db_manager import DAOManager
-from modules.common_variables import (
-    _B_WHITE, _F_RED, _I_START, _NO_COLOR, 
-    load_file, poke_message, validate_input
-)
+from modules.common_variables import load_file, validate_input
 
 __FILE = './assets/configs/pokemons_data.json'
 __LOG = './assets/logs/pokemons_log.txt'
 __GAME_SOUNDS = load_file(__FILE)
-__BATTLE_S = __GAME_SOUNDS['battle_theme']
-__INTRO_S = __GAME_SOUNDS['intro_theme']
 
 def __show_menu():
     """
-    The function displays a menu with two options and prompts the user to select one of them.
-    :return: The function `show_menu()` returns the user's selected option (either 1 or 2) after
+    The function displays a menu with three options and prompts the user to select one of them.
+    :return: The function `show_menu()` returns the user's selected option (1, 2 or 3) after
     validating the input.
     """
     message =\
         """
         1 - New Game
         2 - Show ranking
+        3 - Show trainer stats
         """
-    option = validate_input('^[1-2]{1}$', input(f'{message}\nselect: '), 0)
+    option = validate_input('^[1-3]{1}$', input(f'{message}\nselect: '), 0)
     return option
 
-def __pokemon_game():
+def __pokemon_game(clock: RealClock | VirtualClock = None, seed: int = None, replay_dir: str = None,
+                   lazy: bool = False):
     """
-    The function "pokemon_game" runs a game where the player battles against randomly assigned Pokemon.
+    The function "pokemon_game" runs a game where the player battles against randomly assigned Pokemon,
+    playing a coroutine session on its own event loop, and then shows the ranking.
+    
+    :param clock: The clock that paces the game session, defaults to a real time clock
+    :param seed: The seed of the game, defaults to None
+    :param replay_dir: The directory where the replay of the game is recorded, defaults to None
+    :param lazy: Whether the pokedex is streamed instead of loaded at once, defaults to False
     """
+    import asyncio # asyncio and the session are only imported when a game starts, to keep the menu startup fast
+    import datetime
+    import os
+    from modules.game_session import GameSession
+    replay_path = None
+    if replay_dir:
+        os.makedirs(replay_dir, exist_ok=True)
+        replay_path = os.path.join(replay_dir, f'{datetime.datetime.now():%Y%m%d-%H%M%S}.rpl')
+    # The battle theme keeps decoding in the background while the trainer reads the intro
+    audio = AudioManager(__GAME_SOUNDS, 0.2)
+    session = GameSession(__FILE, __LOG, clock=clock, audio=audio, seed=seed, replay_path=replay_path, lazy=lazy)
     try:
-        
-        mixer.init()
-        sound = mixer.Sound(__INTRO_S)
-        sound.set_volume(0.2)
-        sound.play()
-        poke_message('Hola entrenador/a, por favor dime tu nombre: ', 'info')
-        
-        trainer_name = validate_input('^[a-zA-Z0-9 _]+$', input(), 'Ash Ketchum')
-        trainer_name = ' '.join([word.capitalize() for word in trainer_name.split(' ')])
+        played = asyncio.run(session.play())
+    finally:
+        audio.close()
+    if played:
+        DAOManager().show_leaderboard()
 
-        poke_message(f'Gracias {trainer_name}, te asignare 3 pokémones aleatorios para que puedas luchar.\nPresiona enter y empezemos!', 'success')
-        _ = input()
-        sound.stop()
-
-        sound = mixer.Sound(__BATTLE_S)
-        sound.set_volume(0.2)
-        sound.play()
-        
-        sys_manager = PokeSystem(__FILE, __LOG)
-        sys_manager.init_pokemons()
-        dao_manager = DAOManager()
-        pkm_trainer = Trainer(trainer_name)
-
-        dao_manager.create_table()
-        sys_manager.assign_init_pokemons(pkm_trainer)
-        sys_manager.player_score = sys_manager.calculate_score(pkm_trainer)
-        
-        pkm_trainer.speak(f'{_B_WHITE}{_F_RED}', f'Hora del duelo Pokemon!', f'{_I_START}{_NO_COLOR}')
-        pkm_trainer.next_pokemon()
-        enemy_pokemon = sys_manager.next_pokemon() # Traigo al proximo pokemon para pelear
-        still_can_fight = True
-        time.sleep(2)
-        while still_can_fight and sys_manager.pokemons:
-            PokeSystem.clear_console()
-            if not enemy_pokemon or not enemy_pokemon.has_hp():
-                enemy_pokemon = sys_manager.next_pokemon()
-            is_player_turn = sys_manager.attack_turn()
-            PokeSystem.manage_game_turn(is_player_turn, pkm_trainer, enemy_pokemon)
-            sys_manager.player_score = sys_manager.calculate_score(pkm_trainer)
-            pkm_trainer.pokemon_in_battle = sys_manager.system_message(pkm_trainer, is_player_turn, pkm_trainer.pokemon_in_battle, enemy_pokemon)
-            PokeSystem.reset_buff([pkm_trainer.pokemon_in_battle, enemy_pokemon])
-            still_can_fight = pkm_trainer.check_win_or_lose()
-            if still_can_fight:
-                pkm_trainer.catch_if_pokeball(enemy_pokemon)
-        pkm_trainer.check_status()
-        sys_manager.player_score = sys_manager.calculate_score(pkm_trainer)
-        sys_manager.show_score()
-        dao_manager.insert_table(pkm_trainer, sys_manager)
-        dao_manager.select_table(type='view')
-        sound.stop()
-
-    except Exception as e:
-        message = f'{datetime.datetime.now()} - {e.args}'
-        PokeSystem.write_file(sys_manager.log_path, 'a+', message)
-        print(
-            'Error al ejecutar la funcion principal',
-            f'Exception: {e.__traceback__.tb_lineno}',
-            f'Details: {e}',
-            sep='\n')
-
-def main_game() -> None:
+def main_game(clock: RealClock | VirtualClock = None, seed: int = None, replay_dir: str = None,
+              lazy: bool = False) -> None:
     """
     The function presents a menu to the user and executes different actions based on their selection.
+    
+    :param clock: The clock that paces the game session, defaults to a real time clock
+    :param seed: The seed of the game, the same seed and the same answers play the same game
+    :param replay_dir: The directory where the replay of a new game is recorded, defaults to None
+    :param lazy: Whether a new game streams the pokedex instead of loading it at once, defaults to False
     """
     selected = __show_menu()
     match selected:
         case '1':
-            __pokemon_game()
+            __pokemon_game(clock, seed, replay_dir, lazy)
         case '2':
             dao_manager = DAOManager()
-            dao_manager.select_table(type='view')
+            dao_manager.show_leaderboard()
+        case '3':
+            trainer_name = validate_input('^[a-zA-Z0-9 _]+$', input('Trainer name: '), 'Ash Ketchum')
+            trainer_name = ' '.join([word.capitalize() for word in trainer_name.split(' ')])
+            dao_manager = DAOManager()
+            dao_manager.show_trainer_stats(trainer_name)
         case _:
-            print('Error, please select between 1 or 2.')
+            print('Error, please select between 1, 2 or 3.')
+
+
+def __clock_mode(mode: str) -> RealClock | VirtualClock:
+    """
+    The function builds the clock of the --speed argument, showing why the mode is not valid.
+    :param mode: The mode of the clock, as accepted by `make_clock`
+    :return: The clock of the game.
+    """
+    try:
+        return make_clock(mode)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+def __parse_args() -> argparse.Namespace:
+    """
+    The function parses the command line arguments of the game.
+    :return: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description='Mini Automatic Pokemon Game [Console Version]')
+    parser.add_argument('--simulate', type=int, metavar='GAMES',
+                        help='run the given amount of headless games and show a summary')
+    parser.add_argument('--tournament', type=int, metavar='GAMES',
+                        help='run the given amount of headless games across all cores and show win rates')
+    parser.add_argument('--workers', type=int, help='amount of processes used by the tournament')
+    parser.add_argument('--record', action='store_true',
+                        help='store the scores of the simulated games in the database')
+    parser.add_argument('--duels', type=int, metavar='BATTLES',
+                        help='resolve random one versus one battles with the NumPy engine and the object engine')
+    parser.add_argument('--seed', type=int, help='base seed of the game, the simulations, the tournament and the duels')
+    parser.add_argument('--serve', action='store_true',
+                        help='host many games over TCP, one session per connection (telnet HOST PORT)')
+    parser.add_argument('--load', type=int, metavar='SESSIONS',
+                        help='open the given amount of bot sessions against a running server and show the latencies')
+    parser.add_argument('--concurrency', type=int, help='maximum amount of bot sessions open at once')
+    parser.add_argument('--host', default='127.0.0.1', help='address of the game server (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=4000, help='port of the game server (default: 4000)')
+    parser.add_argument('--replay-dir', metavar='DIR',
+                        help='record a compact replay of the game, or of every session of the server, in the directory')
+    parser.add_argument('--replay', metavar='FILE', help='show a recorded game turn by turn, paced by --speed')
+    parser.add_argument('--from-turn', type=int, default=1, metavar='TURN', help='first turn shown by --replay (default: 1)')
+    parser.add_argument('--verify', action='store_true',
+                        help='play again with the engine the game of --replay and check that it is the same game')
+    parser.add_argument('--lazy', action='store_true',
+                        help='stream the pokedex of a new game and read every wild pokemon when it is drawn, for very large files')
+    parser.add_argument('--speed', type=__clock_mode, default='real', metavar='MODE', dest='clock',
+                        help="pace of the game: real, instant, virtual or a speed like 4 or x4 (default: real)")
+    return parser.parse_args()
 
 
 if __name__ == '__main__':
-    main_game()
\ No newline at end of file
+    args = __parse_args()
+    # The simulation modules are only imported when they are asked for, to keep the menu startup fast
+    if args.replay:
+        from modules.replay_player import show_replay
+        show_replay(args.replay, __FILE, __LOG, args.clock, args.from_turn - 1, args.verify)
+    elif args.serve:
+        from modules.game_server import run_server
+        run_server(__FILE, __LOG, args.host, args.port, args.clock, args.replay_dir)
+    elif args.load:
+        from modules.load_generator import show_load
+        show_load(args.host, args.port, args.load, args.concurrency)
+    elif args.duels:
+        from modules.vector_engine import show_comparison
+        show_comparison(args.duels, __FILE, args.seed)
+    elif args.tournament:
+        from modules.tournament import show_tournament
+        show_tournament(args.tournament, __FILE, __LOG, args.workers, args.seed, record=args.record)
+    elif args.simulate:
+        from modules.simulation import show_simulation
+        show_simulation(args.simulate, __FILE, __LOG, args.record, args.seed)
+    else:
+        main_game(args.clock, args.seed, args.replay_dir, args.lazy)
\ No newline at end of file
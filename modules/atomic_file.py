@@ -0,0 +1,45 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+
+def write_atomic(target: str, *chunks: bytes) -> bool:
+    """
+    This function writes a file through a temporary file in the same folder that replaces the target
+    once it is complete, so a reader sees either the previous file or the new one, never a half written
+    one. It is used by the caches of the game, which are rebuilt when they can't be written.
+    
+    :param target: The path of the file
+    :param chunks: The bytes written, in order
+    :return: True if the file was written, False if the folder is read-only or the disk failed.
+    """
+    temporal = f'{target}.{os.getpid()}.tmp'
+    try:
+        with open(temporal, 'wb') as file:
+            for chunk in chunks:
+                file.write(chunk)
+        os.replace(temporal, target)
+        return True
+    except OSError:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        return False
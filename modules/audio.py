@@ -0,0 +1,303 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import importlib
+import mmap
+import os
+import struct
+import threading
+from modules.atomic_file import write_atomic
+
+_mixer = None
+_mixer_loaded: bool = False
+_mixer_lock = threading.Lock()
+
+_MAGIC: bytes = b'PPCM'
+_VERSION: int = 1
+# magic, version, mtime of the source in nanoseconds, size of the source, mixer frequency, format and channels
+_HEADER = struct.Struct('<4sHqqihh')
+
+class SilentSound:
+    """
+    The SilentSound class replaces a pygame Sound when pygame or an audio device is not available
+    """
+
+    def set_volume(self, volume: float) -> None:
+        """
+        It does nothing, there is no sound to change.
+        
+        :param volume: float
+        """
+
+    def play(self, loops: int = 0, maxtime: int = 0, fade_ms: int = 0) -> None:
+        """
+        It does nothing, there is no sound to play.
+        """
+
+    def fadeout(self, time: int) -> None:
+        """
+        It does nothing, there is no sound to fade out.
+        """
+
+    def stop(self) -> None:
+        """
+        It does nothing, there is no sound to stop.
+        """
+
+def load_mixer():
+    """
+    This function imports and initializes `pygame.mixer` the first time it is needed, so the game
+    doesn't pay for pygame until a sound is played. It can be called from any thread.
+    :return: the `pygame.mixer` module, or None if pygame is not installed or there is no audio device.
+    """
+    global _mixer, _mixer_loaded
+    with _mixer_lock:
+        if not _mixer_loaded:
+            _mixer_loaded = True
+            try:
+                mixer = importlib.import_module('pygame.mixer')
+                mixer.init()
+                _mixer = mixer
+            except Exception:
+                _mixer = None
+    return _mixer
+
+def cache_path(path: str) -> str:
+    """
+    This function returns the path of the decoded PCM cache of a sound file, next to it.
+    
+    :param path: The path of the sound file
+    :return: the path of the `.pcm` file.
+    """
+    return f'{os.path.splitext(path)[0]}.pcm'
+
+class AudioManager:
+    """
+    The AudioManager class initializes the mixer and decodes the game sounds on a background thread,
+    keeping the decoded PCM in a cache file so later launches map it instead of decoding the MP3 again
+    """
+
+    def __init__(self, sounds: dict[str, str], volume: float = 0.2) -> None:
+        """
+        The constructor receives the sounds to preload, the `sounds` section of the pokedex JSON.
+        
+        :param sounds: A dictionary with the name and the path of each sound, they are decoded in order
+        :param volume: The volume of the sounds, between 0 and 1, defaults to 0.2
+        """
+        self.__sounds: dict[str, str] = dict(sounds)
+        self.__volume: float = volume
+        self.__loaded: dict = dict()
+        self.__ready: dict[str, threading.Event] = {name: threading.Event() for name in self.__sounds}
+        self.__maps: list[tuple[memoryview, mmap.mmap]] = list()
+        self.__current = None
+        # the sound asked for while it was still decoding and its fade, it starts as soon as it is loaded
+        self.__pending: tuple[str, int] | None = None
+        self.__lock = threading.RLock()
+        self.__thread: threading.Thread | None = None
+
+    def start(self) -> 'AudioManager':
+        """
+        This method starts the background thread that decodes the sounds, only once.
+        :return: the AudioManager itself.
+        """
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__preload, name='audio-preload', daemon=True)
+            self.__thread.start()
+        return self
+
+    def __preload(self) -> None:
+        """
+        This method initializes the mixer and loads every sound, marking each one as ready as soon as
+        it is loaded so the first one can be played while the others are still decoding. A sound that
+        fails is replaced by a SilentSound, and every sound is marked as ready when the thread ends,
+        so nobody waits forever for a sound that will never be loaded.
+        """
+        try:
+            mixer = load_mixer()
+            for name, path in self.__sounds.items():
+                try:
+                    sound = self.__load_sound(mixer, path) if mixer else SilentSound()
+                    sound.set_volume(self.__volume)
+                except Exception:
+                    sound = SilentSound()
+                with self.__lock:
+                    self.__loaded[name] = sound
+                    self.__ready[name].set()
+                    self.__play_pending(name)
+        finally:
+            for event in self.__ready.values():
+                event.set()
+            if self.__pending:
+                self.__play_pending(self.__pending[0])
+
+    def __load_sound(self, mixer, path: str):
+        """
+        This method builds a Sound from the PCM cache when it matches the sound file and the mixer
+        settings, otherwise it decodes the sound file and writes the cache.
+        
+        :param mixer: The initialized `pygame.mixer` module
+        :param path: The path of the sound file
+        :return: a pygame Sound.
+        """
+        settings = mixer.get_init()
+        stat = os.stat(path)
+        samples = self.__read_cache(path, stat, settings)
+        if samples is not None:
+            return mixer.Sound(buffer=samples)
+        sound = mixer.Sound(path)
+        self.__write_cache(path, stat, settings, sound.get_raw())
+        return sound
+
+    def __read_cache(self, path: str, stat: os.stat_result, settings: tuple) -> memoryview | None:
+        """
+        This method maps the PCM cache of a sound file in memory.
+        
+        :param path: The path of the sound file
+        :param stat: The stat of the sound file
+        :param settings: The frequency, format and channels of the mixer
+        :return: a memoryview over the samples, or None if the cache is missing or stale.
+        """
+        try:
+            with open(cache_path(path), 'rb') as file:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            magic, version, mtime_ns, size, *cached_settings = _HEADER.unpack_from(mapped)
+        except struct.error:
+            mapped.close()
+            return None
+        if (magic, version, mtime_ns, size, tuple(cached_settings)) != (
+                _MAGIC, _VERSION, stat.st_mtime_ns, stat.st_size, tuple(settings)):
+            mapped.close()
+            return None
+        samples = memoryview(mapped)[_HEADER.size:]
+        self.__maps.append((samples, mapped))
+        return samples
+
+    def __write_cache(self, path: str, stat: os.stat_result, settings: tuple, samples: bytes) -> None:
+        """
+        This method writes the decoded samples into the PCM cache with `write_atomic`. A read-only folder
+        just leaves the game without cache.
+        
+        :param path: The path of the sound file
+        :param stat: The stat of the sound file
+        :param settings: The frequency, format and channels of the mixer
+        :param samples: The raw decoded samples
+        """
+        write_atomic(cache_path(path), _HEADER.pack(_MAGIC, _VERSION, stat.st_mtime_ns, stat.st_size, *settings), samples)
+
+    def sound(self, name: str, timeout: float | None = 30.0):
+        """
+        This method returns a loaded sound, waiting for the background thread if it is still decoding.
+        
+        :param name: The name of the sound in the `sounds` section
+        :param timeout: The maximum seconds to wait, None waits until it is loaded, defaults to 30
+        :return: a pygame Sound, or a SilentSound if it is not available.
+        """
+        self.start()
+        if name not in self.__ready or not self.__ready[name].wait(timeout):
+            return SilentSound()
+        return self.__loaded.get(name) or SilentSound()
+
+    def crossfade(self, name: str, fade_ms: int = 1500):
+        """
+        This method fades out the sound that is playing while the new one fades in. It never waits for
+        the background thread: a sound that is still decoding starts as soon as it is loaded, so the game
+        doesn't stall on a cold cache.
+        
+        :param name: The name of the sound in the `sounds` section
+        :param fade_ms: The milliseconds of the crossfade, 0 switches at once, defaults to 1500
+        :return: the sound that is now playing, or None if it starts when it is loaded.
+        """
+        self.start()
+        with self.__lock:
+            self.stop(fade_ms)
+            if name in self.__ready and not self.__ready[name].is_set():
+                self.__pending = (name, fade_ms)
+                return None
+            return self.__start(name, fade_ms)
+
+    def play(self, name: str):
+        """
+        This method stops the sound that is playing and plays a new one, as soon as it is loaded.
+        
+        :param name: The name of the sound in the `sounds` section
+        :return: the sound that is now playing, or None if it starts when it is loaded.
+        """
+        return self.crossfade(name, 0)
+
+    def __start(self, name: str, fade_ms: int):
+        """
+        This method plays a loaded sound as the current one, the caller must hold the lock.
+        
+        :param name: The name of the sound in the `sounds` section
+        :param fade_ms: The milliseconds of the fade in
+        :return: the sound that is now playing.
+        """
+        sound = self.__loaded.get(name) or SilentSound()
+        sound.play(fade_ms=fade_ms)
+        self.__current = sound
+        return sound
+
+    def __play_pending(self, name: str) -> None:
+        """
+        This method plays the sound that was asked for while it was decoding, once it is loaded.
+        
+        :param name: The name of the sound just loaded
+        """
+        with self.__lock:
+            if self.__pending and self.__pending[0] == name:
+                self.__start(*self.__pending)
+                self.__pending = None
+
+    def stop(self, fade_ms: int = 0) -> None:
+        """
+        This method stops the sound that is playing, fading it out if it is asked, and forgets the sound
+        that was waiting to be loaded.
+        
+        :param fade_ms: The milliseconds of the fade out, defaults to 0
+        """
+        with self.__lock:
+            self.__pending = None
+            if self.__current is not None:
+                if fade_ms:
+                    self.__current.fadeout(fade_ms)
+                else:
+                    self.__current.stop()
+                self.__current = None
+
+    def close(self) -> None:
+        """
+        This method stops the sounds, waits for the background thread and unmaps the PCM caches. A cache
+        still used by a sound of the mixer stays mapped until the exit.
+        """
+        self.stop()
+        if self.__thread is not None:
+            self.__thread.join()
+        for samples, mapped in self.__maps:
+            try:
+                samples.release()
+                mapped.close()
+            except BufferError:
+                pass
+        self.__maps.clear()
@@ -22,6 +22,7 @@
 
 import json
 import re
+from modules.pokedex_cache import load_pokedex
 
 _B_RED: enumerate = '\033[41m'
 _B_GREEN: enumerate = '\033[42m'
@@ -44,8 +45,7 @@ def load_file(path: str) -> dict:
     contains the data to be loaded
     :return: A dictionary containing the 'sounds' data from a JSON file located at the specified path.
     """
-    with open(path, 'r', encoding='utf-8') as file:
-        return dict(json.load(file)['sounds'])
+    return dict(load_pokedex(path)['sounds'])
 
 def validate_input(patron: str, input: str, return_error) -> str:
     """
@@ -63,7 +63,7 @@ def validate_input(patron: str, input: str, return_error) -> str:
         return input
     return return_error
 
-def poke_message(message: str, message_type: str) -> None:
+def poke_message(message: str, message_type: str, renderer=None) -> None:
     """
     This is a Python function that prints messages with different colors and message types (error,
     success, information).
@@ -71,7 +71,9 @@ def poke_message(message: str, message_type: str) -> None:
     :param message: A string containing the message to be displayed
     :param message_type: A string indicating the type of message being passed (e.g. "Error",
     "Success", "Info")
+    :param renderer: The renderer used to show the message, defaults to None (print it)
     """
+    output = renderer.write if renderer else print
     _b_red: str = '\033[41m'
     _b_green: str = '\033[42m'
     _b_blue: str = '\033[44m'
@@ -80,11 +82,11 @@ def poke_message(message: str, message_type: str) -> None:
     message_type = message_type.strip().capitalize()
     match message_type:
         case 'Error':
-            print(f'{_b_red}{_f_white}> Error: {message}{_no_color}')
+            output(f'{_b_red}{_f_white}> Error: {message}{_no_color}')
         case 'Success':
-            print(f'{_b_green}{_f_white}> Success: {message}{_no_color}')
+            output(f'{_b_green}{_f_white}> Success: {message}{_no_color}')
         case 'Info':
-            print(f'{_b_blue}{_f_white}> Information: {message}{_no_color}')
+            output(f'{_b_blue}{_f_white}> Information: {message}{_no_color}')
 
 def load_configs(path: str) -> dict:
     """
@@ -0,0 +1,150 @@
+# GNU General Public License V3
+#
+# Copyright (C) <2022>  <Facundo Falcone> - Improvements
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import atexit
+import sqlite3 as db
+import threading
+
+class ConnectionPool:
+    "Represents a pool of long-lived SQLite connections, one per thread, for a database file"
+    __pools: dict = dict()
+    __pools_lock = threading.Lock()
+
+    def __init__(self, db_file: str, pragmas: dict = None, busy_timeout: float = 5.0) -> None:
+        self.__db_file = db_file
+        self.__pragmas: dict = dict(pragmas or {})
+        self.__busy_timeout = busy_timeout
+        self.__local = threading.local()
+        self.__connections: dict[threading.Thread, db.Connection] = dict()
+        self.__lock = threading.Lock()
+        self.__initialized = set[str]()
+        self.__running: dict[str, threading.Lock] = dict()
+
+    @staticmethod
+    def get(db_file: str, pragmas: dict = None, busy_timeout: float = 5.0) -> 'ConnectionPool':
+        """
+        It returns the pool of the database file, creating it the first time, so every DAO of the
+        process shares the same connections.
+        
+        :param db_file: The path to the SQLite database file
+        :param pragmas: The PRAGMAs applied to every new connection
+        :param busy_timeout: The seconds a connection waits for a lock before failing
+        :return: The ConnectionPool of the database file.
+        """
+        with ConnectionPool.__pools_lock:
+            pool = ConnectionPool.__pools.get(db_file)
+            if not pool:
+                pool = ConnectionPool.__pools[db_file] = ConnectionPool(db_file, pragmas, busy_timeout)
+            return pool
+
+    @staticmethod
+    def close_all() -> None:
+        """
+        It closes every connection of every pool, it is registered to run at exit.
+        """
+        with ConnectionPool.__pools_lock:
+            for pool in ConnectionPool.__pools.values():
+                pool.close()
+
+    def connection(self) -> db.Connection:
+        """
+        It returns the connection of the current thread, opening it and applying the PRAGMAs the first
+        time the thread asks for it.
+        
+        :return: A sqlite3 Connection.
+        """
+        conection = getattr(self.__local, 'connection', None)
+        if conection is None:
+            conection = db.connect(self.__db_file, timeout=self.__busy_timeout, check_same_thread=False)
+            for pragma, value in self.__pragmas.items():
+                conection.execute(f'PRAGMA {pragma} = {value}')
+            self.__local.connection = conection
+            with self.__lock:
+                self.__close_finished()
+                self.__connections[threading.current_thread()] = conection
+        return conection
+
+    def release(self) -> None:
+        """
+        It commits and closes the connection of the current thread, the connections of the other threads
+        stay open. The thread gets a new connection if it asks for one again.
+        """
+        conection = getattr(self.__local, 'connection', None)
+        if conection is None:
+            return
+        self.__local.connection = None
+        with self.__lock:
+            self.__connections.pop(threading.current_thread(), None)
+            self.__close_finished()
+        ConnectionPool.__close_connection(conection)
+
+    def __close_finished(self) -> None:
+        """
+        It closes the connections of the threads that have finished, the caller must hold the lock.
+        """
+        for thread in [thread for thread in self.__connections if not thread.is_alive()]:
+            ConnectionPool.__close_connection(self.__connections.pop(thread))
+
+    @staticmethod
+    def __close_connection(conection: db.Connection) -> None:
+        """
+        It commits and closes a connection, ignoring the errors of a connection already broken.
+        
+        :param conection: The connection to close
+        """
+        try:
+            conection.commit()
+            conection.close()
+        except db.Error:
+            pass
+
+    def run_once(self, key: str, action) -> None:
+        """
+        It runs the action until it succeeds once for this pool, used for statements that don't need to
+        be repeated on every call, like creating a view. The key is only marked as done when the action
+        doesn't raise and doesn't return False, so a failed action runs again on the next call, and a
+        thread that asks while another thread is running the action waits for it.
+        
+        :param key: The name of the action
+        :param action: A callable without arguments
+        """
+        with self.__lock:
+            if key in self.__initialized:
+                return
+            running = self.__running.setdefault(key, threading.Lock())
+        with running:
+            with self.__lock:
+                if key in self.__initialized:
+                    return
+            if action() is not False:
+                with self.__lock:
+                    self.__initialized.add(key)
+
+    def close(self) -> None:
+        """
+        It commits and closes every connection of the pool, of every thread. It is meant for the exit of
+        the process, a DAO only releases the connection of its thread with `release`.
+        """
+        with self.__lock:
+            for conection in self.__connections.values():
+                ConnectionPool.__close_connection(conection)
+            self.__connections.clear()
+            self.__initialized.clear()
+            self.__local = threading.local()
+
+
+atexit.register(ConnectionPool.close_all)
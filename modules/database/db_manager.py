@@ -15,17 +15,22 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import re
 import sqlite3 as db
-from pandas import DataFrame
-import pandas as pd
+from typing import TYPE_CHECKING
 from modules.common_variables import load_configs
+from modules.database.connection_pool import ConnectionPool
+from modules.database.statements import StatementRegistry
 from modules.trainer import Trainer
 from modules.poke_system import PokeSystem
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 class DAOManager:
     "Represents the DAO Manager, using SQLite"
-    __result_from_query: list = list()
+    __RANKING_COLUMNS: tuple[str] = ('id', 'trainer_name', 'status', 'amount_pokemons', 'score', 'dataingestiondttm')
+    __RANKING_KEY: str = '(`status`, `score`, `amount_pokemons`, `trainer_name`, `dataingestiondttm`, `id`)'
+    __RANKING_ORDER: str = 'ORDER BY `status` DESC, `score` DESC, `amount_pokemons` DESC, `trainer_name` DESC, `dataingestiondttm` DESC, `id` DESC'
     def __init__(self) -> None:
         self.__db_configs = load_configs('./modules/configs.json')
         self.__db_name: str = self.__db_configs['name']
@@ -34,20 +39,12 @@ class DAOManager:
         self.__db_output_file: str = self.__db_configs['paths']['db_file']
         self.__ddl_paths: dict = self.__db_configs['paths']['DDL']
         self.__dml_paths: dict = self.__db_configs['paths']['DML']
+        self.__statements = StatementRegistry.get(self.__table, self.__ddl_paths, self.__dml_paths)
+        self.__pool = ConnectionPool.get(
+            self.__db_output_file, self.__db_configs.get('pragmas'), self.__db_configs.get('busy_timeout', 5))
 
 
-    def __open_query_file(self, query_path: str) -> str:
-        """
-        It opens a file, reads it, and returns the contents of the file
-        
-        :param query_path: The path to the query file
-        :type query_path: str
-        :return: The query file is being returned.
-        """
-        with open(query_path, 'r') as db_config:
-            return db_config.read()
-
-    def __execute_queries(self, queries: list[str], error_msg: str, success_msg: str, type: str = 'create') -> db.Cursor:
+    def __execute_queries(self, queries: list[str], error_msg: str, success_msg: str, type: str = 'create', parameters: list[tuple] = None) -> db.Cursor:
         """
         It executes a list of queries and returns the result of the last query executed
         
@@ -59,14 +56,17 @@ class DAOManager:
         :type success_msg: str
         :param type: str = 'create', defaults to create
         :type type: str (optional)
+        :param parameters: The values bound to the '?' of every query, defaults to no values
+        :type parameters: list[tuple] (optional)
         :return: The result of the query.
         """
-        with db.connect(f'{self.__db_output_file}') as conection:
+        conection = self.__pool.connection()
+        with conection:
             try:
                 if queries:
                     rows_amount = 0
-                    for query in queries:
-                        result = conection.execute(query)
+                    for query, values in zip(queries, parameters or [()] * len(queries)):
+                        result = conection.execute(query, values)
                         if result and result.rowcount > 0:
                             rows_amount += result.rowcount
                     conection.commit()
@@ -79,16 +79,6 @@ class DAOManager:
             except db.OperationalError as oe:
                 print(f'>> System: {error_msg}', oe)
 
-    def __replace_table_name(self, query: str) -> str:
-        """
-        It takes a query string and replaces the string 'T_NAME' with the name of the table
-        
-        :param query: The query to be executed
-        :type query: str
-        :return: The query is being returned with the table name replaced.
-        """
-        return query.replace('T_NAME', self.__table)
-    
     def __re_do_table(self) -> None:
         """
         It drops the table and then creates it again
@@ -98,58 +88,85 @@ class DAOManager:
 
     def create_table(self) -> None:
         """
-        It opens a file, reads the contents, replaces a string in the contents, and then executes the
-        query creating the table if not exists.
+        It executes the registered queries creating the table and its indexes if they don't exist, and
+        the view used by the ranking. The indexes are asked for on every call, because dropping the
+        table when the configs ask to delete the data before inserting drops its indexes too.
+        """
+        queries = [
+            self.__statements.statement('create'),
+            self.__statements.statement('create_index'),
+            self.__statements.statement('create_trainer_index')]
+        self.__execute_queries(queries, 'Table already exists', f'Table {self.__table} created successfully')
+        self.__pool.run_once(f'{self.__table}_indexes', self.__create_indexes)
+
+    def __create_indexes(self) -> bool:
+        """
+        This function creates, if they don't exist, the covering index that keeps the rows in ranking
+        order, the index of the games of every trainer by date and the view of the table, so reading the
+        ranking and the trainer stats doesn't need to sort the table.
+        :return: True if they were created, False if they must be tried again.
         """
-        query = self.__replace_table_name(self.__open_query_file(self.__ddl_paths['create']))
-        self.__execute_queries([query], 'Table already exists', f'Table {self.__table} created successfully')
+        queries = [
+            self.__statements.statement('create_index'),
+            self.__statements.statement('create_trainer_index'),
+            *self.__statements.statements('update_vw')]
+        return self.__execute_queries(queries, 'Error creating the indexes', f'Indexes of {self.__table} created successfully') is not None
     
     def insert_table(self, trainer: Trainer, poke_sys: PokeSystem) -> None:
+        """
+        It inserts the result of the game of the trainer, binding the values to the registered insert
+        query.
+        
+        :param trainer: The trainer that played the game
+        :param poke_sys: The system with the score of the game
+        """
         if self.__insert_deleting_before:
             self.__re_do_table()
-        query = self.__replace_table_name(self.__open_query_file(self.__dml_paths['insert']))
-        to_replace = re.findall("1_.", query)
-        elements = [
+        elements = (
             trainer.name, trainer.status, 
             len(trainer.defeated_pokemons) + len(trainer.pokemons), 
-            poke_sys.player_score]
-        queries = list[str]()
-        query_replaced = self.__create_insert_query(to_replace, elements, query)
-        queries.append(query_replaced)
-        self.__execute_queries(queries, 'Error adding the data', 'Data inserted successfully', type='insert')
-    
-    def __create_insert_query(self, to_replace: list[str], replacement: list, query_base: str) -> str:
+            poke_sys.player_score)
+        query = self.__statements.statement('insert')
+        self.__execute_queries([query], 'Error adding the data', 'Data inserted successfully', type='insert', parameters=[elements])
+
+    def prepare_table(self) -> None:
+        """
+        It creates the table if not exists, dropping it before when the configs ask to delete the data
+        before inserting.
         """
-        It takes a list of strings and a tuple of strings and replaces the strings in the list with the
-        strings in the tuple in a given string
+        if self.__insert_deleting_before:
+            self.__re_do_table()
+        else:
+            self.create_table()
+
+    def insert_many(self, rows: list[tuple]) -> int:
+        """
+        It inserts many scores with the registered insert query in a single transaction. The errors are
+        raised, so the caller knows which rows were not written, the transaction is rolled back.
         
-        :param to_replace: list of strings to be replaced in the query
-        :param replacement: list with the values to replace in the query
-        :param query_base: The base query that will be used to create the insert query by replacing its values
-        :return: The query with all the values replaced to be executed.
+        :param rows: A list of tuples with the trainer name, status, amount of pokemons and score
+        :return: The amount of rows inserted.
         """
-        query_replaced = query_base
-        for i in range(len(replacement)):
-            query_replaced = query_replaced.replace(to_replace[i], f'{replacement[i]}')
-        return query_replaced
+        query = self.__statements.statement('insert')
+        conection = self.__pool.connection()
+        with conection:
+            return conection.executemany(query, rows).rowcount
 
     def delete_table(self) -> None:
         """
-        It opens a file, reads the contents of the file, replaces the table name in the file with the
-        table name provided by the user, executes the query and prints a message
+        It executes the registered query deleting every row of the table and prints a message
         """
-        query = self.__replace_table_name(self.__open_query_file(self.__dml_paths['delete']))
+        query = self.__statements.statement('delete')
         self.__execute_queries([query], 'Error deleting the table', f'Table {self.__table} deleted successfully', type='delete')
     
     def drop_table(self) -> None:
         """
-        It opens a file, reads the contents of the file, replaces the table name in the file with the
-        table name of the class, and then executes the query
+        It executes the registered query dropping the table
         """
-        query = self.__replace_table_name(self.__open_query_file(self.__ddl_paths['drop']))
+        query = self.__statements.statement('drop')
         self.__execute_queries([query], 'Error dropping the table', f'Table {self.__table} dropped successfully', type='drop')
     
-    def __create_df(self, columns: list, data: list[tuple]) -> pd.DataFrame:
+    def __create_df(self, columns: list, data: list[tuple]) -> 'DataFrame':
         """
         This function creates a pandas DataFrame from a list of columns and data.
         
@@ -158,6 +175,7 @@ class DAOManager:
         length of each tuple should match the number of columns specified in the 'columns' parameter
         :return: a pandas DataFrame object created from the input columns and data.
         """
+        from pandas import DataFrame # pandas is only imported when a DataFrame is needed
         db_df = DataFrame(data, columns=columns)
         return db_df
     
@@ -167,25 +185,22 @@ class DAOManager:
         object.
         :return: a database cursor object.
         """
-        query = self.__replace_table_name(self.__open_query_file(self.__dml_paths['select']))
+        query = self.__statements.statement('select')
         result = self.__execute_queries([query], 'Error getting the table info', f'Table {self.__table} read successfully', type='select')
         return result
     
     def __query_select_vw(self) -> db.Cursor:
-        queries = list[str]()
-        queries.extend(
-            self.__replace_table_name(self.__open_query_file(self.__dml_paths['update_vw'])).split(';')
-        )
-        queries.append(
-            self.__replace_table_name(self.__open_query_file(self.__dml_paths['select_vw']))
-        )
-        #query = self.__replace_table_name(self.__open_query_file(self.__dml_paths['update_vw']))
-        #result = self.__execute_queries(query.split(';'), 'Error getting the table info', f'Table {self.__table} read successfully', type='update')
-        #query = self.__replace_table_name(self.__open_query_file(self.__dml_paths['select_vw']))
-        result = self.__execute_queries(queries, 'Error getting the view info', f'View {self.__table} read successfully', type='select')
+        """
+        This function executes a select query on the view of the table, creating the indexes and the view
+        only the first time the ranking is read in the process, and returns the result as a cursor object.
+        :return: a database cursor object.
+        """
+        self.__pool.run_once(f'{self.__table}_indexes', self.__create_indexes)
+        query = self.__statements.statement('select_vw')
+        result = self.__execute_queries([query], 'Error getting the view info', f'View {self.__table} read successfully', type='select')
         return result
     
-    def __select_to_df(self, query_from: str ='table') -> pd.DataFrame:
+    def __select_to_df(self, query_from: str ='table') -> 'DataFrame':
         """
         This function executes a SELECT query, retrieves the result, and returns it as a pandas
         DataFrame.
@@ -199,7 +214,116 @@ class DAOManager:
         fields = [field[0] for field in self.__result_from_query.description]
         return self.__create_df(fields, self.__result_from_query.fetchall())
     
-    def select_table(self, type: str = 'table') -> DataFrame:
+    def leaderboard(self, limit: int = 10, offset: int = 0, status: str = None, since=None, until=None,
+                    trainer_name: str = None, after: tuple = None):
+        """
+        This function streams the rows of the ranking, in the order of its covering index, reading them
+        from the cursor one by one instead of loading the whole table.
+        
+        :param limit: The maximum amount of rows, defaults to 10
+        :param offset: The amount of rows to skip, defaults to 0. Prefer `after` for deep pages
+        :param status: Only the games with this status ('Won' or 'Lose'), defaults to every status
+        :param since: Only the games stored since this date or datetime (inclusive)
+        :param until: Only the games stored before this date or datetime (exclusive)
+        :param trainer_name: Only the games of this trainer
+        :param after: The last row of the previous page, to continue right after it (keyset pagination)
+        :return: a generator of tuples with the id, trainer name, status, amount of pokemons, score and
+        date of every game.
+        """
+        self.__pool.run_once(f'{self.__table}_indexes', self.__create_indexes)
+        conditions, values = list[str](), list()
+        for condition, value in (
+                ('`status` = ?', status), ('`dataingestiondttm` >= ?', since),
+                ('`dataingestiondttm` < ?', until), ('`trainer_name` = ?', trainer_name)):
+            if value is not None:
+                conditions.append(condition)
+                values.append(str(value))
+        if after is not None:
+            row = dict(zip(DAOManager.__RANKING_COLUMNS, after))
+            conditions.append(f'{DAOManager.__RANKING_KEY} < (?, ?, ?, ?, ?, ?)')
+            values.extend(row[column] for column in (
+                'status', 'score', 'amount_pokemons', 'trainer_name', 'dataingestiondttm', 'id'))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        columns = ', '.join(f'`{column}`' for column in DAOManager.__RANKING_COLUMNS)
+        query = f'SELECT {columns} FROM `{self.__table}` {where} {DAOManager.__RANKING_ORDER} LIMIT ? OFFSET ?'
+        try:
+            cursor = self.__pool.connection().execute(query, (*values, limit, offset))
+        except db.OperationalError as oe:
+            print('>> System: Error getting the ranking', oe)
+            return
+        yield from cursor
+
+    def show_leaderboard(self, page_size: int = 10, **filters) -> None:
+        """
+        This function prints the ranking page by page, asking to press enter before showing the next
+        page, so only the rows on screen are read from the database.
+        
+        :param page_size: The amount of rows per page, defaults to 10
+        :param filters: The filters of `leaderboard` (status, since, until, trainer_name)
+        """
+        header = '{0:>6s} | {1:20s} | {2:6s} | {3:>8s} | {4:>6s} | {5:19s}'.format(
+            'ID', 'Entrenador', 'Estado', 'Pokemons', 'Puntos', 'Fecha')
+        print('Players ordered by score DESC [from Ranking]:', header, '-' * len(header), sep='\n')
+        position, last_row = 0, None
+        while True:
+            page = 0
+            for row in self.leaderboard(page_size, after=last_row, **filters):
+                last_row = row
+                page += 1
+                print('{0:6d} | {1:20.20s} | {2:6s} | {3:8d} | {4:6d} | {5:19s}'.format(*row))
+            position += page
+            if page < page_size or input(f'>> {position} jugadores. Enter para ver mas, q para salir: ').strip().lower() == 'q':
+                break
+
+    def trainer_stats(self, trainer_name: str) -> dict | None:
+        """
+        This function computes the stats of a trainer in the database: games played, wins, win rate,
+        best and average score, the current streak of wins or loses and the percentile of its best
+        score among every trainer.
+        
+        :param trainer_name: The name of the trainer
+        :return: a dictionary with the stats, or None if the trainer hasn't played any game.
+        """
+        self.__pool.run_once(f'{self.__table}_indexes', self.__create_indexes)
+        try:
+            cursor = self.__pool.connection().execute(
+                self.__statements.statement('trainer_stats'), {'trainer_name': trainer_name})
+        except db.OperationalError as oe:
+            print('>> System: Error getting the trainer stats', oe)
+            return None
+        row = cursor.fetchone()
+        if not row:
+            return None
+        return dict(zip([field[0] for field in cursor.description], row))
+
+    def show_trainer_stats(self, trainer_name: str) -> None:
+        """
+        This function prints the profile of a trainer with the stats of `trainer_stats`.
+        
+        :param trainer_name: The name of the trainer
+        """
+        stats = self.trainer_stats(trainer_name)
+        if not stats:
+            print(f'>> System: {trainer_name} no tiene partidas registradas')
+            return
+        message =\
+        """
+        Entrenador: {trainer_name}
+        Partidas: {games}        Victorias: {wins} ({0:.2f}%)
+        Mejor puntaje: {best_score}        Puntaje promedio: {avg_score:.2f}
+        Racha actual: {streak} ({streak_status})        Percentil: {percentile:.2f}
+        """.format(100 * stats['win_rate'], **stats)
+        print(message)
+
+    def close(self) -> None:
+        """
+        This function releases the connection to the database of the calling thread. The pool is shared
+        by every DAO Manager and thread of the process, so their connections stay open, and all of them
+        are closed at exit.
+        """
+        self.__pool.release()
+
+    def select_table(self, type: str = 'table') -> 'DataFrame':
         """
         This function prints the result of selecting data from a database table as a pandas DataFrame.
         """
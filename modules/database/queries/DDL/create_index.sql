@@ -0,0 +1,25 @@
+/** GNU General Public License V3
+*
+* Copyright (C) <2022>  <Facundo Falcone>
+*
+* This program is free software: you can redistribute it and/or modify
+* it under the terms of the GNU General Public License as published by
+* the Free Software Foundation, either version 3 of the License, or
+* (at your option) any later version.
+*
+* This program is distributed in the hope that it will be useful,
+* but WITHOUT ANY WARRANTY without even the implied warranty of
+* MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+* GNU General Public License for more details.
+*
+* You should have received a copy of the GNU General Public License
+* along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*/
+
+CREATE INDEX IF NOT EXISTS `T_NAME_ranking_idx` ON `T_NAME`(
+    `status`,
+    `score`,
+    `amount_pokemons`,
+    `trainer_name`,
+    `dataingestiondttm`
+)
\ No newline at end of file
@@ -17,4 +17,4 @@
 */
 
 INSERT INTO `T_NAME`(`trainer_name`, `status`, `amount_pokemons`, `score`)
-VALUES ("1_1", "1_2", 1_3, 1_4)
\ No newline at end of file
+VALUES (?, ?, ?, ?)
\ No newline at end of file
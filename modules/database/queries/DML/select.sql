@@ -19,10 +19,10 @@
 SELECT
     `id`, `trainer_name`, `status`, `amount_pokemons`, `score`, `dataingestiondttm`
 FROM `T_NAME`
-GROUP BY
-`id`, `trainer_name`, `status`, `amount_pokemons`, `score`, `dataingestiondttm`
 ORDER BY 
 `status` DESC,
 `score` DESC, 
 `amount_pokemons` DESC,
-`trainer_name` DESC
\ No newline at end of file
+`trainer_name` DESC,
+`dataingestiondttm` DESC,
+`id` DESC
\ No newline at end of file
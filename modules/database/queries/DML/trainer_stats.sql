@@ -0,0 +1,66 @@
+/** GNU General Public License V3
+*
+* Copyright (C) <2022>  <Facundo Falcone>
+*
+* This program is free software: you can redistribute it and/or modify
+* it under the terms of the GNU General Public License as published by
+* the Free Software Foundation, either version 3 of the License, or
+* (at your option) any later version.
+*
+* This program is distributed in the hope that it will be useful,
+* but WITHOUT ANY WARRANTY without even the implied warranty of
+* MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+* GNU General Public License for more details.
+*
+* You should have received a copy of the GNU General Public License
+* along with this program.  If not, see <https://www.gnu.org/licenses/>.
+*/
+
+WITH `per_trainer` AS (
+    SELECT
+        `trainer_name`,
+        COUNT(*) AS `games`,
+        SUM(`status` = 'Won') AS `wins`,
+        MAX(`score`) AS `best_score`,
+        AVG(`score`) AS `avg_score`
+    FROM `T_NAME`
+    GROUP BY `trainer_name`
+), `ranked` AS (
+    SELECT
+        *,
+        PERCENT_RANK() OVER (ORDER BY `best_score`) AS `percentile`
+    FROM `per_trainer`
+), `recent` AS (
+    SELECT
+        `status`,
+        FIRST_VALUE(`status`) OVER (ORDER BY `dataingestiondttm` DESC, `id` DESC) AS `last_status`,
+        `dataingestiondttm`,
+        `id`
+    FROM `T_NAME`
+    WHERE `trainer_name` = :trainer_name
+), `runs` AS (
+    SELECT
+        `last_status`,
+        SUM(`status` <> `last_status`) OVER (
+            ORDER BY `dataingestiondttm` DESC, `id` DESC ROWS UNBOUNDED PRECEDING
+        ) AS `changes`
+    FROM `recent`
+), `streak` AS (
+    SELECT `last_status`, COUNT(*) AS `streak`
+    FROM `runs`
+    WHERE `changes` = 0
+    GROUP BY `last_status`
+)
+SELECT
+    `ranked`.`trainer_name`,
+    `ranked`.`games`,
+    `ranked`.`wins`,
+    ROUND(1.0 * `ranked`.`wins` / `ranked`.`games`, 4) AS `win_rate`,
+    `ranked`.`best_score`,
+    ROUND(`ranked`.`avg_score`, 2) AS `avg_score`,
+    `streak`.`last_status` AS `streak_status`,
+    `streak`.`streak`,
+    ROUND(100 * `ranked`.`percentile`, 2) AS `percentile`
+FROM `ranked`
+LEFT JOIN `streak` ON 1 = 1
+WHERE `ranked`.`trainer_name` = :trainer_name
\ No newline at end of file
@@ -16,6 +16,5 @@
 * along with this program.  If not, see <https://www.gnu.org/licenses/>.
 */
 
-DROP VIEW IF EXISTS `T_NAME_vw`;
-CREATE VIEW `T_NAME_vw` AS
+CREATE VIEW IF NOT EXISTS `T_NAME_vw` AS
 SELECT * FROM `T_NAME`
\ No newline at end of file
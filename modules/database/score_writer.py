@@ -0,0 +1,133 @@
+# GNU General Public License V3
+#
+# Copyright (C) <2022>  <Facundo Falcone> - Improvements
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import atexit
+import queue
+import threading
+import time
+
+class ScoreWriter:
+    """
+    Represents a write-behind queue of scores, flushed in batches by a background thread. The writer
+    doesn't prepare the table, it must be prepared once with `DAOManager.prepare_table` before any
+    writer starts, otherwise every writer of a tournament would drop the scores of the others.
+    """
+    __STOP = object()
+
+    def __init__(self, dao_manager, batch_size: int = 1000, flush_interval: float = 1.0, max_pending: int = 10000) -> None:
+        self.__dao = dao_manager
+        self.__batch_size = batch_size
+        self.__flush_interval = flush_interval
+        # bounded, so a slow database makes submit wait instead of growing the memory without limit
+        self.__queue = queue.Queue(max_pending)
+        self.__written = 0
+        self.__failed = 0
+        self.__error: Exception = None
+        self.__closed = False
+        self.__thread = threading.Thread(target=self.__run, name='ScoreWriter', daemon=True)
+        self.__thread.start()
+        atexit.register(self.close)
+
+    @property
+    def written(self) -> int:
+        """
+        It returns the amount of rows already written to the database.
+        :return: An integer.
+        """
+        return self.__written
+
+    @property
+    def failed(self) -> int:
+        """
+        It returns the amount of rows that couldn't be written to the database.
+        :return: An integer.
+        """
+        return self.__failed
+
+    def submit(self, trainer_name: str, status: str, amount_pokemons: int, score: int) -> None:
+        """
+        It queues a score to be written, without waiting for the database.
+        
+        :param trainer_name: The name of the trainer
+        :param status: The final status of the game, 'Won' or 'Lose'
+        :param amount_pokemons: The amount of pokemons of the trainer
+        :param score: The final score of the game
+        """
+        if self.__closed:
+            raise RuntimeError('The score writer is closed')
+        self.__queue.put((trainer_name, status, amount_pokemons, score))
+
+    def submit_result(self, result: dict) -> None:
+        """
+        It queues the score of a simulated game, as returned by `simulate_game`.
+        
+        :param result: The result of the game
+        """
+        self.submit(result['trainer_name'], result['status'], result['amount_pokemons'], result['score'])
+
+    def __run(self) -> None:
+        """
+        It takes the queued scores and writes them with a single transaction every time the batch is
+        full or the flush interval passed, until the writer is closed.
+        """
+        batch = list[tuple]()
+        deadline = time.monotonic() + self.__flush_interval
+        while True:
+            timeout = max(0, deadline - time.monotonic())
+            try:
+                row = self.__queue.get(timeout=timeout)
+            except queue.Empty:
+                row = None
+            if row is ScoreWriter.__STOP:
+                self.__flush(batch)
+                return
+            if row is not None:
+                batch.append(row)
+            if len(batch) >= self.__batch_size or time.monotonic() >= deadline:
+                self.__flush(batch)
+                batch = list[tuple]()
+                deadline = time.monotonic() + self.__flush_interval
+
+    def __flush(self, batch: list[tuple]) -> None:
+        """
+        It writes a batch of scores to the database. An error is printed and kept to be raised by
+        `close`, and the thread keeps draining the queue, so `submit` never waits on a dead thread.
+        
+        :param batch: The rows to write
+        """
+        if not batch:
+            return
+        try:
+            self.__written += self.__dao.insert_many(batch)
+        except Exception as e:
+            print('>> System: Error adding the data', e)
+            self.__failed += len(batch)
+            self.__error = self.__error or e
+
+    def close(self) -> None:
+        """
+        It writes the scores left in the queue and stops the background thread. It is also run at exit.
+        It raises a RuntimeError, chained to the first error, when any batch couldn't be written.
+        """
+        if self.__closed:
+            return
+        self.__closed = True
+        self.__queue.put(ScoreWriter.__STOP)
+        self.__thread.join()
+        atexit.unregister(self.close)
+        if self.__error:
+            raise RuntimeError(f'{self.__failed} scores could not be written') from self.__error
@@ -0,0 +1,105 @@
+# GNU General Public License V3
+#
+# Copyright (C) <2022>  <Facundo Falcone> - Improvements
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import sqlite3 as db
+import threading
+
+class StatementRegistry:
+    "Represents the SQL statements of the game, loaded, resolved and validated once per process"
+    __registries: dict = dict()
+    __registries_lock = threading.Lock()
+
+    def __init__(self, table: str, paths: dict[str, str]) -> None:
+        self.__table = table
+        self.__statements: dict[str, tuple[str]] = dict()
+        for name, path in paths.items():
+            self.__statements[name] = self.__load(name, path)
+
+    @staticmethod
+    def get(table: str, ddl_paths: dict, dml_paths: dict) -> 'StatementRegistry':
+        """
+        It returns the registry of the table, loading every statement the first time it is asked for.
+        
+        :param table: The name of the table that replaces 'T_NAME' in the statements
+        :param ddl_paths: The paths of the DDL statements by name
+        :param dml_paths: The paths of the DML statements by name
+        :return: The StatementRegistry of the table.
+        """
+        paths = {**ddl_paths, **dml_paths}
+        key = (table, tuple(sorted(paths.items())))
+        with StatementRegistry.__registries_lock:
+            registry = StatementRegistry.__registries.get(key)
+            if not registry:
+                registry = StatementRegistry.__registries[key] = StatementRegistry(table, paths)
+            return registry
+
+    def __load(self, name: str, path: str) -> tuple[str]:
+        """
+        It reads a query file, replaces 'T_NAME' with the table name, splits it into statements and
+        checks that every statement is complete.
+        
+        :param name: The name of the statement
+        :param path: The path to the query file
+        :return: A tuple with the statements of the file.
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as query_file:
+                query = query_file.read().replace('T_NAME', self.__table)
+        except OSError as oe:
+            raise FileNotFoundError(f"The query file of '{name}' can't be read: {path}") from oe
+        statements = tuple(
+            statement.strip() for statement in query.split(';')
+            if statement.strip() and not self.__only_comments(statement))
+        for statement in statements:
+            if not db.complete_statement(f'{statement};'):
+                raise ValueError(f"The query '{name}' has an incomplete statement: {path}")
+        if not statements:
+            raise ValueError(f"The query '{name}' is empty: {path}")
+        return statements
+
+    @staticmethod
+    def __only_comments(statement: str) -> bool:
+        """
+        It checks if a piece of SQL only contains comments.
+        
+        :param statement: The piece of SQL
+        :return: True if there isn't any SQL outside the comments.
+        """
+        text = statement
+        while '/*' in text:
+            start = text.index('/*')
+            end = text.find('*/', start)
+            text = text[:start] + (text[end + 2:] if end >= 0 else '')
+        return not '\n'.join(line.split('--')[0] for line in text.splitlines()).strip()
+
+    def statement(self, name: str) -> str:
+        """
+        It returns the single statement of the given name.
+        
+        :param name: The name of the statement, as in the configs
+        :return: The SQL of the statement.
+        """
+        return self.__statements[name][0]
+
+    def statements(self, name: str) -> tuple[str]:
+        """
+        It returns every statement of the given name, for query files with more than one statement.
+        
+        :param name: The name of the statement, as in the configs
+        :return: A tuple with the SQL of the statements.
+        """
+        return self.__statements[name]
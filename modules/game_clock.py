@@ -0,0 +1,173 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import math
+import time
+
+class RealClock:
+    """
+    The RealClock class paces the game in real time, every delay of the game goes through a clock
+    """
+
+    def delay(self, seconds: float) -> float:
+        """
+        This method converts a delay of the game into the real seconds to wait.
+        
+        :param seconds: The seconds of the delay in game time
+        :return: the real seconds to wait.
+        """
+        return seconds
+
+    def sleep(self, seconds: float) -> None:
+        """
+        This method waits the given seconds.
+        
+        :param seconds: The seconds to wait
+        """
+        seconds = self.delay(seconds)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def now(self) -> float:
+        """
+        This method returns the current time of the clock.
+        :return: the seconds of a monotonic clock.
+        """
+        return time.monotonic()
+
+class ScaledClock(RealClock):
+    """
+    The ScaledClock class paces the game faster (or slower) than real time
+    """
+
+    def __init__(self, speed: float = 4.0) -> None:
+        """
+        The constructor of the clock.
+        
+        :param speed: How many times faster than real time the delays pass, defaults to 4.0
+        """
+        if not (math.isfinite(speed) and speed > 0):
+            raise ValueError(f'The speed of the clock must be a finite number greater than 0, not {speed}')
+        self.__speed = speed
+
+    @property
+    def speed(self) -> float:
+        """
+        It returns how many times faster than real time the delays pass.
+        :return: The speed of the clock.
+        """
+        return self.__speed
+
+    def delay(self, seconds: float) -> float:
+        """
+        This method converts a delay of the game into the real seconds to wait.
+        
+        :param seconds: The seconds of the delay in game time
+        :return: the seconds divided by the speed of the clock.
+        """
+        return seconds / self.__speed
+
+class InstantClock(RealClock):
+    """
+    The InstantClock class doesn't wait at all, used by the headless games and the bots
+    """
+
+    def delay(self, seconds: float) -> float:
+        """
+        This method skips the delays.
+        
+        :param seconds: The seconds of the delay in game time
+        :return: always 0.
+        """
+        return 0.0
+
+class VirtualClock:
+    """
+    The VirtualClock class doesn't wait, it moves its own time forward and keeps every delay, so a
+    test can check the pacing of a game without waiting for it
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        """
+        The constructor of the clock.
+        
+        :param start: The initial time of the clock, defaults to 0.0
+        """
+        self.__now: float = start
+        self.__sleeps: list[float] = list()
+
+    @property
+    def sleeps(self) -> list[float]:
+        """
+        It returns every delay asked to the clock, in order.
+        :return: A list with the seconds of each delay.
+        """
+        return self.__sleeps
+
+    def delay(self, seconds: float) -> float:
+        """
+        This method moves the time of the clock forward, there is nothing to wait.
+        
+        :param seconds: The seconds of the delay in game time
+        :return: always 0.
+        """
+        self.__sleeps.append(seconds)
+        self.__now += seconds
+        return 0.0
+
+    def sleep(self, seconds: float) -> None:
+        """
+        This method moves the time of the clock forward.
+        
+        :param seconds: The seconds to move forward
+        """
+        self.delay(seconds)
+
+    def now(self) -> float:
+        """
+        This method returns the current time of the clock.
+        :return: the seconds since the start of the clock.
+        """
+        return self.__now
+
+def make_clock(mode: str = 'real') -> RealClock | VirtualClock:
+    """
+    This function builds the clock of a game session from its mode.
+    
+    :param mode: 'real', 'instant', 'virtual' or a speed like '4' or 'x4' for a scaled clock, defaults
+    to 'real'
+    :return: the clock of the session.
+    """
+    mode = str(mode).strip().lower()
+    match mode:
+        case 'real':
+            return RealClock()
+        case 'instant':
+            return InstantClock()
+        case 'virtual':
+            return VirtualClock()
+        case _:
+            try:
+                speed = float(mode.removeprefix('x'))
+            except ValueError:
+                raise ValueError(f'Unknown clock mode: {mode}') from None
+            return ScaledClock(speed)
@@ -0,0 +1,114 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import random
+
+# The size of the first block of draws after seeding
+_FIRST_BLOCK = 64
+
+class GameRandom(random.Random):
+    """
+    The GameRandom class is the seeded random generator of a game session. Besides every method of
+    `random.Random` it draws coin flips and uniform rolls from blocks generated ahead of time, so a turn
+    doesn't build lists like `[True, False]` nor pays for `randint` on every decision
+    """
+
+    def __init__(self, seed: int = None, block: int = 1024) -> None:
+        """
+        The constructor of the generator.
+        
+        :param seed: The seed of the generator, defaults to None (seeded from the operating system)
+        :param block: The largest amount of coin flips and of rolls generated at once, defaults to 1024
+        """
+        self._block = block
+        super().__init__(seed)
+
+    def seed(self, a=None, version: int = 2) -> None:
+        """
+        This method seeds the generator and drops the blocks generated with the previous seed.
+        
+        :param a: The seed
+        :param version: The version of the seeding algorithm, defaults to 2
+        """
+        super().seed(a, version)
+        self._coins = list[bool]()
+        self._uniforms = list[float]()
+        self._coin_block = min(_FIRST_BLOCK, self._block)
+        self._uniform_block = min(_FIRST_BLOCK, self._block)
+
+    def coin(self) -> bool:
+        """
+        This method flips a coin.
+        :return: True or False with the same chance.
+        """
+        if not self._coins:
+            block = self._coin_block
+            self._coins = [bit == '1' for bit in format(self.getrandbits(block), f'0{block}b')]
+            self._coin_block = min(2 * block, self._block)
+        return self._coins.pop()
+
+    def uniform_roll(self) -> float:
+        """
+        This method returns the next roll of the block of uniform rolls.
+        :return: a float between 0 (inclusive) and 1 (exclusive).
+        """
+        if not self._uniforms:
+            random_float = self.random
+            self._uniforms = [random_float() for _ in range(self._uniform_block)]
+            self._uniform_block = min(2 * self._uniform_block, self._block)
+        return self._uniforms.pop()
+
+    def chance(self, probability: float) -> bool:
+        """
+        This method rolls against a probability, like the 25% of a critical hit.
+        
+        :param probability: The chance of returning True, between 0 and 1
+        :return: True with the given probability.
+        """
+        return self.uniform_roll() < probability
+
+    def roll(self, low: int, high: int) -> int:
+        """
+        This method rolls an integer, like the damage of an attack or the hp of a pokemon.
+        
+        :param low: The lowest value (inclusive)
+        :param high: The highest value (inclusive)
+        :return: an integer between low and high.
+        """
+        return low + int(self.uniform_roll() * (high - low + 1))
+
+    def pick(self, items: list | tuple):
+        """
+        This method picks an item of a sequence, like the attack of a pokemon.
+        
+        :param items: A non empty sequence
+        :return: one of the items, all of them with the same chance.
+        """
+        return items[int(self.uniform_roll() * len(items))]
+
+    def spawn(self) -> 'GameRandom':
+        """
+        This method creates an independent generator seeded from this one, used to give every game of
+        a tournament or of a pool of threads its own stream.
+        :return: the new GameRandom.
+        """
+        return GameRandom(self.getrandbits(128), self._block)
@@ -0,0 +1,173 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import datetime
+import os
+from modules.database.db_manager import DAOManager
+from modules.game_clock import RealClock, VirtualClock
+from modules.game_session import GameSession
+from modules.poke_system import PokeSystem
+from modules.renderer import TerminalRenderer
+
+# Sent after every turn: an OSC sequence that terminals ignore, so the bots of the load generator count
+# the turns without reading the screen, the renderer doesn't send again the rows that didn't change
+TURN_MARKER: bytes = b'\033]7777;turn\007'
+
+class ConnectionStream:
+    """
+    The ConnectionStream class lets a renderer write to a TCP connection as if it was a terminal, using
+    the line endings of telnet
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter) -> None:
+        """
+        The constructor of the stream.
+        
+        :param writer: The writer of the connection
+        """
+        self.__writer = writer
+
+    def write(self, text: str) -> None:
+        """
+        This method sends a text to the player, it is buffered until the connection is drained.
+        
+        :param text: The text to send
+        """
+        if not self.__writer.is_closing():
+            self.__writer.write(text.replace('\n', '\r\n').encode('utf-8'))
+
+    def flush(self) -> None:
+        """
+        It does nothing, the session drains the connection between turns.
+        """
+
+    def isatty(self) -> bool:
+        """
+        The players connect with a terminal (telnet, nc), so the renderer paints the frames with escapes.
+        :return: always True.
+        """
+        return True
+
+class GameServer:
+    """
+    The GameServer class hosts many console battles over TCP in a single process, one GameSession per
+    connection, all of them sharing the parsed pokemons and the DAO Manager
+    """
+
+    def __init__(self, file_path: str, log_path: str, clock: RealClock | VirtualClock = None, replay_dir: str = None) -> None:
+        """
+        The constructor of the server.
+        
+        :param file_path: The path of the pokemons JSON file
+        :param log_path: The path of the log file where the errors will be written
+        :param clock: The clock that paces every session, defaults to a real time clock
+        :param replay_dir: The directory where the replay of every session is recorded, defaults to None
+        (no replays)
+        """
+        self.__file_path = file_path
+        self.__log_path = log_path
+        self.__clock = clock
+        self.__replay_dir = replay_dir
+        if replay_dir:
+            os.makedirs(replay_dir, exist_ok=True)
+        self.__records = PokeSystem.parse_species(PokeSystem.load_file(file_path))
+        self.__dao_manager = DAOManager()
+        self.__sessions: int = 0
+
+    @property
+    def sessions(self) -> int:
+        """
+        It returns the amount of sessions played since the server started.
+        :return: The amount of sessions.
+        """
+        return self.__sessions
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        This coroutine plays a session with the player of a connection and closes it when the game ends
+        or the player leaves.
+        
+        :param reader: The reader of the connection
+        :param writer: The writer of the connection
+        """
+        async def read_line(prompt: str = '') -> str:
+            if prompt:
+                writer.write(prompt.encode('utf-8'))
+            await writer.drain()
+            line = await reader.readline()
+            if not line:
+                raise ConnectionResetError('The player left the game')
+            return line.decode('utf-8', errors='ignore')
+
+        async def end_turn() -> None:
+            writer.write(TURN_MARKER)
+            await writer.drain()
+
+        self.__sessions += 1
+        replay_path = None
+        if self.__replay_dir:
+            replay_path = os.path.join(self.__replay_dir, f'{datetime.datetime.now():%Y%m%d-%H%M%S}-{self.__sessions:06d}.rpl')
+        session = GameSession(
+            self.__file_path, self.__log_path, read_line, TerminalRenderer(ConnectionStream(writer)),
+            self.__clock, self.__records, self.__dao_manager, drain=end_turn, replay_path=replay_path)
+        try:
+            await session.play()
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def serve(self, host: str = '127.0.0.1', port: int = 4000) -> None:
+        """
+        This coroutine accepts connections until it is cancelled.
+        
+        :param host: The address to listen on, defaults to '127.0.0.1'
+        :param port: The port to listen on, defaults to 4000
+        """
+        server = await asyncio.start_server(self.handle, host, port)
+        async with server:
+            print(f'>> Servidor Pokemon escuchando en {host}:{port} (telnet {host} {port})')
+            await server.serve_forever()
+
+def run_server(file_path: str, log_path: str, host: str = '127.0.0.1', port: int = 4000,
+               clock: RealClock | VirtualClock = None, replay_dir: str = None) -> None:
+    """
+    This function runs the game server until it is interrupted with Ctrl+C.
+    
+    :param file_path: The path of the pokemons JSON file
+    :param log_path: The path of the log file where the errors will be written
+    :param host: The address to listen on, defaults to '127.0.0.1'
+    :param port: The port to listen on, defaults to 4000
+    :param clock: The clock that paces every session, defaults to a real time clock
+    :param replay_dir: The directory where the replay of every session is recorded, defaults to None
+    """
+    server = GameServer(file_path, log_path, clock, replay_dir)
+    try:
+        asyncio.run(server.serve(host, port))
+    except KeyboardInterrupt:
+        print(f'>> Servidor detenido, {server.sessions} partidas jugadas')
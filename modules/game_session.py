@@ -0,0 +1,268 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+from modules.database.db_manager import DAOManager
+from modules.game_clock import RealClock, VirtualClock
+from modules.poke_system import PokeSystem
+from modules.pokemon import Pokemon
+from modules.renderer import NullRenderer, TerminalRenderer, get_renderer
+from modules.replay_log import ReplayWriter
+from modules.species import Species
+from modules.session_context import SessionContext
+from modules.trainer import Trainer
+from modules.common_variables import (
+    _B_WHITE, _F_RED, _I_START, _NO_COLOR,
+    poke_message, validate_input
+)
+
+class AsyncClock:
+    """
+    The AsyncClock class lets a coroutine session reuse the synchronous game rules: the delays asked by
+    the rules are added up instead of blocking, and the session awaits them with `settle`, so the event
+    loop keeps serving the other sessions in the meantime
+    """
+
+    def __init__(self, clock: RealClock | VirtualClock = None) -> None:
+        """
+        The constructor of the clock.
+        
+        :param clock: The clock that converts the game delays into real seconds, defaults to a real
+        time clock
+        """
+        self.__clock = clock or RealClock()
+        self.__pending: float = 0.0
+
+    @property
+    def clock(self) -> RealClock | VirtualClock:
+        """
+        It returns the clock that converts the game delays into real seconds.
+        :return: The wrapped clock.
+        """
+        return self.__clock
+
+    def delay(self, seconds: float) -> float:
+        """
+        This method adds a delay of the game to the pending delays.
+        
+        :param seconds: The seconds of the delay in game time
+        :return: the real seconds added.
+        """
+        seconds = self.__clock.delay(seconds)
+        self.__pending += seconds
+        return seconds
+
+    def sleep(self, seconds: float) -> None:
+        """
+        This method adds a delay of the game to the pending delays, without blocking.
+        
+        :param seconds: The seconds of the delay in game time
+        """
+        self.delay(seconds)
+
+    def now(self) -> float:
+        """
+        This method returns the current time of the wrapped clock.
+        :return: the seconds of the wrapped clock.
+        """
+        return self.__clock.now()
+
+    async def settle(self) -> None:
+        """
+        This coroutine waits the pending delays. With nothing to wait it still gives the control back
+        to the event loop, so a session with an instant clock doesn't starve the other sessions.
+        """
+        pending, self.__pending = self.__pending, 0.0
+        await asyncio.sleep(pending)
+
+async def console_input(prompt: str = '') -> str:
+    """
+    This coroutine reads a line of the standard input in a worker thread, so the event loop is not
+    blocked while the player types.
+    
+    :param prompt: The text shown before reading, defaults to ''
+    :return: the line typed by the player.
+    """
+    return await asyncio.to_thread(input, prompt)
+
+class GameSession:
+    """
+    The GameSession class plays a full game as a coroutine: the input, the delays between turns and
+    the database are awaited, so a single event loop can play many sessions at the same time
+    """
+
+    def __init__(self, file_path: str, log_path: str, read_line=console_input,
+                 renderer: TerminalRenderer | NullRenderer = None, clock: RealClock | VirtualClock = None,
+                 records: list[dict] | list[Species] = None, dao_manager: DAOManager = None, audio=None,
+                 drain=None, seed: int = None, replay_path: str = None, lazy: bool = False) -> None:
+        """
+        The constructor of the session.
+        
+        :param file_path: The path of the pokemons JSON file
+        :param log_path: The path of the log file where the errors will be written
+        :param read_line: A coroutine function that receives a prompt and returns the line typed by the
+        player, defaults to `console_input`
+        :param renderer: The renderer used to show the game, defaults to the shared renderer of the
+        standard output
+        :param clock: The clock that paces the session, defaults to a real time clock
+        :param records: The pokemons already loaded by `PokeSystem.load_file` or parsed by
+        `PokeSystem.parse_species`, shared by the sessions to avoid reading the file for each one
+        :param dao_manager: The DAO Manager used to store the score, defaults to a new one
+        :param audio: The AudioManager that plays the themes, defaults to None (no sound)
+        :param drain: A coroutine function awaited after every turn, so a slow connection can catch up
+        with the output, defaults to None
+        :param seed: The seed of the random generator of the game, the same seed and the same answers
+        play the same game, defaults to None
+        :param replay_path: The path of the file where the replay of the game is recorded, defaults to
+        None (no replay)
+        :param lazy: When True and no records are shared the pokedex file is streamed and every wild
+        Pokemon is built when it is drawn, as `PokeSystem.init_pokemons` does, defaults to False
+        """
+        self.__file_path = file_path
+        self.__log_path = log_path
+        self.__read_line = read_line
+        self.__renderer = renderer or get_renderer()
+        self.__clock = AsyncClock(clock)
+        self.__records = records
+        self.__dao_manager = dao_manager or DAOManager()
+        self.__audio = audio
+        self.__drain = drain
+        self.__seed = seed
+        self.__replay_path = replay_path
+        self.__lazy = lazy
+        self.__turns: int = 0
+
+    @property
+    def renderer(self) -> TerminalRenderer | NullRenderer:
+        """
+        It returns the renderer used to show the game.
+        :return: The renderer of the session.
+        """
+        return self.__renderer
+
+    @property
+    def clock(self) -> AsyncClock:
+        """
+        It returns the clock that paces the session.
+        :return: The AsyncClock of the session.
+        """
+        return self.__clock
+
+    @property
+    def turns(self) -> int:
+        """
+        It returns the amount of turns played by the session.
+        :return: The amount of turns.
+        """
+        return self.__turns
+
+    async def ask_trainer_name(self) -> str:
+        """
+        This coroutine asks the name of the trainer and capitalizes it.
+        :return: the name of the trainer, or 'Ash Ketchum' if it is not valid.
+        """
+        poke_message('Hola entrenador/a, por favor dime tu nombre: ', 'info', self.__renderer)
+        self.__renderer.flush()
+        trainer_name = validate_input('^[a-zA-Z0-9 _]+$', (await self.__read_line('')).strip(), 'Ash Ketchum')
+        return ' '.join([word.capitalize() for word in trainer_name.split(' ')])
+
+    async def play_turn(self, sys_manager: PokeSystem, pkm_trainer: Trainer, enemy_pokemon: Pokemon) -> tuple[Pokemon, bool]:
+        """
+        This coroutine plays a single turn with the rules of `PokeSystem.play_turn` (attack turn, game
+        turn, battle message and buff reset) in a new frame, and then awaits the delays of the turn.
+        
+        :param sys_manager: The system of the session
+        :param pkm_trainer: The trainer of the session
+        :param enemy_pokemon: The wild Pokemon that the trainer is currently battling against
+        :return: a tuple with the enemy pokemon for the next turn and a boolean indicating whether the
+        trainer can keep fighting.
+        """
+        self.__renderer.new_frame()
+        enemy_pokemon, still_can_fight = sys_manager.play_turn(pkm_trainer, enemy_pokemon)
+        self.__turns += 1
+        self.__renderer.flush()
+        if self.__drain:
+            await self.__drain()
+        await self.__clock.settle()
+        return enemy_pokemon, still_can_fight
+
+    async def play(self) -> dict:
+        """
+        This coroutine plays a full game: it asks the name of the trainer, plays every turn and stores
+        the score in the database.
+        :return: a dictionary with the trainer name, the final status, the score, the amount of pokemons
+        and the amount of turns played, or None if the game failed.
+        """
+        context = SessionContext(self.__log_path, self.__seed, renderer=self.__renderer, clock=self.__clock)
+        replay = None
+        sys_manager = None
+        try:
+            if self.__audio:
+                self.__audio.start().play('intro_theme')
+            trainer_name = await self.ask_trainer_name()
+            poke_message(f'Gracias {trainer_name}, te asignare 3 pokémones aleatorios para que puedas luchar.\nPresiona enter y empezemos!', 'success', self.__renderer)
+            self.__renderer.flush()
+            await self.__read_line('')
+            if self.__audio:
+                self.__audio.crossfade('battle_theme')
+
+            if self.__replay_path:
+                replay = context.replay = ReplayWriter(self.__replay_path, context.seed, trainer_name)
+            sys_manager = PokeSystem(self.__file_path, self.__log_path, context=context)
+            sys_manager.init_pokemons(self.__records, lazy=self.__lazy)
+            pkm_trainer = context.new_trainer(trainer_name)
+            await asyncio.to_thread(self.__dao_manager.create_table)
+            sys_manager.assign_init_pokemons(pkm_trainer)
+            sys_manager.player_score = sys_manager.calculate_score(pkm_trainer)
+
+            pkm_trainer.speak(f'{_B_WHITE}{_F_RED}', f'Hora del duelo Pokemon!', f'{_I_START}{_NO_COLOR}')
+            pkm_trainer.next_pokemon()
+            enemy_pokemon = sys_manager.next_pokemon()
+            still_can_fight = True
+            self.__clock.sleep(2)
+            await self.__clock.settle()
+            while still_can_fight and sys_manager.pokemons:
+                enemy_pokemon, still_can_fight = await self.play_turn(sys_manager, pkm_trainer, enemy_pokemon)
+            pkm_trainer.check_status()
+            sys_manager.player_score = sys_manager.calculate_score(pkm_trainer)
+            sys_manager.show_score()
+            self.__renderer.end_frame()
+            await asyncio.to_thread(self.__dao_manager.insert_table, pkm_trainer, sys_manager)
+            if self.__audio:
+                self.__audio.stop()
+            return {
+                'trainer_name': pkm_trainer.name,
+                'status': pkm_trainer.status,
+                'score': sys_manager.player_score,
+                'amount_pokemons': len(pkm_trainer.defeated_pokemons) + len(pkm_trainer.pokemons),
+                'turns': self.__turns
+            }
+        except Exception as e:
+            context.log(f'{e.args}')
+            self.__renderer.write(f'Error al ejecutar la partida\nDetails: {e}')
+            self.__renderer.flush()
+            return None
+        finally:
+            if sys_manager:
+                sys_manager.close()
+            if replay:
+                replay.close()
@@ -0,0 +1,132 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import time
+from modules.game_server import TURN_MARKER
+
+_TAIL: int = len(TURN_MARKER) - 1
+
+def _percentile(values: list[float], percent: float) -> float:
+    """
+    This function returns the value at the given percentile of a sorted list (nearest rank).
+    
+    :param values: A sorted list of values
+    :param percent: The percentile to find, between 0 and 100
+    :return: the value at the given percentile, or 0 if the list is empty.
+    """
+    if not values:
+        return 0.0
+    rank = max(1, round(len(values) * percent / 100 + 0.5 - 1e-9))
+    return values[min(rank, len(values)) - 1]
+
+async def bot_session(host: str, port: int, trainer_name: str = 'Bot') -> list[float]:
+    """
+    This coroutine plays a session against the game server as a bot: it sends the name and the enter,
+    reads the battle until the server closes the connection and measures the time between turns, counted
+    by the `TURN_MARKER` that the server sends after every turn.
+    
+    :param host: The address of the server
+    :param port: The port of the server
+    :param trainer_name: The name of the bot, defaults to 'Bot'
+    :return: a list with the milliseconds between consecutive turns.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f'{trainer_name}\n\n'.encode('utf-8'))
+    await writer.drain()
+    latencies, last, tail = list[float](), None, b''
+    try:
+        while chunk := await reader.read(65536):
+            now = time.perf_counter()
+            window = tail + chunk
+            turns = window.count(TURN_MARKER)
+            tail = window[-_TAIL:]
+            if turns:
+                # the turns that arrive together share the time since the last turn, the first turn
+                # only starts the clock
+                if last is not None:
+                    latencies.extend([1e3 * (now - last) / turns] * turns)
+                else:
+                    latencies.extend([0.0] * (turns - 1))
+                last = now
+    finally:
+        writer.close()
+    return latencies
+
+async def run_load(host: str, port: int, sessions: int, concurrency: int = None) -> dict:
+    """
+    This coroutine opens many bot sessions against the game server, at most `concurrency` at a time.
+    
+    :param host: The address of the server
+    :param port: The port of the server
+    :param sessions: The amount of sessions to play
+    :param concurrency: The maximum amount of open sessions, defaults to every session at once
+    :return: a dictionary with the amount of sessions, failed sessions, frames, elapsed seconds,
+    sessions per second and the percentiles of the milliseconds between frames.
+    """
+    limit = asyncio.Semaphore(concurrency or sessions)
+    failed = 0
+
+    async def limited(number: int) -> list[float]:
+        nonlocal failed
+        async with limit:
+            try:
+                return await bot_session(host, port, f'Bot {number}')
+            except OSError:
+                failed += 1
+                return list()
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(limited(number) for number in range(sessions)))
+    elapsed = time.perf_counter() - start
+    latencies = sorted(latency for result in results for latency in result)
+    return {
+        'sessions': sessions,
+        'failed': failed,
+        'frames': len(latencies),
+        'seconds': elapsed,
+        'sessions_per_second': (sessions - failed) / elapsed if elapsed else 0,
+        'p50': _percentile(latencies, 50),
+        'p90': _percentile(latencies, 90),
+        'p99': _percentile(latencies, 99),
+        'max': latencies[-1] if latencies else 0.0
+    }
+
+def show_load(host: str, port: int, sessions: int, concurrency: int = None) -> None:
+    """
+    This function runs the load generator and prints its summary.
+    
+    :param host: The address of the server
+    :param port: The port of the server
+    :param sessions: The amount of sessions to play
+    :param concurrency: The maximum amount of open sessions, defaults to every session at once
+    """
+    result = asyncio.run(run_load(host, port, sessions, concurrency))
+    message =\
+    """
+    Sesiones: {0} ({1} fallidas)
+    Turnos medidos: {2}
+    Latencia entre turnos (ms): p50 {3:.2f} | p90 {4:.2f} | p99 {5:.2f} | max {6:.2f}
+    Sesiones por segundo: {7:.2f}
+    """.format(result['sessions'], result['failed'], result['frames'], result['p50'], result['p90'],
+               result['p99'], result['max'], result['sessions_per_second'])
+    print(message)
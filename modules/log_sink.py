@@ -0,0 +1,285 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import atexit
+import datetime
+import gzip
+import os
+import shutil
+import threading
+import time
+from collections import deque
+from typing import NamedTuple
+
+class LogRecord(NamedTuple):
+    """
+    A message of the game log, with the session and the turn where it happened
+    """
+    created: float
+    level: str
+    session: int
+    turn: int
+    message: str
+
+    def format(self, stamp: str = None) -> str:
+        """
+        This method returns the line of the record in the log file.
+        
+        :param stamp: The date and time of the second the record was created, as written by
+        `time.strftime`, defaults to None (formatted here)
+        :return: the line, ended with a newline.
+        """
+        stamp = stamp or time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.created))
+        return f'{stamp}.{int(self.created % 1 * 1e6):06d} - {self.level} - session {self.session} - turn {self.turn} - {self.message}\n'
+
+def format_records(records: list[LogRecord]) -> str:
+    """
+    This function returns the lines of many records, formatting the date and time only once per second.
+    
+    :param records: The records to format
+    :return: the lines of the records.
+    """
+    lines = list[str]()
+    second, stamp = None, None
+    for record in records:
+        if int(record.created) != second:
+            second = int(record.created)
+            stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+        lines.append(record.format(stamp))
+    return ''.join(lines)
+
+class LogSink:
+    """
+    The LogSink class writes the game log from a background thread: the games only append their records
+    to a ring buffer, and the flusher writes them in batches to a file that stays open, rotating it by
+    size and by age and compressing the rotated files with gzip. When the buffer is full the oldest
+    records are dropped, and the amount dropped is written to the log
+    """
+
+    def __init__(self, path: str, capacity: int = 32768, flush_interval: float = 0.5,
+                 max_bytes: int = 5 * 1024 * 1024, max_age: float = 24 * 60 * 60, backups: int = 5) -> None:
+        """
+        The constructor of the sink, it starts the flusher thread.
+        
+        :param path: The path of the log file
+        :param capacity: The amount of records kept in memory until they are written, defaults to 32768
+        :param flush_interval: The seconds the flusher waits between writes, defaults to 0.5
+        :param max_bytes: The size from which the log file is rotated, defaults to 5 MB
+        :param max_age: The seconds from which the log file is rotated, defaults to one day
+        :param backups: The amount of compressed log files kept, defaults to 5
+        """
+        self.__path = path
+        self.__buffer = deque[LogRecord](maxlen=capacity)
+        # Under load the flusher doesn't wait for its interval, it writes as soon as there is a batch
+        self.__batch = max(1, capacity // 8)
+        self.__flush_interval = flush_interval
+        self.__max_bytes = max_bytes
+        self.__max_age = max_age
+        self.__backups = backups
+        self.__dropped: int = 0
+        self.__unreported: int = 0
+        self.__pending: int = 0
+        self.__closed = False
+        self.__wake = False
+        self.__file = None
+        self.__compressor: threading.Thread | None = None
+        self.__opened_at: float = 0.0
+        self.__condition = threading.Condition(threading.Lock())
+        self.__thread = threading.Thread(target=self.__run, name=f'log-sink:{path}', daemon=True)
+        self.__thread.start()
+
+    @property
+    def path(self) -> str:
+        """
+        It returns the path of the log file.
+        :return: The path of the sink.
+        """
+        return self.__path
+
+    @property
+    def dropped(self) -> int:
+        """
+        It returns the amount of records dropped because the buffer was full.
+        :return: The amount of records.
+        """
+        return self.__dropped
+
+    def emit(self, record: LogRecord) -> None:
+        """
+        This method queues a record to be written, it never touches the file. When a batch of records
+        is waiting the flusher is woken up before its interval.
+        
+        :param record: The record to write
+        """
+        with self.__condition:
+            if len(self.__buffer) == self.__buffer.maxlen:
+                self.__dropped += 1
+                self.__unreported += 1
+            else:
+                self.__pending += 1
+            self.__buffer.append(record)
+            if len(self.__buffer) == self.__batch:
+                self.__condition.notify()
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        This method waits until every record queued is written.
+        
+        :param timeout: The maximum seconds to wait, defaults to None (no limit)
+        :return: True if the records were written before the timeout.
+        """
+        with self.__condition:
+            self.__wake = True
+            self.__condition.notify()
+            return self.__condition.wait_for(lambda: not self.__pending or not self.__thread.is_alive(), timeout)
+
+    def close(self) -> None:
+        """
+        This method writes the records queued, stops the flusher, closes the log file and waits for the
+        last rotated file to be compressed.
+        """
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify()
+        self.__thread.join()
+        if self.__compressor:
+            self.__compressor.join()
+
+    def __run(self) -> None:
+        """
+        This method is the loop of the flusher thread: it takes every record of the buffer at once and
+        writes them with a single call.
+        """
+        closed = False
+        while not closed:
+            with self.__condition:
+                self.__condition.wait_for(
+                    lambda: self.__wake or self.__closed or len(self.__buffer) >= self.__batch, self.__flush_interval)
+                self.__wake = False
+                records = list(self.__buffer)
+                self.__buffer.clear()
+                dropped, self.__unreported = self.__unreported, 0
+                closed = self.__closed
+            try:
+                if records or dropped:
+                    self.__write(records, dropped)
+            except OSError:
+                pass # The game must go on even if its log can't be written
+            finally:
+                with self.__condition:
+                    self.__pending -= len(records)
+                    self.__condition.notify_all()
+        if self.__file:
+            self.__file.close()
+            self.__file = None
+
+    def __write(self, records: list[LogRecord], dropped: int) -> None:
+        """
+        This method writes a batch of records, rotating the log file first if it is due.
+        
+        :param records: The records to write
+        :param dropped: The amount of records dropped since the last batch
+        """
+        if self.__file and (self.__file.tell() >= self.__max_bytes or time.time() - self.__opened_at >= self.__max_age):
+            self.__rotate()
+        if not self.__file:
+            self.__file = open(self.__path, 'a', encoding='utf-8', newline='\n')
+            self.__opened_at = time.time()
+        if dropped:
+            self.__file.write(LogRecord(time.time(), 'WARNING', 0, 0, f'{dropped} records dropped, the log buffer was full').format())
+        self.__file.write(format_records(records))
+        self.__file.flush()
+
+    def __rotate(self) -> None:
+        """
+        This method closes the log file and renames it with the date in its name. The renamed file is
+        compressed by another thread, so the flusher keeps writing meanwhile.
+        """
+        self.__file.close()
+        self.__file = None
+        rotated = f'{self.__path}.{datetime.datetime.now():%Y%m%d-%H%M%S-%f}'
+        os.replace(self.__path, rotated)
+        if self.__compressor:
+            self.__compressor.join()
+        self.__compressor = threading.Thread(target=self.__compress, args=(rotated,), name=f'log-compress:{rotated}')
+        self.__compressor.start()
+
+    def __compress(self, rotated: str) -> None:
+        """
+        This method compresses a rotated log file with gzip and removes the oldest compressed files
+        beyond the amount of backups.
+        
+        :param rotated: The path of the rotated log file
+        """
+        try:
+            with open(rotated, 'rb') as source, gzip.open(f'{rotated}.gz', 'wb', compresslevel=6) as target:
+                shutil.copyfileobj(source, target)
+            os.remove(rotated)
+            folder, name = os.path.split(os.path.abspath(self.__path))
+            backups = sorted(file for file in os.listdir(folder) if file.startswith(f'{name}.') and file.endswith('.gz'))
+            for file in backups[:-self.__backups] if self.__backups else backups:
+                os.remove(os.path.join(folder, file))
+        except OSError:
+            pass # The rotated file is kept uncompressed
+
+# One sink per log file, shared by every game of the process
+__sinks: dict[str, LogSink] = {}
+__sinks_lock = threading.Lock()
+
+def __forget_sinks() -> None:
+    """
+    The function drops the sinks inherited by a forked process, their flusher threads don't run in it.
+    """
+    global __sinks_lock
+    __sinks.clear()
+    __sinks_lock = threading.Lock()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=__forget_sinks)
+
+def get_log_sink(path: str) -> LogSink:
+    """
+    This function returns the sink of a log file, starting it the first time. The sinks are closed when
+    the interpreter exits, so no record is lost.
+    
+    :param path: The path of the log file
+    :return: the LogSink of the file.
+    """
+    key = os.path.abspath(path)
+    with __sinks_lock:
+        sink = __sinks.get(key)
+        if not sink:
+            sink = __sinks[key] = LogSink(path)
+            atexit.register(sink.close)
+        return sink
+
+def flush_log_sinks(timeout: float = None) -> bool:
+    """
+    This function waits until every sink of the process wrote its records. The processes that end
+    without running the exit handlers, like the workers of a Pool, call it when their work is done.
+    
+    :param timeout: The maximum seconds to wait for every sink, defaults to None (no limit)
+    :return: True if every record was written before the timeout.
+    """
+    with __sinks_lock:
+        sinks = list(__sinks.values())
+    return all([sink.flush(timeout) for sink in sinks])
@@ -20,14 +20,19 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import datetime
-import json
-import os
-import random
-import time
-
+from array import array
+from modules.game_clock import RealClock, VirtualClock
+from modules.game_random import GameRandom
+from modules.pokedex_cache import load_pokedex
+from modules.pokedex_stream import PokedexIndex
 from modules.pokemon import Pokemon
+from modules.renderer import NullRenderer, TerminalRenderer
+from modules.replay_log import NO_POKEBALL, POKEBALL_CAUGHT, POKEBALL_MISSED
+from modules.session_context import SessionContext
+from modules.species import Species
 from modules.trainer import Trainer
+from modules.type_chart import TypeChart
+from modules.wild_pool import WildPool
 
 from modules.common_variables import (
     _B_GREEN, _B_BLUE, _B_RED, 
@@ -35,12 +40,9 @@ from modules.common_variables import (
 )
 
 class PokeSystem:
-    _log_path: str = ''
-    _filename: str = ''
-    _wild_pokemones: list[Pokemon] = None
-    _player_score: int = 0
 
-    def __init__(self, file_path: str, log_path: str):
+    def __init__(self, file_path: str, log_path: str, headless: bool = False, renderer: TerminalRenderer | NullRenderer = None,
+                 clock: RealClock | VirtualClock = None, context: SessionContext = None):
         """
         This is the initialization function for a class that takes in a file path, log path, and creates
         an empty list for wild Pokemon.
@@ -49,28 +51,79 @@ class PokeSystem:
         :param log_path: The `log_path` parameter is a string that represents the file path where the
         log file will be saved. This log file will contain information about the program's execution and
         any errors that may occur
+        :param headless: When True the system runs the game rules without showing anything on the
+        console and without waiting between turns, it is the same as using a NullRenderer, defaults to False
+        :param renderer: The renderer used to show the battle, defaults to the shared renderer of the
+        standard output
+        :param clock: The clock that paces the turns, defaults to a real time clock, or an instant clock
+        when the system is headless
+        :param context: The SessionContext of the game, with the random generator, the wild pool, the
+        renderer, the clock and the log sink. When it is given the previous parameters but the file path
+        are taken from it, defaults to a new context
         """
         self._filename = file_path
-        self._log_path = log_path
-        self._wild_pokemones = list[Pokemon]()
+        self._context = context or SessionContext(log_path, renderer=renderer, clock=clock, headless=headless)
+        self._player_score = 0
+        self._type_chart = TypeChart()
+        self.__index: PokedexIndex = None
 
     @property
     def log_path(self) -> str:
         """
         This function returns the log path as a string.
-        :return: The method `log_path` is returning a string which is the value of the private attribute
-        `_log_path`.
+        :return: The method `log_path` is returning a string which is the log path of the session
+        context.
+        """
+        return self._context.log_path
+
+    @property
+    def headless(self) -> bool:
+        """
+        This function returns whether the system runs without console output and delays.
+        :return: a boolean value.
+        """
+        return self._context.headless
+
+    @property
+    def renderer(self) -> TerminalRenderer | NullRenderer:
+        """
+        This function returns the renderer used to show the battle.
+        :return: The renderer of the system.
+        """
+        return self._context.renderer
+
+    @property
+    def clock(self) -> RealClock | VirtualClock:
+        """
+        This function returns the clock that paces the turns.
+        :return: The clock of the system.
+        """
+        return self._context.clock
+
+    @property
+    def context(self) -> SessionContext:
+        """
+        This function returns the context of the game.
+        :return: The SessionContext of the system.
         """
-        return self._log_path
+        return self._context
 
     @property
-    def pokemons(self) -> list[Pokemon]:
+    def type_chart(self) -> TypeChart:
         """
-        This function returns a list of wild Pokemon.
-        :return: A list of Pokemon objects is being returned. The method `pokemons` returns the private
-        attribute `_wild_pokemones` of the class, which is a list of Pokemon objects.
+        This function returns the type chart built from the loaded pokemons.
+        :return: The TypeChart of the system.
         """
-        return self._wild_pokemones
+        return self._type_chart
+
+    @property
+    def pokemons(self) -> WildPool:
+        """
+        This function returns the pool of wild Pokemon.
+        :return: The WildPool with the Pokemon objects left to fight. The method `pokemons` returns the
+        wild pool of the session context.
+        """
+        return self._context.wild_pool
     
     @property
     def player_score(self) -> int:
@@ -86,23 +139,23 @@ class PokeSystem:
         This function sets the log path for a class instance.
         
         :param path: The "path" parameter is a string that represents the file path where the log file
-        will be stored. The method "log_path" sets the value of the instance variable "_log_path" to the
-        value of the "path" parameter
+        will be stored. The method "log_path" sets the log path of the session context to the value of
+        the "path" parameter
         :type path: str
         """
-        self._log_path = path
+        self._context.log_path = path
 
     @pokemons.setter
     def pokemons(self, pokemons: list[Pokemon]) -> None:
         """
-        This function sets the list of wild pokemons for a given object.
+        This function sets the pool of wild pokemons for a given object.
         
-        :param pokemons: The "pokemons" parameter is a list of objects of the class "Pokemon". This
-        method is a part of a class and it takes a list of Pokemon objects as input. The method then
-        creates a copy of this list and assigns it to the instance variable "_wild_pokemones"
+        :param pokemons: The "pokemons" parameter is a list of objects of the class "Pokemon". The
+        method builds a WildPool with them, weighted by the spawn weight of their species, that draws
+        with the random generator of the session context
         :type pokemons: list[Pokemon]
         """
-        self._wild_pokemones = pokemons.copy()
+        self._context.new_pool(pokemons, [pokemon.species.spawn_weight for pokemon in pokemons])
     
     @player_score.setter
     def player_score(self, score: int) -> None:
@@ -142,9 +195,11 @@ class PokeSystem:
         score = self.player_score
         if not score:
             score = 10 * len(pkm_trainer.pokemons)
-        elif pkm_trainer.pokemon_in_battle or pkm_trainer.pokemons:
+        elif pkm_trainer.pokemon_in_battle:
             score += pkm_trainer.pokemon_in_battle.effectivity
         elif pkm_trainer.pokemons:
+            # the pokemon in battle fainted on the last turn of a won game and the next one didn't come
+            # out yet, the score is kept
             pass
         else:
             score -= (2 * len(pkm_trainer.defeated_pokemons))
@@ -159,107 +214,130 @@ class PokeSystem:
         :param path: The path parameter is a string that represents the file path of the JSON file that
         contains information about pokemons
         :return: a list of dictionaries containing information about pokemons. The information is being
-        loaded from a JSON file located at the specified path.
+        loaded from the compiled cache of the JSON file located at the specified path.
         """
-        with open(path, 'r', encoding='utf-8') as archivo:
-            return list[dict](json.load(archivo)['pokemons'])
+        return list[dict](load_pokedex(path)['pokemons'])
     
     @staticmethod
-    def write_file(path: str, mode: str, message: str) -> bool:
+    def parse_species(pokemons: list[dict], type_chart: TypeChart = None) -> list[Species]:
         """
-        This function writes a message to a file specified by its path and mode and returns a boolean
-        indicating whether the operation was successful or not.
+        The function takes a list of dictionaries representing Pokemon and returns a list of Species
+        objects with the immutable data of every pokemon, to be shared by the Pokemon objects. The
+        species are bound to a type chart here, once, so games that share them (even from several
+        threads) never bind them again.
         
-        :param path: The path parameter is a string that represents the file path where the message will
-        be written
-        param mode: The mode parameter in the write_file function specifies the mode in which the file
-        is opened. It can be 'w' for write mode, 'a' for append mode, 'x' for exclusive creation mode,
-        'r' for read mode, and more. The mode parameter determines how the file
-        :param message: The message parameter is a string that contains the text that will be written to
-        the file
-        :return: a boolean value indicating whether the file write operation was successful or not.
-        """
-        success = False
-        with open(path, mode, encoding='utf-8', newline='\n') as archivo:
-            archivo.write(f'{message}')
-            success = True
-        return success
+        :param pokemons: A list of dictionaries representing Pokemon objects. Each dictionary contains
+        the following keys: 'id', 'poder', 'nombre', 'icon', 'icon_element', 'tipo', 'evoluciones',
+        'debilidad', 'fortaleza', and 'ataques'
+        :param type_chart: The TypeChart to bind the species to, defaults to a new one
+        :return: a list of Species objects.
+        """
+        type_chart = type_chart or TypeChart()
+        species = [Species.from_record(pokemon) for pokemon in pokemons]
+        for kind in species:
+            type_chart.bind(kind)
+        return species
 
     @staticmethod
-    def parse_objects(pokemons: list[dict]) -> list[Pokemon]:
+    def parse_objects(pokemons: list[dict] | list[Species], rng: GameRandom = None) -> list[Pokemon]:
         """
-        The function takes a list of dictionaries representing Pokemon and returns a list of Pokemon
-        objects with the data from the dictionaries.
+        The function takes a list of dictionaries (or already parsed species) representing Pokemon and
+        returns a list of Pokemon objects with the data from the dictionaries.
         
-        :param pokemons: A list of dictionaries representing Pokemon objects. Each dictionary contains
-        the following keys: 'id', 'poder', 'nombre', 'icon', 'icon_element', 'tipo', 'evoluciones',
-        'debilidad', 'fortaleza', and 'ataques'
+        :param pokemons: A list of dictionaries representing Pokemon objects, as described in
+        `parse_species`, or a list of Species
+        :param rng: The random generator of the game session used by the pokemons, defaults to a new
+        generator shared by the returned pokemons
         :return: a list of Pokemon objects.
         """
+        rng = rng or GameRandom()
         lista_pokemones_o = list[Pokemon]()
-        for pokemon in pokemons:
-            actual_poke = Pokemon(
-                pokemon['id'], pokemon['poder'], str(pokemon['nombre']).capitalize(),
-                pokemon['icon'], pokemon['icon_element'], pokemon['tipo'],
-                pokemon['evoluciones'], pokemon['debilidad'],
-                pokemon['fortaleza'], pokemon['ataques']
-            )
-            lista_pokemones_o.insert(0, actual_poke)
+        for pokemon in reversed(pokemons):
+            species = pokemon if isinstance(pokemon, Species) else Species.from_record(pokemon)
+            lista_pokemones_o.append(Pokemon(species, rng))
         return lista_pokemones_o
 
-    def init_pokemons(self):
+    def init_pokemons(self, records: list[dict] | list[Species] = None, lazy: bool = False):
         """
         This function initializes a list of pokemons by parsing objects from a file and logs any errors
         encountered.
+        
+        :param records: An optional list of already loaded pokemon dictionaries or parsed species, used
+        to avoid reading and parsing the file again when many games are played in a row
+        :param lazy: When True the file is streamed into a `PokedexIndex` and every Pokemon is built
+        when it is drawn from the pool, used for very large pokedex files, the index is closed with
+        `close` or when the pool is exhausted, defaults to False
         """
         try:
-            self.pokemons = PokeSystem.parse_objects(
-                PokeSystem.load_file(
-                    self._filename
-                )
-            )
-            random.shuffle(self.pokemons)
-            print(f'Sistema: {len(self.pokemons)} Pokemones salvajes encontrados!')
+            self.close()
+            if lazy and records is None:
+                index = self.__index = PokedexIndex(self._filename)
+                last = len(index) - 1
+                # the pool keeps the order of `parse_objects` and the hp are rolled up front like the
+                # eager path does, so the same seed plays the same game in both paths
+                hps = array('H', (Pokemon.roll_hp(self._context.rng) for _ in range(len(index))))
+                self._context.new_pool(
+                    range(last, -1, -1), index.spawn_weights[::-1],
+                    factory=lambda position: self.__build_pokemon(index.record(position), hps[last - position]))
+                self.renderer.write(f'Sistema: {len(self.pokemons)} Pokemones salvajes encontrados!')
+                return
+            if records is None:
+                records = PokeSystem.load_file(self._filename)
+            self.pokemons = PokeSystem.parse_objects(records, self._context.rng)
+            for pokemon in self.pokemons:
+                if pokemon.species.effect_row is None: # the species shared by many games are already bound
+                    self.type_chart.bind(pokemon.species)
+            self.renderer.write(f'Sistema: {len(self.pokemons)} Pokemones salvajes encontrados!')
         except Exception as e:
-            message = f'{datetime.datetime.now()} - {e.args}'
-            PokeSystem.write_file(self.log_path, 'a+', message)
-            print(
-                'Error al inicializar pokemones',
-                f'Exception: {e.args}',
-                sep='\n')
+            self._context.log(f'{e.args}')
+            self.renderer.write(f'Error al inicializar pokemones\nException: {e.args}')
 
-    def next_pokemon(self) -> Pokemon | bool:
+    def __build_pokemon(self, record: dict, hp: int) -> Pokemon:
+        """
+        This function builds a Pokemon from a record of the pokedex and binds its species to the type
+        chart, used by the lazy wild pool.
+        
+        :param record: A dictionary of the pokedex
+        :param hp: The hp rolled for the Pokemon when the pool was built
+        :return: the new Pokemon.
+        """
+        species = Species.from_record(record)
+        self.type_chart.bind(species)
+        return Pokemon(species, self._context.rng, hp)
+
+    def close(self) -> None:
         """
-        This function returns the first element of a list of Pokemon objects or False if the list is
-        empty, and logs any errors that occur.
-        :return: either the first Pokemon object in the list of pokemons or False if the list is empty.
-        If an error occurs, it returns None.
+        This function releases the memory map of the pokedex read by a lazy wild pool, it does nothing
+        when the pool was loaded eagerly.
         """
+        if self.__index is not None:
+            self.__index.close()
+            self.__index = None
+
+    def next_pokemon(self) -> Pokemon | bool:
         """
-        It returns the first pokemon in the list of pokemones, or False if the list is empty
-        :return: The first element of the list.
+        This function draws the next wild Pokemon from the pool, weighted by its spawn weight, and logs
+        any errors that occur.
+        :return: the drawn Pokemon object. If the pool is empty or an error occurs, it returns None.
         """
         try:
             if self.pokemons:
-                return self.pokemons.pop(0)
+                pokemon = self.pokemons.draw()
+                if not self.pokemons: # the last record was read, the pokedex is no longer needed
+                    self.close()
+                return pokemon
             raise IndexError
         except Exception as e:
-            message = f'{datetime.datetime.now()} - {e.args}'
-            PokeSystem.write_file(self.log_path, 'a+', message)
-            print(
-                'Error Al cargar pokemones',
-                f'Exception: {e.args}',
-                sep='\n')
+            self._context.log(f'{e.args}')
+            self.renderer.write(f'Error Al cargar pokemones\nException: {e.args}')
             return None
     
     def attack_turn(self):
         """
         The function randomly chooses whether it is the player's or the opponent's turn to attack.
-        :return: a randomly chosen boolean value from the list `turnos`, which contains the values
-        `True` and `False`.
+        :return: a coin flip of the generator of the session, True for the player's turn.
         """
-        turns = [True, False]
-        return random.choice(turns)
+        return self._context.rng.coin()
 
     def system_message(self, pkm_trainer: Trainer, turno: bool, poke_a: Pokemon, poke_b: Pokemon) -> Pokemon | None:
         """
@@ -276,43 +354,43 @@ class PokeSystem:
         """
         try:
             if poke_a and poke_b:
+                if self.headless:
+                    if not poke_a.has_hp():
+                        pkm_trainer.return_to_pokeball(poke_a)
+                        poke_a = None
+                    return poke_a
                 if turno:
                     attack_message = f'>>⬆️  {_B_GREEN}{_F_BLACK}{poke_a.name} uso {poke_a.current_attack} contra {poke_b.name} enemigo y causo {poke_a.dmg_current_attack} daño{_NO_COLOR} {poke_a.efectivity_message}'
                     #poke_b.restar_vida(int(poke_a.dmg_ataque_actual*1.5))
                 else:
                     attack_message = f'>>⬇️  {_B_RED}{_F_WHITE}{poke_b.name} enemigo uso {poke_b.current_attack} contra {poke_a.name} y causo {poke_b.dmg_current_attack} daño{_NO_COLOR} {poke_b.efectivity_message}'
                     #poke_a.restar_vida(int(poke_b.dmg_ataque_actual*0.5))
-                consola =\
-                """
-                Pokemon Actual: {7} {8} {9}             Puntaje: {10}
-                Restantes: {5:02d}                           Por Vencer: {11}
-                Pokemones: {6}
-                {0}
-                    Tu Pokemon: {1:10s}                 Enemigo:{2:10s}
-                    HP: {3:06.2f}                              HP: {4:06.2f}
-                """.format(attack_message, poke_a.name, poke_b.name, poke_a.hp, poke_b.hp, len(pkm_trainer.pokemons),
-                ' | '.join([x.name for x in pkm_trainer.pokemons]), poke_a.name, poke_a.icon, poke_a.icon_el, self.player_score, len(self.pokemons))
-                print(consola)
+                # One row per line, the renderer only repaints the rows that changed since the last turn
+                margin = ' ' * 16
+                self.renderer.write('')
+                self.renderer.write(f'{margin}Pokemon Actual: {poke_a.name} {poke_a.icon} {poke_a.icon_el}             Puntaje: {self.player_score}')
+                self.renderer.write(f'{margin}Restantes: {len(pkm_trainer.pokemons):02d}                           Por Vencer: {len(self.pokemons)}')
+                self.renderer.write(f'{margin}Pokemones: {" | ".join([x.name for x in pkm_trainer.pokemons])}')
+                self.renderer.write(f'{margin}{attack_message}')
+                self.renderer.write(f'{margin}    Tu Pokemon: {poke_a.name:10s}                 Enemigo:{poke_b.name:10s}')
+                self.renderer.write(f'{margin}    HP: {poke_a.hp:06.2f}                              HP: {poke_b.hp:06.2f}')
+                self.renderer.write(margin)
 
                 if not poke_a.has_hp():
-                    poke_a.check_faint()
+                    poke_a.check_faint(self.renderer)
                     pkm_trainer.return_to_pokeball(poke_a)
                     poke_a = None
 
-                poke_b.check_faint()
-                time.sleep(1)
+                poke_b.check_faint(self.renderer)
+                self.renderer.flush()
+                self.clock.sleep(1)
                 return poke_a
         except Exception as e:
-            message = f'{datetime.datetime.now()} - {e.args}'
-            PokeSystem.write_file(PokeSystem.log_path, 'a+', message)
-            print(
-                'Error Al mostrar mensaje de batalla',
-                f'Exception: {e.args}',
-                sep='\n')
+            self._context.log(f'{e.args}')
+            self.renderer.write(f'Error Al mostrar mensaje de batalla\nException: {e.args}')
         
 
-    @staticmethod
-    def manage_game_turn(turno: bool, pkm_trainer: Trainer, poke_enemy: Pokemon):
+    def manage_game_turn(self, turno: bool, pkm_trainer: Trainer, poke_enemy: Pokemon):
         """
         This function manages the turns of a game between a player's Pokemon and an enemy Pokemon.
         
@@ -326,7 +404,7 @@ class PokeSystem:
             match turno:
                 case True:
                     if pkm_trainer.pokemon_in_battle and pkm_trainer.pokemon_in_battle.has_hp():
-                        pokebola_lanzada = random.choice([True, False]) # veo si lanzo la pokebola o no
+                        pokebola_lanzada = self._context.rng.coin() # veo si lanzo la pokebola o no
                         pkm_trainer.pokeball_threw = pokebola_lanzada # Actualizo si lanze la pokebola o no
                         pkm_trainer.pokemon_in_battle.continue_battle(poke_enemy) # Ataco
                     elif not pkm_trainer.pokemon_in_battle:
@@ -337,32 +415,53 @@ class PokeSystem:
                     if pkm_trainer.pokemon_in_battle and pkm_trainer.pokemon_in_battle.has_hp() and poke_enemy.has_hp():
                         poke_enemy.continue_battle(pkm_trainer.pokemon_in_battle) # Me ataca
         except Exception as e:
-            message = f'{datetime.datetime.now()} - {e.args}'
-            PokeSystem.write_file(PokeSystem.log_path, 'a+', message)
-            print(
-                'Error Al Gestionar turnos de jugador o enemigo',
-                f'Exception: {e.args}',
-                sep='\n')
+            self._context.log(f'{e.args}')
+            self.renderer.write(f'Error Al Gestionar turnos de jugador o enemigo\nException: {e.args}')
             return None
     
+    def play_turn(self, pkm_trainer: Trainer, enemy_pokemon: Pokemon) -> tuple[Pokemon, bool]:
+        """
+        This function plays a single turn of the battle: it brings the next wild pokemon if needed,
+        resolves the attacks, updates the score and lets the trainer try to catch the enemy. When the game
+        is recorded the turn is appended to the replay of the session context.
+        
+        :param pkm_trainer: Trainer object representing the player's trainer
+        :param enemy_pokemon: The wild Pokemon that the player is currently battling against
+        :return: a tuple with the enemy pokemon for the next turn and a boolean indicating whether the
+        trainer can keep fighting.
+        """
+        self._context.turn += 1
+        if not enemy_pokemon or not enemy_pokemon.has_hp():
+            enemy_pokemon = self.next_pokemon()
+        is_player_turn = self.attack_turn()
+        self.manage_game_turn(is_player_turn, pkm_trainer, enemy_pokemon)
+        self.player_score = self.calculate_score(pkm_trainer)
+        replay = self._context.replay
+        if replay:
+            replay.begin_turn(is_player_turn, pkm_trainer.pokemon_in_battle, enemy_pokemon)
+        pkm_trainer.pokemon_in_battle = self.system_message(pkm_trainer, is_player_turn, pkm_trainer.pokemon_in_battle, enemy_pokemon)
+        PokeSystem.reset_buff([pkm_trainer.pokemon_in_battle, enemy_pokemon])
+        still_can_fight = pkm_trainer.check_win_or_lose()
+        pokeball = NO_POKEBALL
+        if still_can_fight:
+            team = len(pkm_trainer.pokemons)
+            pkm_trainer.catch_if_pokeball(enemy_pokemon)
+            if replay and pkm_trainer.pokeball_threw:
+                pokeball = POKEBALL_CAUGHT if len(pkm_trainer.pokemons) > team else POKEBALL_MISSED
+        if replay:
+            replay.end_turn(pokeball, self.player_score, len(pkm_trainer.pokemons), len(self.pokemons))
+        return enemy_pokemon, still_can_fight
+
     def assign_init_pokemons(self, pkm_trainer: Trainer) -> None:
         """
-        This function assigns three random pokemons from a list to a trainer's list of pokemons.
+        This function assigns three random pokemons from the wild pool to a trainer's list of pokemons.
         
         :param pkm_trainer: The parameter `pkm_trainer` is of type `Trainer`, which is presumably a
         class representing a Pokemon trainer
         :type pkm_trainer: Trainer
         """
         for _ in range(3):
-            pkm_trainer.pokemons.append(
-                self.pokemons.pop(
-                    self.pokemons.index(
-                        random.choice(
-                            self.pokemons
-                        )
-                    )
-                )
-            )
+            pkm_trainer.pokemons.append(self.pokemons.draw())
     
     @staticmethod
     def reset_buff(pokemons: list[Pokemon]) -> None:
@@ -388,12 +487,4 @@ class PokeSystem:
         """
         {0}{1}Puntaje Final: {2:4d}{3}
         """.format(_B_BLUE, _F_WHITE, self.player_score, _NO_COLOR)
-        print(message)
-    
-    @staticmethod
-    def clear_console() -> None:
-        """
-        This function clears the console screen in Python.
-        """
-        if os.name in ['ce', 'nt', 'dos']: os.system("cls")
-        else: os.system("clear")
+        self.renderer.write(message)
@@ -0,0 +1,109 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import hashlib
+import json
+import marshal
+import os
+import struct
+from modules.atomic_file import write_atomic
+
+_MAGIC: bytes = b'PDEX'
+# The version 1 stored a pickle, it is never loaded
+_VERSION: int = 2
+# magic, version, mtime of the JSON in nanoseconds, size of the JSON, sha256 of the JSON
+_HEADER = struct.Struct('<4sHqq32s')
+_loaded_dexes: dict[str, tuple[int, int, dict]] = dict()
+
+def cache_path(path: str) -> str:
+    """
+    This function returns the path of the compiled cache of a pokedex JSON file, next to it.
+    
+    :param path: The path of the JSON file
+    :return: the path of the `.dex` file.
+    """
+    return f'{os.path.splitext(path)[0]}.dex'
+
+def __read_cache(path: str, stat: os.stat_result) -> dict | None:
+    """
+    This function reads the compiled cache in a single read and returns its data when it was compiled
+    from the current JSON. When only the mtime changed but the hash is the same the cache is written
+    again with the new header. The data is stored with `marshal`, which only rebuilds the plain
+    dictionaries, lists and values of the JSON and never runs code, unlike `pickle`.
+    
+    :param path: The path of the JSON file
+    :param stat: The stat of the JSON file
+    :return: the data of the JSON, or None if the cache is missing, stale or broken.
+    """
+    try:
+        with open(cache_path(path), 'rb') as file:
+            content = file.read()
+        magic, version, mtime_ns, size, digest = _HEADER.unpack_from(content)
+    except (OSError, struct.error):
+        return None
+    if magic != _MAGIC or version != _VERSION:
+        return None
+    payload = memoryview(content)[_HEADER.size:]
+    if (mtime_ns, size) != (stat.st_mtime_ns, stat.st_size):
+        with open(path, 'rb') as file:
+            if hashlib.sha256(file.read()).digest() != digest:
+                return None
+        __write_cache(path, stat, digest, payload)
+    try:
+        data = marshal.loads(payload)
+    except (EOFError, ValueError, TypeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+def __write_cache(path: str, stat: os.stat_result, digest: bytes, payload: bytes) -> None:
+    """
+    This function writes the cache file with `write_atomic`, so a reader never sees a torn header. A
+    read-only folder just leaves the game without cache.
+    
+    :param path: The path of the JSON file
+    :param stat: The stat of the JSON file
+    :param digest: The sha256 of the JSON file
+    :param payload: The data of the JSON file dumped with `marshal`
+    """
+    write_atomic(cache_path(path), _HEADER.pack(_MAGIC, _VERSION, stat.st_mtime_ns, stat.st_size, digest), payload)
+
+def load_pokedex(path: str) -> dict:
+    """
+    This function loads the whole pokedex JSON (pokemons and sounds) from its compiled cache, compiling
+    it again only when the mtime and the hash of the JSON changed. The result is also kept in memory,
+    so several loads of the same file in one process only read it once.
+    
+    :param path: The path of the JSON file
+    :return: a dictionary with the content of the JSON file, it must be treated as read-only.
+    """
+    stat = os.stat(path)
+    loaded = _loaded_dexes.get(path)
+    if loaded and loaded[:2] == (stat.st_mtime_ns, stat.st_size):
+        return loaded[2]
+    data = __read_cache(path, stat)
+    if data is None:
+        with open(path, 'rb') as file:
+            raw = file.read()
+        data = json.loads(raw.decode('utf-8'))
+        __write_cache(path, stat, hashlib.sha256(raw).digest(), marshal.dumps(data))
+    _loaded_dexes[path] = (stat.st_mtime_ns, stat.st_size, data)
+    return data
@@ -0,0 +1,160 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import codecs
+import json
+import mmap
+import re
+from array import array
+
+_CHUNK_SIZE: int = 1 << 16
+_LIST_START = re.compile(r'"pokemons"\s*:\s*\[')
+_SEPARATORS: str = ' \t\r\n,'
+
+def iter_raw_records(path: str, chunk_size: int = _CHUNK_SIZE):
+    """
+    This function reads the pokedex JSON in chunks and yields every record of its 'pokemons' list as
+    soon as it is complete, together with its position in the file, so the whole document is never in
+    memory at once.
+    
+    :param path: The path of the JSON file
+    :param chunk_size: The amount of bytes read on every step, defaults to 64 KiB
+    :return: a generator of tuples with the byte offset, the byte length and the dictionary of every
+    record.
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    with open(path, 'rb') as file:
+        def read() -> str:
+            chunk = file.read(chunk_size)
+            return utf8.decode(chunk, final=not chunk) if chunk else ''
+        text, byte_pos, eof = '', 0, False
+        match = None
+        while not match:
+            chunk = read()
+            if not chunk:
+                return
+            text += chunk
+            match = _LIST_START.search(text)
+        byte_pos = len(text[:match.end()].encode('utf-8'))
+        text, pos = text[match.end():], 0
+        while True:
+            start = pos
+            while pos < len(text) and text[pos] in _SEPARATORS:
+                pos += 1
+            if pos == len(text):
+                if eof:
+                    return
+                byte_pos += len(text[start:pos].encode('utf-8'))
+                chunk = read()
+                eof = not chunk
+                text, pos = text[pos:] + chunk, 0
+                continue
+            if text[pos] == ']':
+                return
+            try:
+                record, end = decoder.raw_decode(text, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                byte_pos += len(text[start:pos].encode('utf-8'))
+                chunk = read()
+                eof = not chunk
+                text, pos = text[pos:] + chunk, 0
+                continue
+            byte_pos += len(text[start:pos].encode('utf-8'))
+            length = len(text[pos:end].encode('utf-8'))
+            yield byte_pos, length, record
+            byte_pos += length
+            pos = end
+            if pos > chunk_size:
+                text, pos = text[pos:], 0
+
+def iter_pokedex(path: str):
+    """
+    This function yields the records of the 'pokemons' list of the pokedex JSON one by one.
+    
+    :param path: The path of the JSON file
+    :return: a generator of dictionaries.
+    """
+    for _, _, record in iter_raw_records(path):
+        yield record
+
+class PokedexIndex:
+    """
+    The PokedexIndex class scans the pokedex JSON once and only keeps the position and spawn weight of
+    every record in compact arrays, the records are read again from a memory map of the file when they
+    are needed
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        This is the constructor of the index, it streams the file storing the offset, length and spawn
+        weight of every record.
+        
+        :param path: The path of the JSON file
+        """
+        self._path = path
+        self._offsets = array('q')
+        self._lengths = array('l')
+        self._spawn_weights = array('d')
+        for offset, length, record in iter_raw_records(path):
+            self._offsets.append(offset)
+            self._lengths.append(length)
+            self._spawn_weights.append(record.get('spawn', 1))
+        self._map = None
+
+    def __len__(self) -> int:
+        """
+        This function returns the amount of records of the pokedex.
+        :return: an integer.
+        """
+        return len(self._offsets)
+
+    @property
+    def spawn_weights(self) -> array:
+        """
+        This function returns the spawn weight of every record.
+        :return: an array of floats.
+        """
+        return self._spawn_weights
+
+    def record(self, index: int) -> dict:
+        """
+        This function reads and parses a single record from the memory map of the file.
+        
+        :param index: The position of the record in the 'pokemons' list
+        :return: the dictionary of the record.
+        """
+        if self._map is None: # mapped on the first draw, every record is then read without opening the file
+            with open(self._path, 'rb') as file:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        offset = self._offsets[index]
+        return json.loads(self._map[offset:offset + self._lengths[index]])
+
+    def close(self) -> None:
+        """
+        This function releases the memory map of the file, it is mapped again if a record is read.
+        """
+        if self._map is not None:
+            self._map.close()
+            self._map = None
@@ -20,64 +20,54 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import random
 from modules.common_variables import (
     _F_RED, _NO_COLOR
 )
+from modules.game_random import GameRandom
+from modules.species import Species
+from modules.type_chart import NORMAL, WEAK, STRONG
 
 class Pokemon:
     """
-    The Pokemon class is a class that represents a pokemon in the Pokemon game
+    The Pokemon class is a class that represents a pokemon in the Pokemon game, it only holds the
+    battle state and shares the data of its species with every other pokemon of the same species
     """
+    __slots__ = (
+        '_species', '_life', '_current_attack', '_attack_damage',
+        '_msg_efectivity', '_effectivity', '_critical_hit', '_rng'
+    )
     _MIN_HP: int = 50
     _MAX_HP: int = 250
-    _id: int = None
-    _power: int = None
-    _life: float = 0
-    _name: str = None
-    _icon: bytes = None
-    _icon_el: bytes = None
-    _types: list[str] = None
-    _evolutions: list[str] = None
-    _weakness: list[str] = None
-    _strenghts: list[str] = None
-    _attacks: list[str] = None
-    _current_attack: str = ''
-    _attack_damage: int = 0
-    _msg_efectivity: str = ''
-    _effectivity: int = 0
-    _critical_hit: bool = False
-
-    def __init__(self, pkm_id: int, pkm_power: int, pkm_name: str, pkm_icon: bytes, pkm_icon_el: bytes, 
-                pkm_types: list[str], pkm_evolutions: list[str], pkm_weakness: list[str], pkm_strenghts: list[str], 
-                pkm_attacks: list[str]) -> None:
-        """
-        This function is a constructor for the Pokemon class. It takes in the following parameters:
-        pkm_id, pkm_power, pkm_name, pkm_icon, pkm_icon_el, pkm_types, pkm_evolutions, pkm_weakness,
-        pkm_strenghts, pkm_attacks. It returns None
+
+    def __init__(self, species: Species, rng: GameRandom = None, hp: int = None) -> None:
+        """
+        This function is a constructor for the Pokemon class, it takes the species of the pokemon and
+        sets a random hp and an empty battle state.
         
-        :param pkm_id: The ID of the pokemon
-        :param pkm_power: The power of the pokemon
-        :param pkm_name: The name of the pokemon
-        :param pkm_icon: The icon of the pokemon
-        :param pkm_icon_el: The icon of the pokemon, but with the background removed
-        :param pkm_types: list[str]
-        :param pkm_evolutions: list[str]
-        :param pkm_weakness: list[str]
-        :param pkm_strenghts: list[str]
-        :param pkm_attacks: list[str]
-        """
-        self.set_hp()
-        self.id = pkm_id
-        self.power = pkm_power
-        self.name = pkm_name
-        self.icon = pkm_icon
-        self.icon_el = pkm_icon_el
-        self.types = pkm_types
-        self.evolutions = pkm_evolutions
-        self.weakness = pkm_weakness
-        self.strenghts = pkm_strenghts
-        self.attacks = pkm_attacks
+        :param species: The immutable data of the pokemon species
+        :param rng: The random generator of the game session, defaults to a new generator of its own
+        :param hp: The initial hp of the pokemon, already rolled with `roll_hp`, defaults to None (a new
+        random hp)
+        """
+        self._species = species
+        self._rng = rng or GameRandom()
+        self._current_attack = ''
+        self._attack_damage = 0
+        self._msg_efectivity = ''
+        self._effectivity = 0
+        self._critical_hit = False
+        if hp is None:
+            self.set_hp()
+        else:
+            self.hp = hp
+
+    @property
+    def species(self) -> Species:
+        """
+        It returns the species of the pokemon.
+        :return: The Species shared by every pokemon of the same species.
+        """
+        return self._species
 
     @property
     def current_attack(self) -> str:
@@ -104,43 +94,43 @@ class Pokemon:
         return round(self._life, 2)
 
     @property
-    def types(self) -> list[str]:
+    def types(self) -> tuple[str]:
         """
-        returns a list of strings
+        returns a tuple of strings
         """
-        return self._types
+        return self._species.types
 
     @property
-    def evolutions(self) -> list[str]:
+    def evolutions(self) -> tuple[str]:
         """
-        It returns a list of strings.
-        :return: A list of strings.
+        It returns a tuple of strings.
+        :return: A tuple of strings.
         """
-        return self._evolutions
+        return self._species.evolutions
 
     @property
-    def strenghts(self) -> list[str]:
+    def strenghts(self) -> tuple[str]:
         """
-        It returns a list of strings.
-        :return: A list of strings
+        It returns a tuple of strings.
+        :return: A tuple of strings
         """
-        return self._strenghts
+        return self._species.strenghts
 
     @property
-    def weakness(self) -> list[str]:
+    def weakness(self) -> tuple[str]:
         """
-        It returns a list of strings.
-        :return: A list of strings
+        It returns a tuple of strings.
+        :return: A tuple of strings
         """
-        return self._weakness
+        return self._species.weakness
 
     @property
-    def attacks(self) -> list[str]:
+    def attacks(self) -> tuple[str]:
         """
-        It returns a list of strings.
-        :return: A list of strings
+        It returns a tuple of strings.
+        :return: A tuple of strings
         """
-        return self._attacks
+        return self._species.attacks
 
     @property
     def id(self) -> int:
@@ -148,7 +138,7 @@ class Pokemon:
         It returns the id of the object.
         :return: The id of the object.
         """
-        return self._id
+        return self._species.id
 
     @property
     def name(self) -> str:
@@ -156,7 +146,7 @@ class Pokemon:
         It returns the name of the object.
         :return: The name of the person
         """
-        return self._name
+        return self._species.name
 
     @property
     def power(self) -> int:
@@ -164,7 +154,7 @@ class Pokemon:
         It returns the power of the car.
         :return: The power of the car.
         """
-        return self._power
+        return self._species.power
 
     @property
     def icon(self) -> bytes:
@@ -172,7 +162,7 @@ class Pokemon:
         It returns the icon of the object.
         :return: The icon is being returned.
         """
-        return self._icon
+        return self._species.icon
 
     @property
     def icon_el(self) -> bytes:
@@ -183,7 +173,7 @@ class Pokemon:
         <code>bytes</code> object.
         :return: The icon_el is being returned.
         """
-        return self._icon_el
+        return self._species.icon_el
 
     @property
     def efectivity_message(self) -> str:
@@ -238,99 +228,6 @@ class Pokemon:
         """
         self._life = round(pkm_amount_hp, 2)
 
-    @types.setter
-    def types(self, pkm_types: list[str]) -> None:
-        """
-        <code>types</code> is a function that takes a list of strings and returns None
-        
-        :param tipos: list[str]
-        """
-        self._types = pkm_types.copy()
-
-    @evolutions.setter
-    def evolutions(self, pkm_evolutions: list[str]) -> None:
-        """
-        The function takes a list of strings as an argument and assigns it to the _evolutions attribute
-        of the object
-        
-        :param evoluciones: list[str]
-        """
-        self._evolutions = pkm_evolutions.copy()
-
-    @strenghts.setter
-    def strenghts(self, pkm_strenghts: list[str]) -> None:
-        """
-        The function takes a list of strings as an argument and assigns it to the attribute _strenghts
-        
-        :param fortalezas: list[str]
-        """
-        self._strenghts = pkm_strenghts.copy()
-
-    @weakness.setter
-    def weakness(self, pkm_weakness: list[str]) -> None:
-        """
-        It takes a list of strings as an argument and assigns it to the instance variable _weakness
-        
-        :param debilidades: list[str]
-        """
-        self._weakness = pkm_weakness.copy()
-
-    @attacks.setter
-    def attacks(self, pkm_attacks: list[str]) -> None:
-        """
-        It takes a list of strings as an argument and assigns it to the _attacks attribute of the object
-        
-        :param ataques: list[str]
-        """
-        self._attacks = pkm_attacks.copy()
-
-    @id.setter
-    def id(self, pkm_id: int) -> None:
-        """
-        This function takes in an integer and sets the id of the object to that integer
-        
-        :param pkm_: The id of the user
-        """
-        self._id = pkm_id
-
-    @name.setter
-    def name(self, pkm_name: str) -> None:
-        """
-        This function takes a string as an argument and assigns it to the _name attribute of the object
-        
-        :param nombre: str
-        """
-        self._name = pkm_name
-
-    @power.setter
-    def power(self, pkm_power: int) -> None:
-        """
-        This function takes in a parameter called poder, which is an integer, and returns None
-        
-        :param poder: int
-        """
-        self._power = pkm_power
-
-    @icon.setter
-    def icon(self, pkm_icon: bytes) -> None:
-        """
-        It takes a bytes object and sets it as the icon of the window
-        
-        :param icono: The icon to be used
-        """
-        self._icon = pkm_icon
-
-    @icon_el.setter
-    def icon_el(self, pkm_icon_el: bytes) -> None:
-        """
-        The function <code>efectivity_message</code> takes a <code>self</code> parameter and a
-        <code>mensaje</code> parameter, both of which are strings. The function returns
-        <code>None</code>
-        
-        :param icono_el: bytes
-        """
-        self._icon_el = pkm_icon_el
-
     @efectivity_message.setter
     def efectivity_message(self, effct_message: str) -> None:
         """
@@ -366,6 +263,40 @@ class Pokemon:
         """
         self._critical_hit = is_critical
 
+    def clone(self) -> 'Pokemon':
+        """
+        It returns a new pokemon with a copy of the battle state of this one, sharing the same species
+        instead of copying it like `copy.deepcopy` does
+        :return: The cloned pokemon.
+        """
+        pokemon = Pokemon.__new__(Pokemon)
+        pokemon._species = self._species
+        pokemon._rng = self._rng
+        pokemon.restore(self.snapshot())
+        return pokemon
+
+    def snapshot(self) -> tuple:
+        """
+        It returns the battle state of the pokemon as a tuple, to be restored later with `restore`
+        :return: A tuple with the hp, current attack, damage, efectivity message, effectivity and
+        critical hit of the pokemon.
+        """
+        return (
+            self._life, self._current_attack, self._attack_damage,
+            self._msg_efectivity, self._effectivity, self._critical_hit
+        )
+
+    def restore(self, snapshot: tuple) -> None:
+        """
+        It sets the battle state of the pokemon from a tuple returned by `snapshot`
+        
+        :param snapshot: tuple
+        """
+        (
+            self._life, self._current_attack, self._attack_damage,
+            self._msg_efectivity, self._effectivity, self._critical_hit
+        ) = snapshot
+
     def has_hp(self) -> bool:
         """
         It returns a boolean value.
@@ -377,7 +308,18 @@ class Pokemon:
         """
         This function sets the hp of the player to a random number between the minimum and maximum hp
         """
-        self.hp = random.randint(self._MIN_HP, self._MAX_HP)
+        self.hp = Pokemon.roll_hp(self._rng)
+
+    @classmethod
+    def roll_hp(cls, rng: GameRandom) -> int:
+        """
+        This function rolls a random hp between the minimum and maximum hp, the same roll that a new
+        pokemon does.
+        
+        :param rng: The random generator of the game session
+        :return: an integer.
+        """
+        return rng.roll(cls._MIN_HP, cls._MAX_HP)
 
     def substract_hp(self, amount_hp: int) -> None:
         """
@@ -394,17 +336,16 @@ class Pokemon:
     def critical_chance(self) -> bool:
         """
         It returns a boolean value of True or False based on a 25% chance of being True
-        :return: A random choice from the list of chances.
+        :return: True for a critical hit.
         """
-        chances = [False, True, False, False]
-        return random.choice(chances)
+        return self._rng.chance(0.25)
 
     def damage_from_attack(self) -> int:
         """
         It returns a random number between 10 and 20, and adds the value of the power attribute to it
         :return: The damage from the attack.
         """
-        danho = random.randint(10, 20)
+        danho = self._rng.roll(10, 20)
         self.is_critical_damage = self.critical_chance()
         return danho + self.power
 
@@ -415,7 +356,7 @@ class Pokemon:
         
         :param poke: The pokemon that is being attacked
         """
-        ataque = random.choice(self.attacks)
+        ataque = self._rng.pick(self.attacks)
         self.dmg_current_attack = self.calculate_dmg(enemy_pokemon)
         self.current_attack = ataque
         enemy_pokemon.substract_hp(self.dmg_current_attack)
@@ -446,6 +387,26 @@ class Pokemon:
                 return True
         return False
 
+    def effectivity_against(self, enemy_pokemon) -> int:
+        """
+        It returns the effectivity category of this pokemon attacking the enemy pokemon, with a lookup
+        in the type chart when both are bound to it, or scanning their types otherwise
+        
+        :param enemy_pokemon: The enemy pokemon
+        :return: NORMAL, WEAK or STRONG.
+        """
+        effect_row = self._species.effect_row
+        defense_index = enemy_pokemon.species.defense_index
+        if effect_row is not None and defense_index is not None:
+            return effect_row[defense_index]
+        has_weakness = self.has_weakness(enemy_pokemon)
+        has_strenghts = self.has_strenghts(enemy_pokemon)
+        if has_weakness and not has_strenghts:
+            return WEAK
+        if has_strenghts and not has_weakness:
+            return STRONG
+        return NORMAL
+
     def calculate_dmg(self, enemy_pokemon):
         """
         It calculates the damage of an attack, taking into account the type of the attack and the type
@@ -456,7 +417,8 @@ class Pokemon:
         """
         damage = self.damage_from_attack()
         booster = 1
-        if self.has_weakness(enemy_pokemon) and (not self.has_strenghts(enemy_pokemon)):
+        category = self.effectivity_against(enemy_pokemon)
+        if category == WEAK:
             booster = 0.85
             mensaje = f'>> Es poco efectivo! Daño -15%'
             effect_point = -3
@@ -466,7 +428,7 @@ class Pokemon:
                 effect_point = -2
             self.effectivity = effect_point
             self.efectivity_message = mensaje
-        elif self.has_strenghts(enemy_pokemon) and (not self.has_weakness(enemy_pokemon)):
+        elif category == STRONG:
             booster = 1.15
             mensaje = f'>> Es MUY efectivo! Daño +15% '
             effect_point = 3
@@ -481,13 +443,19 @@ class Pokemon:
             self.efectivity_message = '>> Daño Normal!'
         return (damage * booster)
 
-    def check_faint(self) -> None:
+    def check_faint(self, renderer=None) -> None:
         """
         If the character does not have life, it will print a message saying that the character has been
         defeated
+        
+        :param renderer: The renderer used to show the message, defaults to None (print it)
         """
         if not self.has_hp():
-            print(f'>>> {self.name} ha sido vencido!')
+            message = f'>>> {self.name} ha sido vencido!'
+            if renderer:
+                renderer.write(message)
+            else:
+                print(message)
 
     def do_faint(self) -> None:
         """
@@ -516,4 +484,4 @@ class Pokemon:
         """
         The function heal() takes in a parameter self and returns None
         """
-        self.hp = random.randint(self._MIN_HP, self._MAX_HP)
+        self.hp = self._rng.roll(self._MIN_HP, self._MAX_HP)
@@ -0,0 +1,199 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import shutil
+import sys
+
+_CLEAR_SCREEN: str = '\033[2J\033[H'
+_CLEAR_LINE: str = '\033[K'
+
+class TerminalRenderer:
+    """
+    The TerminalRenderer class keeps a frame buffer with the rows shown on the terminal and, when the
+    output is a TTY, repaints only the rows (or the end of the rows) that changed since the last frame
+    using cursor-positioning escapes. On any other output it just writes the lines one after another
+    """
+
+    def __init__(self, stream=None) -> None:
+        """
+        The constructor of the renderer.
+        
+        :param stream: The text stream to write to, defaults to the standard output
+        """
+        self.__stream = stream or sys.stdout
+        self.__tty: bool = bool(getattr(self.__stream, 'isatty', lambda: False)())
+        self.__previous: list[str] = list()
+        self.__rows: list[str] = list()
+        self.__in_frame: bool = False
+        self.__dirty: bool = True
+        self.__moved: bool = False
+
+    @property
+    def tty(self) -> bool:
+        """
+        It returns whether the renderer is painting on a terminal.
+        :return: True if the stream is a TTY.
+        """
+        return self.__tty
+
+    @property
+    def enabled(self) -> bool:
+        """
+        It returns whether the renderer shows anything.
+        :return: always True.
+        """
+        return True
+
+    def new_frame(self) -> None:
+        """
+        This method starts a new frame, the rows written from now on are compared against the rows of
+        the previous frame. The screen is only cleared for the first frame or after it lost track of it.
+        """
+        self.__end_rows()
+        if self.__tty:
+            if self.__dirty:
+                self.__stream.write(_CLEAR_SCREEN)
+                self.__previous = list()
+                self.__moved = True
+                self.__dirty = False
+        elif self.__in_frame:
+            self.__stream.write('\n')
+        self.__rows = list()
+        self.__in_frame = True
+
+    def write(self, text: str = '') -> None:
+        """
+        This method writes a text, one row per line. Inside a frame on a TTY only the rows that are
+        different from the same row of the previous frame are painted, starting at the first changed
+        column when the start of the row is plain text.
+        
+        :param text: The text to write, defaults to an empty line
+        """
+        if not (self.__tty and self.__in_frame):
+            self.__stream.write(f'{text}\n')
+            return
+        for line in text.split('\n'):
+            row = len(self.__rows)
+            self.__rows.append(line)
+            old = self.__previous[row] if row < len(self.__previous) else None
+            if old == line:
+                continue
+            column = 0
+            if old:
+                limit = min(len(old), len(line))
+                while column < limit and old[column] == line[column]:
+                    column += 1
+                if not line[:column].isascii() or '\033' in line[:column]:
+                    column = 0
+            self.__stream.write(f'\033[{row + 1};{column + 1}H{line[column:]}{_CLEAR_LINE}')
+            self.__moved = True
+
+    def flush(self) -> None:
+        """
+        This method clears the rows of the previous frame that were not written in this one, leaves the
+        cursor below the frame when anything was painted and flushes the stream, so a frame without
+        changes writes nothing. It is called before waiting, so the trainer never sees a mix of two frames.
+        """
+        if self.__tty and self.__in_frame:
+            for row in range(len(self.__rows), len(self.__previous)):
+                if self.__previous[row]:
+                    self.__stream.write(f'\033[{row + 1};1H{_CLEAR_LINE}')
+                    self.__moved = True
+            self.__previous[len(self.__rows):] = [''] * (len(self.__previous) - len(self.__rows))
+            if self.__moved:
+                self.__stream.write(f'\033[{len(self.__rows) + 1};1H')
+                self.__moved = False
+            if len(self.__rows) >= shutil.get_terminal_size().lines:
+                self.__dirty = True # the frame scrolled, the rows are not where the buffer thinks
+        self.__stream.flush()
+
+    def __end_rows(self) -> None:
+        """
+        This method closes the current frame, keeping its rows to compare the next frame against them.
+        """
+        if self.__in_frame:
+            self.flush()
+            if self.__tty:
+                self.__previous = self.__rows
+
+    def end_frame(self) -> None:
+        """
+        This method closes the last frame, everything written after it is written below the frame.
+        """
+        self.__end_rows()
+        self.__in_frame = False
+        self.__dirty = True
+
+class NullRenderer:
+    """
+    The NullRenderer class is used by the headless games, it doesn't show anything
+    """
+
+    @property
+    def tty(self) -> bool:
+        """
+        :return: always False.
+        """
+        return False
+
+    @property
+    def enabled(self) -> bool:
+        """
+        It returns whether the renderer shows anything.
+        :return: always False.
+        """
+        return False
+
+    def new_frame(self) -> None:
+        """
+        It does nothing, there is nothing to show.
+        """
+
+    def write(self, text: str = '') -> None:
+        """
+        It does nothing, there is nothing to show.
+        
+        :param text: str
+        """
+
+    def flush(self) -> None:
+        """
+        It does nothing, there is nothing to show.
+        """
+
+    def end_frame(self) -> None:
+        """
+        It does nothing, there is nothing to show.
+        """
+
+_renderer: TerminalRenderer | None = None
+
+def get_renderer() -> TerminalRenderer:
+    """
+    This function returns the renderer of the standard output, shared by the trainer, the system and
+    the game so all of them paint over the same frame buffer.
+    :return: the shared TerminalRenderer.
+    """
+    global _renderer
+    if _renderer is None:
+        _renderer = TerminalRenderer()
+    return _renderer
@@ -0,0 +1,299 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import struct
+from typing import BinaryIO, Iterator, NamedTuple
+from modules.pokemon import Pokemon
+
+_MAGIC = b'PRPL'
+_VERSION = 1
+_SEEDED = 0x1
+_MAX_SEED = 0xFFFFFFFFFFFFFFFF
+_NO_ATTACK = 0xFF
+
+# Header: magic, version, flags, turns between keyframes, seed, trainer name
+_HEADER = struct.Struct('<4sHHHQ32s')
+# Every record has the same width, so the record of any turn is found with a multiplication
+_TURN = struct.Struct('<IBHHBfBbBffhBHxx')
+_KEYFRAME = struct.Struct('<IHfHfhffHBHB')
+_RECORD_SIZE = _TURN.size
+assert _KEYFRAME.size == _RECORD_SIZE
+
+NO_POKEBALL = 0
+POKEBALL_MISSED = 1
+POKEBALL_CAUGHT = 2
+
+class TurnRecord(NamedTuple):
+    """
+    A turn of the battle: who attacked whom, with which attack and what came out of it
+    """
+    turn: int
+    player_turn: bool
+    attacker_id: int
+    defender_id: int
+    attack_index: int
+    damage: float
+    critical: bool
+    effectivity: int
+    pokeball: int
+    attacker_hp: float
+    defender_hp: float
+    score: int
+    team: int
+    wild_left: int
+
+class Keyframe(NamedTuple):
+    """
+    The state of the battle before a turn, with the totals of every turn played until then
+    """
+    turn: int
+    player_id: int
+    player_hp: float
+    enemy_id: int
+    enemy_hp: float
+    score: int
+    damage_dealt: float
+    damage_received: float
+    criticals: int
+    caught: int
+    defeated: int
+    lost: int
+
+    def advance(self, record: TurnRecord) -> 'Keyframe':
+        """
+        This method applies a turn to the state.
+        
+        :param record: The turn played from this state
+        :return: the state after the turn.
+        """
+        player_id, player_hp = (record.attacker_id, record.attacker_hp) if record.player_turn else (record.defender_id, record.defender_hp)
+        enemy_id, enemy_hp = (record.defender_id, record.defender_hp) if record.player_turn else (record.attacker_id, record.attacker_hp)
+        attacked = record.attack_index != _NO_ATTACK
+        return Keyframe(
+            record.turn + 1, player_id, player_hp, enemy_id, enemy_hp, record.score,
+            self.damage_dealt + (record.damage if record.player_turn else 0),
+            self.damage_received + (0 if record.player_turn else record.damage),
+            self.criticals + (1 if attacked and record.critical else 0),
+            self.caught + (1 if record.pokeball == POKEBALL_CAUGHT else 0),
+            self.defeated + (1 if attacked and record.player_turn and enemy_hp <= 0 else 0),
+            self.lost + (1 if attacked and not record.player_turn and player_hp <= 0 else 0))
+
+_START = Keyframe(0, 0, 0.0, 0, 0.0, 0, 0.0, 0.0, 0, 0, 0, 0)
+
+class ReplayWriter:
+    """
+    The ReplayWriter class appends every turn of a game to a compact binary replay: fixed width records
+    packed with `struct`, with a keyframe every few turns so a replay can start at any turn without
+    reading the turns before it
+    """
+
+    def __init__(self, target: str | BinaryIO, seed: int = None, trainer_name: str = '', keyframe_every: int = 32) -> None:
+        """
+        The constructor of the writer, it writes the header of the replay.
+        
+        :param target: The path of the replay file, or a binary stream where the replay is written
+        :param seed: The seed of the game, it lets the engine play the game again when it fits in 64 bits,
+        defaults to None
+        :param trainer_name: The name of the trainer, defaults to ''
+        :param keyframe_every: The amount of turns between keyframes, defaults to 32
+        """
+        self.__owns_stream = isinstance(target, str)
+        self.__stream: BinaryIO = open(target, 'wb') if self.__owns_stream else target
+        self.__keyframe_every = keyframe_every
+        self.__state = _START
+        self.__pending: tuple | None = None
+        # `random.seed` plays the same game with a seed and with its absolute value, a seed that doesn't
+        # fit in the header is not stored, the replay can still be shown but not played again
+        seed = abs(seed) if seed is not None and abs(seed) <= _MAX_SEED else None
+        self.__stream.write(_HEADER.pack(
+            _MAGIC, _VERSION, _SEEDED if seed is not None else 0, keyframe_every,
+            seed or 0, trainer_name.encode('utf-8')[:32]))
+
+    @property
+    def turns(self) -> int:
+        """
+        It returns the amount of turns written.
+        :return: The amount of turns.
+        """
+        return self.__state.turn
+
+    def begin_turn(self, player_turn: bool, player: Pokemon | None, enemy: Pokemon | None) -> None:
+        """
+        This method takes the attack of the turn from the attacker, it must be called before the buffs
+        of the turn are reset.
+        
+        :param player_turn: True if the player attacked, False if the enemy did
+        :param player: The pokemon of the player in battle
+        :param enemy: The wild pokemon in battle
+        """
+        attacker, defender = (player, enemy) if player_turn else (enemy, player)
+        attack_index, damage, critical, effectivity = _NO_ATTACK, 0.0, False, 0
+        if attacker and attacker.dmg_current_attack:
+            attack_index = attacker.attacks.index(attacker.current_attack)
+            damage = attacker.dmg_current_attack
+            critical = attacker.is_critical_damage
+            effectivity = attacker.effectivity
+        self.__pending = (
+            player_turn, attacker.id if attacker else 0, defender.id if defender else 0,
+            attack_index, damage, critical, effectivity,
+            attacker.hp if attacker else 0.0, defender.hp if defender else 0.0)
+
+    def end_turn(self, pokeball: int, score: int, team: int, wild_left: int) -> None:
+        """
+        This method writes the turn started with `begin_turn`, after a keyframe when the turn opens a
+        new block of turns.
+        
+        :param pokeball: NO_POKEBALL, POKEBALL_MISSED or POKEBALL_CAUGHT
+        :param score: The score of the player after the turn
+        :param team: The amount of pokemons of the player waiting to fight
+        :param wild_left: The amount of wild pokemons left to fight
+        """
+        if self.__state.turn % self.__keyframe_every == 0:
+            self.__stream.write(_KEYFRAME.pack(*self.__state))
+        player_turn, attacker_id, defender_id, attack_index, damage, critical, effectivity, attacker_hp, defender_hp = self.__pending
+        record = TurnRecord(
+            self.__state.turn, player_turn, attacker_id, defender_id, attack_index, damage, critical, effectivity,
+            pokeball, attacker_hp, defender_hp, max(-0x8000, min(score, 0x7FFF)), min(team, 0xFF), min(wild_left, 0xFFFF))
+        self.__stream.write(_TURN.pack(*record))
+        self.__state = self.__state.advance(record)
+        self.__pending = None
+
+    def close(self) -> None:
+        """
+        This method flushes the replay, and closes its file when the writer opened it.
+        """
+        self.__stream.flush()
+        if self.__owns_stream:
+            self.__stream.close()
+
+class ReplayReader:
+    """
+    The ReplayReader class reads a replay written by a ReplayWriter, it seeks any turn with the
+    keyframe before it and reads the records in blocks
+    """
+
+    def __init__(self, data: bytes) -> None:
+        """
+        The constructor of the reader.
+        
+        :param data: The content of the replay
+        """
+        magic, version, flags, keyframe_every, seed, trainer_name = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError('The file is not a replay of this version of the game')
+        self.__data = data
+        self.__keyframe_every = keyframe_every
+        self.__seed = seed if flags & _SEEDED else None
+        self.__trainer_name = trainer_name.rstrip(b'\0').decode('utf-8', errors='ignore')
+        # A game cut short can leave half a record at the end, it is ignored
+        records = (len(data) - _HEADER.size) // _RECORD_SIZE
+        blocks, rest = divmod(records, keyframe_every + 1)
+        self.__turns = blocks * keyframe_every + max(rest - 1, 0)
+
+    @staticmethod
+    def open(path: str) -> 'ReplayReader':
+        """
+        This method reads a replay file.
+        
+        :param path: The path of the replay file
+        :return: the ReplayReader of the file.
+        """
+        with open(path, 'rb') as file:
+            return ReplayReader(file.read())
+
+    @property
+    def seed(self) -> int | None:
+        """
+        It returns the seed of the game.
+        :return: The seed, or None if the game was not seeded.
+        """
+        return self.__seed
+
+    @property
+    def keyframe_every(self) -> int:
+        """
+        It returns the amount of turns between keyframes.
+        :return: The amount of turns.
+        """
+        return self.__keyframe_every
+
+    @property
+    def trainer_name(self) -> str:
+        """
+        It returns the name of the trainer of the game.
+        :return: The trainer name.
+        """
+        return self.__trainer_name
+
+    @property
+    def turns(self) -> int:
+        """
+        It returns the amount of turns of the replay.
+        :return: The amount of turns.
+        """
+        return self.__turns
+
+    def __offset(self, turn: int) -> int:
+        """
+        This method returns where the record of a turn starts: every block of turns is preceded by
+        its keyframe.
+        
+        :param turn: The number of the turn
+        :return: the offset of the record in the replay.
+        """
+        return _HEADER.size + (turn + turn // self.__keyframe_every + 1) * _RECORD_SIZE
+
+    def keyframe(self, turn: int) -> Keyframe:
+        """
+        This method returns the state of the battle before a turn, from the keyframe before it and the
+        few turns between them.
+        
+        :param turn: The number of the turn
+        :return: the Keyframe of the state before the turn.
+        """
+        if not self.__turns:
+            return _START
+        turn = max(0, min(turn, self.__turns))
+        first = turn - turn % self.__keyframe_every
+        if first == self.__turns: # The keyframe of a block is written with its first turn
+            first -= self.__keyframe_every
+        state = Keyframe._make(_KEYFRAME.unpack_from(self.__data, self.__offset(first) - _RECORD_SIZE))
+        for record in self.records(first, turn):
+            state = state.advance(record)
+        return state
+
+    def records(self, start: int = 0, stop: int = None) -> Iterator[TurnRecord]:
+        """
+        This method iterates the turns of the replay, skipping the keyframes.
+        
+        :param start: The first turn, defaults to 0
+        :param stop: The turn where the iteration stops, defaults to the end of the replay
+        :return: an iterator of TurnRecord.
+        """
+        stop = self.__turns if stop is None else min(stop, self.__turns)
+        turn = max(start, 0)
+        while turn < stop:
+            block_end = min(stop, turn - turn % self.__keyframe_every + self.__keyframe_every)
+            offset = self.__offset(turn)
+            for fields in _TURN.iter_unpack(self.__data[offset:offset + (block_end - turn) * _RECORD_SIZE]):
+                yield TurnRecord._make(fields)
+            turn = block_end
@@ -0,0 +1,163 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import io
+from modules.game_clock import RealClock, VirtualClock
+from modules.game_random import GameRandom
+from modules.poke_system import PokeSystem
+from modules.renderer import NullRenderer, TerminalRenderer, get_renderer
+from modules.replay_log import POKEBALL_CAUGHT, Keyframe, ReplayReader, ReplayWriter, TurnRecord
+from modules.simulation import simulate_game
+from modules.species import Species
+from modules.common_variables import (
+    _B_GREEN, _B_RED, _F_BLACK, _F_RED, _F_WHITE, _NO_COLOR
+)
+
+# The messages of `Pokemon.calculate_dmg`, by effectivity point
+_EFFECTIVITY_MESSAGES = {
+    -3: '>> Es poco efectivo! Daño -15%',
+    -2: f'>> Es poco efectivo! Daño -5% {_F_RED}[CRITICAL DAMAGE]{_NO_COLOR}',
+    1: '>> Daño Normal!',
+    3: '>> Es MUY efectivo! Daño +15% ',
+    4: f'>> Es MUY efectivo! Daño +25%  {_F_RED}[CRITICAL DAMAGE]{_NO_COLOR}'
+}
+
+def render_turn(renderer: TerminalRenderer | NullRenderer, species: dict[int, Species], record: TurnRecord,
+                state: Keyframe, turns: int) -> None:
+    """
+    This function writes the frame of a recorded turn with the layout of `PokeSystem.system_message`.
+    
+    :param renderer: The renderer where the frame is written
+    :param species: The species of the game by id
+    :param record: The turn to show
+    :param state: The state of the battle after the turn
+    :param turns: The amount of turns of the replay
+    """
+    attacker = species.get(record.attacker_id)
+    defender = species.get(record.defender_id)
+    attacker_name = attacker.name if attacker else '-'
+    defender_name = defender.name if defender else '-'
+    attack = attacker.attacks[record.attack_index] if attacker and record.attack_index < len(attacker.attacks) else None
+    effectivity = _EFFECTIVITY_MESSAGES.get(record.effectivity, '')
+    damage = round(record.damage, 2)
+    damage = int(damage) if damage.is_integer() else damage # The damage is shown as the game shows it
+    if not attack:
+        attack_message = f'>>   {attacker_name} no pudo atacar'
+    elif record.player_turn:
+        attack_message = f'>>⬆️  {_B_GREEN}{_F_BLACK}{attacker_name} uso {attack} contra {defender_name} enemigo y causo {damage} daño{_NO_COLOR} {effectivity}'
+    else:
+        attack_message = f'>>⬇️  {_B_RED}{_F_WHITE}{attacker_name} enemigo uso {attack} contra {defender_name} y causo {damage} daño{_NO_COLOR} {effectivity}'
+    player = species.get(state.player_id)
+    enemy = species.get(state.enemy_id)
+    player_name = player.name if player else '-'
+    enemy_name = enemy.name if enemy else '-'
+    margin = ' ' * 16
+    renderer.write('')
+    renderer.write(f'{margin}Turno: {record.turn + 1}/{turns}                                Puntaje: {record.score}')
+    renderer.write(f'{margin}Restantes: {record.team:02d}                           Por Vencer: {record.wild_left}')
+    renderer.write(f'{margin}{attack_message}')
+    renderer.write(f'{margin}    Tu Pokemon: {player_name:10s}                 Enemigo:{enemy_name:10s}')
+    renderer.write(f'{margin}    HP: {max(state.player_hp, 0):06.2f}                              HP: {max(state.enemy_hp, 0):06.2f}')
+    renderer.write(f'{margin}Daño causado: {state.damage_dealt:.2f}  Daño recibido: {state.damage_received:.2f}  Criticos: {state.criticals}  Capturas: {state.caught}')
+    if record.pokeball == POKEBALL_CAUGHT:
+        renderer.write(f'{margin}{_B_GREEN}{_F_BLACK}Felicidades! Atrapaste un {enemy_name}!{_NO_COLOR}')
+
+def play_replay(replay_path: str, file_path: str, clock: RealClock | VirtualClock = None, from_turn: int = 0,
+                renderer: TerminalRenderer | NullRenderer = None) -> Keyframe:
+    """
+    This function shows a recorded game turn by turn, paced by a clock, starting at any turn.
+    
+    :param replay_path: The path of the replay file
+    :param file_path: The path of the pokemons JSON file, used to show the names of the pokemons and
+    of their attacks
+    :param clock: The clock that paces the replay, one second of game time per turn, defaults to a real
+    time clock
+    :param from_turn: The first turn shown, the turns before it are skipped with the keyframes,
+    defaults to 0
+    :param renderer: The renderer where the replay is shown, defaults to the shared renderer of the
+    standard output
+    :return: the state of the battle when the replay ends.
+    """
+    reader = ReplayReader.open(replay_path)
+    species = {pokemon.id: pokemon for pokemon in PokeSystem.parse_species(PokeSystem.load_file(file_path))}
+    clock = clock or RealClock()
+    renderer = renderer or get_renderer()
+    state = reader.keyframe(from_turn)
+    for record in reader.records(from_turn):
+        state = state.advance(record)
+        renderer.new_frame()
+        render_turn(renderer, species, record, state, reader.turns)
+        renderer.flush()
+        clock.sleep(1)
+    renderer.end_frame()
+    return state
+
+def verify_replay(replay_path: str, file_path: str, log_path: str) -> int | None:
+    """
+    This function plays again with the engine the game of a replay, with its seed and its trainer, and
+    compares every turn with the recorded one.
+    
+    :param replay_path: The path of the replay file
+    :param file_path: The path of the pokemons JSON file
+    :param log_path: The path of the log file where the errors will be written
+    :return: the first turn where the engine and the replay differ, or None if they play the same game.
+    """
+    reader = ReplayReader.open(replay_path)
+    if reader.seed is None:
+        raise ValueError('The replay has no seed, its game can not be played again')
+    buffer = io.BytesIO()
+    records = PokeSystem.parse_species(PokeSystem.load_file(file_path))
+    simulate_game(records, log_path, reader.trainer_name, GameRandom(reader.seed),
+                  ReplayWriter(buffer, reader.seed, reader.trainer_name, reader.keyframe_every))
+    engine = ReplayReader(buffer.getvalue())
+    for turn, (recorded, played) in enumerate(zip(reader.records(), engine.records())):
+        if recorded != played:
+            return turn
+    if reader.turns != engine.turns:
+        return min(reader.turns, engine.turns)
+    return None
+
+def show_replay(replay_path: str, file_path: str, log_path: str, clock: RealClock | VirtualClock = None,
+                from_turn: int = 0, verify: bool = False) -> None:
+    """
+    This function shows a recorded game, or checks it against the engine, and prints a summary.
+    
+    :param replay_path: The path of the replay file
+    :param file_path: The path of the pokemons JSON file
+    :param log_path: The path of the log file where the errors will be written
+    :param clock: The clock that paces the replay, defaults to a real time clock
+    :param from_turn: The first turn shown, defaults to 0
+    :param verify: When True the game is played again with the engine instead of being shown,
+    defaults to False
+    """
+    reader = ReplayReader.open(replay_path)
+    print(f'>> Replay de {reader.trainer_name}: {reader.turns} turnos, semilla {reader.seed}')
+    if verify:
+        turn = verify_replay(replay_path, file_path, log_path)
+        if turn is None:
+            print('>> El motor juega la misma partida que el replay')
+        else:
+            print(f'>> El motor y el replay difieren desde el turno {turn + 1}')
+        return
+    state = play_replay(replay_path, file_path, clock, from_turn)
+    print(f'>> Daño causado: {state.damage_dealt:.2f}, daño recibido: {state.damage_received:.2f}, '
+          f'criticos: {state.criticals}, capturas: {state.caught}, vencidos: {state.defeated}, perdidos: {state.lost}')
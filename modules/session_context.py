@@ -0,0 +1,239 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import itertools
+import random
+import time
+from typing import Callable
+from modules.game_clock import InstantClock, RealClock, VirtualClock
+from modules.game_random import GameRandom
+from modules.log_sink import LogRecord, get_log_sink
+from modules.replay_log import ReplayWriter
+from modules.renderer import NullRenderer, TerminalRenderer, get_renderer
+from modules.trainer import Trainer
+from modules.wild_pool import WildPool
+
+# Every context of the process gets its own number, it tells the sessions apart in the log
+_session_ids = itertools.count(1)
+
+class SessionContext:
+    """
+    The SessionContext class owns everything that belongs to a single game: the random generator, the
+    trainer, the wild pool, the clock, the renderer, the log sink and the replay writer. Nothing of a game is kept in class
+    or module attributes, so many games can be played at the same time in one interpreter
+    """
+
+    def __init__(self, log_path: str, seed: int = None, rng: GameRandom = None,
+                 renderer: TerminalRenderer | NullRenderer = None, clock: RealClock | VirtualClock = None,
+                 headless: bool = False, log_sink: Callable[[LogRecord], None] = None, replay: ReplayWriter = None) -> None:
+        """
+        The constructor of the context.
+        
+        :param log_path: The path of the log file where the errors will be written
+        :param seed: The seed of the random generator of the game, defaults to a seed drawn from the
+        `random` module, so `random.seed` still makes a run reproducible
+        :param rng: The random generator of the game, it takes precedence over the seed
+        :param renderer: The renderer used to show the game, defaults to the shared renderer of the
+        standard output, or a NullRenderer when the game is headless
+        :param clock: The clock that paces the game, defaults to a real time clock, or an instant clock
+        when the game is headless
+        :param headless: When True nothing is shown and the game doesn't wait, defaults to False
+        :param log_sink: A function that receives every log record, defaults to the shared LogSink of
+        the log file
+        :param replay: The ReplayWriter where every turn is recorded, defaults to None (no replay)
+        """
+        if rng is None and seed is None:
+            seed = random.getrandbits(64)
+        self.__seed = seed
+        self.__rng = rng or GameRandom(seed)
+        self.__renderer = renderer or (NullRenderer() if headless else get_renderer())
+        self.__headless = headless or not self.__renderer.enabled
+        self.__clock = clock or (InstantClock() if self.__headless else RealClock())
+        self.__log_path = log_path
+        self.__log_sink = log_sink
+        self.__session_id = next(_session_ids)
+        self.__turn: int = 0
+        self.__replay = replay
+        self.__trainer: Trainer | None = None
+        self.__wild_pool = WildPool(rng=self.__rng)
+
+    @property
+    def seed(self) -> int | None:
+        """
+        It returns the seed of the random generator of the game.
+        :return: The seed, or None if the context received a generator already seeded.
+        """
+        return self.__seed
+
+    @property
+    def rng(self) -> GameRandom:
+        """
+        It returns the random generator of the game.
+        :return: The GameRandom of the context.
+        """
+        return self.__rng
+
+    @property
+    def renderer(self) -> TerminalRenderer | NullRenderer:
+        """
+        It returns the renderer used to show the game.
+        :return: The renderer of the context.
+        """
+        return self.__renderer
+
+    @property
+    def headless(self) -> bool:
+        """
+        It returns whether the game runs without showing anything nor waiting.
+        :return: a boolean value.
+        """
+        return self.__headless
+
+    @property
+    def clock(self) -> RealClock | VirtualClock:
+        """
+        It returns the clock that paces the game.
+        :return: The clock of the context.
+        """
+        return self.__clock
+
+    @property
+    def log_path(self) -> str:
+        """
+        It returns the path of the log file.
+        :return: The log path of the context.
+        """
+        return self.__log_path
+
+    @property
+    def replay(self) -> ReplayWriter | None:
+        """
+        It returns the writer of the replay of the game.
+        :return: The ReplayWriter of the context, or None if the game is not recorded.
+        """
+        return self.__replay
+
+    @property
+    def session_id(self) -> int:
+        """
+        It returns the number of the session in the log.
+        :return: The session id of the context.
+        """
+        return self.__session_id
+
+    @property
+    def turn(self) -> int:
+        """
+        It returns the turn being played.
+        :return: The turn, 0 before the first one.
+        """
+        return self.__turn
+
+    @property
+    def trainer(self) -> Trainer | None:
+        """
+        It returns the trainer of the game.
+        :return: The Trainer created by `new_trainer`, or None if there is no trainer yet.
+        """
+        return self.__trainer
+
+    @property
+    def wild_pool(self) -> WildPool:
+        """
+        It returns the pool of wild pokemons of the game.
+        :return: The WildPool of the context.
+        """
+        return self.__wild_pool
+
+    @log_path.setter
+    def log_path(self, path: str) -> None:
+        """
+        It sets the path of the log file.
+        
+        :param path: The new log path
+        """
+        self.__log_path = path
+
+    @turn.setter
+    def turn(self, turn: int) -> None:
+        """
+        It sets the turn being played.
+        
+        :param turn: The number of the turn
+        """
+        self.__turn = turn
+
+    @replay.setter
+    def replay(self, replay: ReplayWriter | None) -> None:
+        """
+        It sets the writer of the replay of the game.
+        
+        :param replay: The ReplayWriter where every turn is recorded, or None to stop recording
+        """
+        self.__replay = replay
+
+    @wild_pool.setter
+    def wild_pool(self, pool: WildPool) -> None:
+        """
+        It sets the pool of wild pokemons of the game.
+        
+        :param pool: The new WildPool, it should draw with the random generator of the context
+        """
+        self.__wild_pool = pool
+
+    def new_trainer(self, trainer_name: str = 'Red') -> Trainer:
+        """
+        This method creates the trainer of the game, showing its messages with the renderer of the
+        context and pacing them with its clock.
+        
+        :param trainer_name: The name of the trainer, defaults to 'Red'
+        :return: the new Trainer.
+        """
+        self.__trainer = Trainer(trainer_name, renderer=self.__renderer, clock=self.__clock)
+        return self.__trainer
+
+    def new_pool(self, items: list = None, weights: list[float] = None, factory: Callable = None) -> WildPool:
+        """
+        This method replaces the wild pool of the game with a new one that draws with the random
+        generator of the context.
+        
+        :param items: The items of the pool
+        :param weights: The spawn weight of every item
+        :param factory: An optional function applied to an item when it is drawn
+        :return: the new WildPool.
+        """
+        self.__wild_pool = WildPool(items, weights, rng=self.__rng, factory=factory)
+        return self.__wild_pool
+
+    def log(self, message: str, level: str = 'ERROR') -> None:
+        """
+        This method sends a message to the log sink of the game, with the session and the turn where it
+        happened. With the default sink it is written later by a background thread.
+        
+        :param message: The message to log
+        :param level: The level of the message, defaults to 'ERROR'
+        """
+        record = LogRecord(time.time(), level, self.__session_id, self.__turn, message)
+        if self.__log_sink:
+            self.__log_sink(record)
+        else:
+            get_log_sink(self.__log_path).emit(record)
@@ -0,0 +1,133 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+from modules.database.db_manager import DAOManager
+from modules.database.score_writer import ScoreWriter
+from modules.game_random import GameRandom
+from modules.poke_system import PokeSystem
+from modules.replay_log import ReplayWriter
+from modules.session_context import SessionContext
+from modules.species import Species
+
+def simulate_game(records: list[dict] | list[Species], log_path: str, trainer_name: str = 'Bot', rng: GameRandom = None,
+                  replay: ReplayWriter = None, file_path: str = None) -> dict:
+    """
+    This function plays a full game without audio, prompts, delays or console output, using the same
+    rules that the interactive game uses, and returns its result.
+    
+    :param records: A list of dictionaries with the pokemons data, as returned by `PokeSystem.load_file`,
+    or the species parsed from them by `PokeSystem.parse_species`
+    :param log_path: The path of the log file where the errors will be written
+    :param trainer_name: The name of the simulated trainer, defaults to 'Bot'
+    :param rng: The random generator of the game, the same seed plays the same game, defaults to a
+    generator seeded from the `random` module
+    :param replay: The ReplayWriter where every turn is recorded, defaults to None (no replay)
+    :param file_path: The path of a pokedex file streamed lazily instead of the records, for very large
+    files, the same seed plays the same game as with the records of the file, defaults to None
+    :return: a dictionary with the trainer name, the final status, the score, the amount of pokemons
+    left, the amount of turns played and the names of the initial team.
+    """
+    context = SessionContext(log_path, rng=rng, headless=True, replay=replay)
+    sys_manager = PokeSystem(file_path or '', log_path, context=context)
+    try:
+        sys_manager.init_pokemons(records, lazy=file_path is not None)
+        pkm_trainer = context.new_trainer(trainer_name)
+        sys_manager.assign_init_pokemons(pkm_trainer)
+        team = [pokemon.name for pokemon in pkm_trainer.pokemons]
+        sys_manager.player_score = sys_manager.calculate_score(pkm_trainer)
+
+        pkm_trainer.next_pokemon()
+        enemy_pokemon = sys_manager.next_pokemon()
+        still_can_fight = True
+        turns = 0
+        while still_can_fight and sys_manager.pokemons:
+            enemy_pokemon, still_can_fight = sys_manager.play_turn(pkm_trainer, enemy_pokemon)
+            turns += 1
+        pkm_trainer.check_status()
+        sys_manager.player_score = sys_manager.calculate_score(pkm_trainer)
+    finally:
+        sys_manager.close()
+    return {
+        'trainer_name': pkm_trainer.name,
+        'status': pkm_trainer.status,
+        'score': sys_manager.player_score,
+        'amount_pokemons': len(pkm_trainer.defeated_pokemons) + len(pkm_trainer.pokemons),
+        'pokemons_left': len(pkm_trainer.pokemons),
+        'turns': turns,
+        'team': team
+    }
+
+def simulate_games(amount: int, file_path: str, log_path: str, trainer_name: str = 'Bot', writer: ScoreWriter = None,
+                   seed: int = None) -> list[dict]:
+    """
+    This function plays many headless games in a row, reading and parsing the pokemons file only once.
+    
+    :param amount: The amount of games to simulate
+    :param file_path: The path of the JSON file that contains the pokemons data
+    :param log_path: The path of the log file where the errors will be written
+    :param trainer_name: The name of the simulated trainer, defaults to 'Bot'
+    :param writer: An optional ScoreWriter where the score of every game is queued
+    :param seed: The seed from which every game gets its own generator, the same seed plays the same
+    games, defaults to None
+    :return: a list of dictionaries, one per game, as returned by `simulate_game`.
+    """
+    records = PokeSystem.parse_species(PokeSystem.load_file(file_path))
+    rng = GameRandom(seed)
+    results = list[dict]()
+    for _ in range(amount):
+        results.append(simulate_game(records, log_path, trainer_name, rng.spawn()))
+        if writer:
+            writer.submit_result(results[-1])
+    return results
+
+def show_simulation(amount: int, file_path: str, log_path: str, record: bool = False, seed: int = None) -> None:
+    """
+    This function simulates the given amount of games and prints a summary with the amount of games
+    won, the average score and the throughput reached.
+    
+    :param amount: The amount of games to simulate
+    :param file_path: The path of the JSON file that contains the pokemons data
+    :param log_path: The path of the log file where the errors will be written
+    :param record: When True the scores are stored in the database by a ScoreWriter, defaults to False
+    :param seed: The seed of the games, defaults to None
+    """
+    writer = None
+    if record:
+        dao_manager = DAOManager()
+        dao_manager.prepare_table()
+        writer = ScoreWriter(dao_manager)
+    start = time.perf_counter()
+    results = simulate_games(amount, file_path, log_path, writer=writer, seed=seed)
+    elapsed = time.perf_counter() - start
+    if writer:
+        writer.close()
+    won = sum(1 for result in results if result['status'] == 'Won')
+    avg_score = sum(result['score'] for result in results) / len(results) if results else 0
+    message =\
+    """
+    Partidas simuladas: {0}
+    Ganadas: {1} ({2:.2f}%)
+    Puntaje promedio: {3:.2f}
+    Partidas por segundo: {4:.2f}
+    """.format(amount, won, 100 * won / amount if amount else 0, avg_score, amount / elapsed if elapsed else 0)
+    print(message)
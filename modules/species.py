@@ -0,0 +1,196 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+class Species:
+    """
+    The Species class holds the immutable data of a pokemon species, shared by every Pokemon of that
+    species in the game
+    """
+    __slots__ = (
+        '_id', '_power', '_name', '_icon', '_icon_el', '_types', '_evolutions',
+        '_weakness', '_strenghts', '_attacks', '_spawn_weight', '_effect_row', '_defense_index'
+    )
+
+    def __init__(self, pkm_id: int, pkm_power: int, pkm_name: str, pkm_icon: bytes, pkm_icon_el: bytes, 
+                pkm_types: list[str], pkm_evolutions: list[str], pkm_weakness: list[str], pkm_strenghts: list[str], 
+                pkm_attacks: list[str], pkm_spawn_weight: float = 1) -> None:
+        """
+        This function is a constructor for the Species class, the lists are stored as tuples so they
+        can be shared safely between pokemons.
+        
+        :param pkm_id: The ID of the pokemon
+        :param pkm_power: The power of the pokemon
+        :param pkm_name: The name of the pokemon
+        :param pkm_icon: The icon of the pokemon
+        :param pkm_icon_el: The icon of the element of the pokemon
+        :param pkm_types: list[str]
+        :param pkm_evolutions: list[str]
+        :param pkm_weakness: list[str]
+        :param pkm_strenghts: list[str]
+        :param pkm_attacks: list[str]
+        :param pkm_spawn_weight: The relative chance of the species to appear in the wild, defaults to 1
+        """
+        self._id = pkm_id
+        self._power = pkm_power
+        self._name = pkm_name
+        self._icon = pkm_icon
+        self._icon_el = pkm_icon_el
+        self._types = tuple(pkm_types)
+        self._evolutions = tuple(pkm_evolutions)
+        self._weakness = tuple(pkm_weakness)
+        self._strenghts = tuple(pkm_strenghts)
+        self._attacks = tuple(pkm_attacks)
+        self._spawn_weight = pkm_spawn_weight
+        self._effect_row = None
+        self._defense_index = None
+
+    @staticmethod
+    def from_record(record: dict) -> 'Species':
+        """
+        This function creates a species from a dictionary of the pokemons file.
+        
+        :param record: A dictionary with the keys 'id', 'poder', 'nombre', 'icon', 'icon_element',
+        'tipo', 'evoluciones', 'debilidad', 'fortaleza', 'ataques' and optionally 'spawn'
+        :return: a Species object.
+        """
+        return Species(
+            record['id'], record['poder'], str(record['nombre']).capitalize(),
+            record['icon'], record['icon_element'], record['tipo'],
+            record['evoluciones'], record['debilidad'],
+            record['fortaleza'], record['ataques'], record.get('spawn', 1)
+        )
+
+    @property
+    def id(self) -> int:
+        """
+        It returns the id of the species.
+        :return: The id of the species.
+        """
+        return self._id
+
+    @property
+    def power(self) -> int:
+        """
+        It returns the power of the species.
+        :return: The power of the species.
+        """
+        return self._power
+
+    @property
+    def name(self) -> str:
+        """
+        It returns the name of the species.
+        :return: The name of the species.
+        """
+        return self._name
+
+    @property
+    def icon(self) -> bytes:
+        """
+        It returns the icon of the species.
+        :return: The icon is being returned.
+        """
+        return self._icon
+
+    @property
+    def icon_el(self) -> bytes:
+        """
+        It returns the icon of the element of the species.
+        :return: The icon_el is being returned.
+        """
+        return self._icon_el
+
+    @property
+    def types(self) -> tuple[str]:
+        """
+        It returns the types of the species.
+        :return: A tuple of strings.
+        """
+        return self._types
+
+    @property
+    def evolutions(self) -> tuple[str]:
+        """
+        It returns the evolutions of the species.
+        :return: A tuple of strings.
+        """
+        return self._evolutions
+
+    @property
+    def weakness(self) -> tuple[str]:
+        """
+        It returns the weakness of the species.
+        :return: A tuple of strings.
+        """
+        return self._weakness
+
+    @property
+    def strenghts(self) -> tuple[str]:
+        """
+        It returns the strenghts of the species.
+        :return: A tuple of strings.
+        """
+        return self._strenghts
+
+    @property
+    def attacks(self) -> tuple[str]:
+        """
+        It returns the attacks of the species.
+        :return: A tuple of strings.
+        """
+        return self._attacks
+
+    @property
+    def spawn_weight(self) -> float:
+        """
+        It returns the relative chance of the species to appear in the wild.
+        :return: The spawn weight of the species.
+        """
+        return self._spawn_weight
+
+    @property
+    def effect_row(self) -> list[int]:
+        """
+        It returns the row of the type chart of the species types, or None if it is not bound.
+        :return: A list of integers.
+        """
+        return self._effect_row
+
+    @property
+    def defense_index(self) -> int:
+        """
+        It returns the column of the type chart of the species weakness and strenghts, or None if it is
+        not bound.
+        :return: An integer.
+        """
+        return self._defense_index
+
+    def bind_type_chart(self, effect_row: list[int], defense_index: int) -> None:
+        """
+        It stores the row of the type chart of this species types and the column of its weakness and
+        strenghts, used by `Pokemon.effectivity_against`
+        
+        :param effect_row: The effectivity categories of this species against every defender column
+        :param defense_index: The column of this species as a defender
+        """
+        self._effect_row = effect_row
+        self._defense_index = defense_index
@@ -0,0 +1,206 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import random
+import time
+from collections import Counter
+from multiprocessing import Pool
+from modules.database.db_manager import DAOManager
+from modules.database.score_writer import ScoreWriter
+from modules.game_random import GameRandom
+from modules.log_sink import flush_log_sinks
+from modules.poke_system import PokeSystem
+from modules.simulation import simulate_game
+from modules.species import Species
+
+# The amount of games of every batch, it must not depend on the amount of workers
+_BATCH_GAMES = 100
+
+_worker_records: list[Species] = None
+_worker_log_path: str = ''
+_worker_record: bool = False
+
+def _init_worker(file_path: str, log_path: str, record: bool = False) -> None:
+    """
+    This function runs once in every worker process and loads the pokemons species, so the tasks only
+    have to carry their seed and their amount of games.
+    
+    :param file_path: The path of the JSON file that contains the pokemons data
+    :param log_path: The path of the log file where the errors will be written
+    :param record: When True every batch stores its scores in the database
+    """
+    global _worker_records, _worker_log_path, _worker_record
+    _worker_records = PokeSystem.parse_species(PokeSystem.load_file(file_path))
+    _worker_log_path = log_path
+    _worker_record = record
+
+def _play_batch(task: tuple[int, int]) -> dict:
+    """
+    This function plays a batch of headless games with its own seeded random stream and returns the
+    partial aggregates of the batch.
+    
+    :param task: A tuple with the seed of the batch and the amount of games to play
+    :return: a dictionary with the partial per-species, per-team and score aggregates.
+    """
+    seed, amount = task
+    rng = GameRandom(seed)
+    species, teams, scores = dict(), dict(), Counter()
+    wins = 0
+    writer = ScoreWriter(DAOManager()) if _worker_record else None
+    for _ in range(amount):
+        result = simulate_game(_worker_records, _worker_log_path, rng=rng.spawn())
+        if writer:
+            writer.submit_result(result)
+        won = int(result['status'] == 'Won')
+        wins += won
+        scores[result['score']] += 1
+        team = tuple(sorted(result['team']))
+        for name in set(team):
+            _add_stat(species, name, won, result['score'])
+        _add_stat(teams, team, won, result['score'])
+    if writer:
+        writer.close()
+    # a worker of the pool ends without the exit handlers, so its log records are written here
+    flush_log_sinks()
+    return {'games': amount, 'wins': wins, 'species': species, 'teams': teams, 'scores': scores}
+
+def _add_stat(stats: dict, key, won: int, score: int) -> None:
+    """
+    This function accumulates the games, wins and score of a game into the entry `key` of `stats`.
+    
+    :param stats: The dictionary with the [games, wins, score_sum] lists
+    :param key: The species name or team that played the game
+    :param won: 1 if the game was won, 0 otherwise
+    :param score: The final score of the game
+    """
+    stat = stats.setdefault(key, [0, 0, 0])
+    stat[0] += 1
+    stat[1] += won
+    stat[2] += score
+
+def _merge(total: dict, partial: dict) -> None:
+    """
+    This function merges the partial aggregates of a batch into the total aggregates.
+    
+    :param total: The aggregates of the whole tournament
+    :param partial: The aggregates returned by `_play_batch`
+    """
+    total['games'] += partial['games']
+    total['wins'] += partial['wins']
+    total['scores'].update(partial['scores'])
+    for group in ('species', 'teams'):
+        for key, (games, wins, score_sum) in partial[group].items():
+            stat = total[group].setdefault(key, [0, 0, 0])
+            stat[0] += games
+            stat[1] += wins
+            stat[2] += score_sum
+
+def _percentile(scores: Counter, amount: int, percent: float) -> int:
+    """
+    This function returns the score at the given percentile of a score histogram.
+    
+    :param scores: A Counter with the amount of games per score
+    :param amount: The total amount of games of the histogram
+    :param percent: The percentile to find, between 0 and 100
+    :return: the score at the given percentile.
+    """
+    target = amount * percent / 100
+    accumulated = 0
+    for score in sorted(scores):
+        accumulated += scores[score]
+        if accumulated >= target:
+            return score
+    return 0
+
+def _split_tasks(amount: int, seed: int) -> list[tuple[int, int]]:
+    """
+    This function splits the games of the tournament into seeded batches of the same size. The split
+    only depends on the amount of games, so the same seed plays the same games with any amount of
+    workers, and there are many batches per worker so the load stays balanced between cores.
+    
+    :param amount: The amount of games of the tournament
+    :param seed: The base seed from which every batch seed is derived
+    :return: a list of tuples with the seed and the amount of games of every batch.
+    """
+    seeder = random.Random(seed)
+    return [(seeder.getrandbits(64), min(_BATCH_GAMES, amount - first)) for first in range(0, amount, _BATCH_GAMES)]
+
+def run_tournament(amount: int, file_path: str, log_path: str, workers: int = None, seed: int = None, record: bool = False) -> dict:
+    """
+    This function plays a tournament of headless games spread across a pool of processes and merges
+    the results into per-species and per-team win rates and a score distribution.
+    
+    :param amount: The amount of games to play
+    :param file_path: The path of the JSON file that contains the pokemons data
+    :param log_path: The path of the log file where the errors will be written
+    :param workers: The amount of worker processes, defaults to the amount of cores
+    :param seed: The base seed of the tournament, the same seed reproduces the same results
+    :param record: When True the scores of every game are stored in the database, defaults to False
+    :return: a dictionary with the amount of games, wins, elapsed seconds, games per second, the score
+    histogram and the [games, wins, score_sum] stats per species and per team.
+    """
+    workers = workers or os.cpu_count() or 1
+    total = {'games': 0, 'wins': 0, 'species': dict(), 'teams': dict(), 'scores': Counter()}
+    if record:
+        # prepared once here, the writers of the batches only insert
+        dao_manager = DAOManager()
+        dao_manager.prepare_table()
+        dao_manager.close()
+    start = time.perf_counter()
+    with Pool(workers, initializer=_init_worker, initargs=(file_path, log_path, record)) as pool:
+        # merged in task order, so the ties of the rankings don't depend on which batch finished first
+        for partial in pool.imap(_play_batch, _split_tasks(amount, seed)):
+            _merge(total, partial)
+    total['elapsed'] = time.perf_counter() - start
+    total['games_per_second'] = total['games'] / total['elapsed'] if total['elapsed'] else 0
+    total['workers'] = workers
+    return total
+
+def show_tournament(amount: int, file_path: str, log_path: str, workers: int = None, seed: int = None, top: int = 10, record: bool = False) -> None:
+    """
+    This function runs a tournament and prints its throughput, the score distribution and the win
+    rates of the best species and teams.
+    
+    :param amount: The amount of games to play
+    :param file_path: The path of the JSON file that contains the pokemons data
+    :param log_path: The path of the log file where the errors will be written
+    :param workers: The amount of worker processes, defaults to the amount of cores
+    :param seed: The base seed of the tournament
+    :param top: The amount of species and teams to show, defaults to 10
+    :param record: When True the scores of every game are stored in the database, defaults to False
+    """
+    total = run_tournament(amount, file_path, log_path, workers, seed, record)
+    games, scores = total['games'], total['scores']
+    mean = sum(score * count for score, count in scores.items()) / games if games else 0
+    print(
+        f"Torneo: {games} partidas en {total['elapsed']:.2f}s con {total['workers']} procesos "
+        f"({total['games_per_second']:.2f} partidas por segundo)",
+        f"Ganadas: {total['wins']} ({100 * total['wins'] / games if games else 0:.2f}%)",
+        f"Puntaje: promedio {mean:.2f} | min {min(scores, default=0)} | p50 {_percentile(scores, games, 50)} "
+        f"| p90 {_percentile(scores, games, 90)} | max {max(scores, default=0)}",
+        sep='\n')
+    for title, group, label in (('Especies', 'species', str), ('Equipos', 'teams', ' | '.join)):
+        print(f'\n{title} por porcentaje de victorias:')
+        ranking = sorted(total[group].items(), key=lambda item: item[1][1] / item[1][0], reverse=True)
+        for key, (played, wins, score_sum) in ranking[:top]:
+            print(f'{label(key):45s} {100 * wins / played:6.2f}% | partidas: {played:6d} | puntaje: {score_sum / played:6.2f}')
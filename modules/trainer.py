@@ -20,10 +20,9 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from copy import deepcopy
-import os
-import time
+from modules.game_clock import InstantClock, RealClock, VirtualClock
 from modules.pokemon import Pokemon
+from modules.renderer import NullRenderer, TerminalRenderer, get_renderer
 from modules.common_variables import (
     _B_GREEN, _B_BLUE, _B_RED, _B_WHITE, _F_BLACK, 
     _F_RED, _F_WHITE, _I_LOSE, _I_WIN, _NO_COLOR
@@ -33,37 +32,46 @@ class Trainer:
     """
     The Trainer class is a class that represents a trainer in the Pokemon game
     """
-    __current_pokemon: Pokemon = None
-    __pokemons: list[Pokemon] = None
-    __defeated_pokemons: list[Pokemon] = None
-    __name: str = None
-    __throw_pokeball: bool = False
-    __status = None
-    __instanced = None
 
-    def __init__(self, trainer_name: str = 'Red'):
+    def __init__(self, trainer_name: str = 'Red', headless: bool = False, renderer: TerminalRenderer | NullRenderer = None,
+                 clock: RealClock | VirtualClock = None):
         """
         This is a constructor function for a class that initializes the name, list of pokemons, and list
         of defeated pokemons.
         
         :param trainer_name: The parameter "trainer_name" is a string that represents the name of an object being
         initialized. In this case, it is used to set the name of an instance of a class
+        :param headless: When True the trainer doesn't show messages nor waits when choosing a pokemon,
+        it is the same as using a NullRenderer, defaults to False
+        :param renderer: The renderer used to show the messages, defaults to the shared renderer of the
+        standard output
+        :param clock: The clock that paces the messages, defaults to a real time clock, or an instant
+        clock when nothing is shown
         """
         self.name = trainer_name
+        self.__current_pokemon: Pokemon = None
+        self.__throw_pokeball: bool = False
+        self.__status: str = None
+        self.__renderer = renderer or (NullRenderer() if headless else get_renderer())
+        self.__clock = clock or (RealClock() if self.__renderer.enabled else InstantClock())
         self.__pokemons = list[Pokemon]()
         self.__defeated_pokemons = list[Pokemon]()
-        #if not Trainer.__instanced:
-        Trainer.__instanced = self
-    
-    @staticmethod
-    def get_instance():
+
+    @property
+    def renderer(self) -> TerminalRenderer | NullRenderer:
+        """
+        It returns the renderer used to show the messages of the trainer.
+        :return: The renderer of the trainer.
         """
-        The function `get_instance` checks if an instance of the `Trainer` class already exists and
-        returns it [using Singleton pattern], otherwise it raises an exception.
+        return self.__renderer
+
+    @property
+    def clock(self) -> RealClock | VirtualClock:
         """
-        if not Trainer.__instanced:
-            return Trainer()
-        else: return Trainer.__instanced
+        It returns the clock that paces the messages of the trainer.
+        :return: The clock of the trainer.
+        """
+        return self.__clock
 
     @property
     def pokemon_in_battle(self) -> Pokemon:
@@ -185,8 +193,10 @@ class Trainer:
         :param mensaje: str = The message you want to print
         :param color_code_end: str = '\033[0m'
         """
+        if not self.__renderer.enabled:
+            return
         trainer_text = f'\n{color_code_init}{self.name}: {mensaje}{color_code_end}'
-        print(trainer_text)
+        self.__renderer.write(trainer_text)
 
     def throw_pokeball(self) -> bool:
         """
@@ -212,7 +222,8 @@ class Trainer:
         """
         if not pokemon.has_hp():
             self.catch_pokemon(pokemon)
-            print(f'{_B_GREEN}{_F_BLACK}Felicidades! Atrapaste un {pokemon.name}!{_NO_COLOR}\n')
+            if self.__renderer.enabled:
+                self.__renderer.write(f'{_B_GREEN}{_F_BLACK}Felicidades! Atrapaste un {pokemon.name}!{_NO_COLOR}\n')
 
     def catch_if_pokeball(self, pokemon: Pokemon) -> None:
         """
@@ -221,7 +232,7 @@ class Trainer:
         :param pokemon: Pokemon
         """
         if self.check_pokeball(): # Chequeo si lanze pokebola o no
-            self.try_catch_pokemon(deepcopy(pokemon))
+            self.try_catch_pokemon(pokemon.clone())
 
     def catch_pokemon(self, poke: Pokemon) -> bool:
         """
@@ -245,14 +256,16 @@ class Trainer:
         """
         It prints the name of the trainer and the name of the pokemon, and the HP of the pokemon
         """
+        if not self.__renderer.enabled:
+            return
         if self.pokemons:
             self.speak(f'{_B_BLUE}{_F_WHITE}','Mis pokemones son:', f'{_NO_COLOR}')
             for pokemon in self.pokemons:
-                print(f'{self.name}: {pokemon.name} con {pokemon.hp} de HP.')
+                self.__renderer.write(f'{self.name}: {pokemon.name} con {pokemon.hp} de HP.')
         if self.defeated_pokemons:
             self.speak(f'{_B_BLUE}{_F_WHITE}','Mis pokemones derrotados son:', f'{_NO_COLOR}')
             for pokemon_v in self.defeated_pokemons:
-                print(f'{self.name}: {pokemon_v.name} con {pokemon_v.hp} de HP.')
+                self.__renderer.write(f'{self.name}: {pokemon_v.name} con {pokemon_v.hp} de HP.')
 
     def next_pokemon(self):
         """
@@ -262,23 +275,23 @@ class Trainer:
         try:
             if self.pokemons:
                 pokemon = self.pokemons.pop(0)
-                if pokemon:
+                if pokemon and not self.__renderer.enabled:
+                    self.pokemon_in_battle = pokemon
+                elif pokemon:
                     message =\
                     f"""
                                     {_B_BLUE}{_F_WHITE} {self.name}: {pokemon.name}, yo te elijo! 👉🏼⛔{_NO_COLOR}
                     """
-                    os.system('cls')
-                    print(message)
-                    time.sleep(2)
+                    self.__renderer.new_frame()
+                    self.__renderer.write(message)
+                    self.__renderer.flush()
+                    self.__clock.sleep(2)
                     #self.hablar(f'')
                     self.pokemon_in_battle = pokemon
             else:
                 raise IndexError
         except Exception as e:
-            print(
-                'No te quedan mas pokemones, volve a pueblo paleta.',
-                f'Exception: {e}',
-                sep='\n')
+            self.__renderer.write(f'No te quedan mas pokemones, volve a pueblo paleta.\nException: {e}')
 
     def return_to_pokeball(self, pokemon: Pokemon) -> None:
         """
@@ -287,7 +300,7 @@ class Trainer:
         :param pokemon: Pokemon
         """
         self.speak('', f'{pokemon.name}, peleaste bien, regresa a tu pokebola!', '')
-        self.defeated_pokemons.append(deepcopy(pokemon))
+        self.defeated_pokemons.append(pokemon.clone())
 
     def check_win_or_lose(self) -> bool:
         """
@@ -306,7 +319,7 @@ class Trainer:
         if self.pokemons or self.pokemon_in_battle:
             self.speak(f'{_B_WHITE}{_F_RED}', 'Gane la liga pokemon!', f'{_I_WIN}{_NO_COLOR}')
             if self.pokemon_in_battle:
-                self.pokemons.insert(0, deepcopy(self.pokemon_in_battle))
+                self.pokemons.insert(0, self.pokemon_in_battle.clone())
             self.__status = 'Won'
         else:
             self.speak(f'{_B_RED}{_F_WHITE}','Me quede sin pokemones!', f'{_NO_COLOR}{_I_LOSE}')
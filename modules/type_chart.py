@@ -0,0 +1,135 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+NORMAL: int = 0
+WEAK: int = 1
+STRONG: int = 2
+
+class TypeChart:
+    """
+    The TypeChart class interns the pokemon types into bits and keeps the effectivity category of every
+    attacker type signature against every defender weakness/strenght signature, so an attack resolves
+    its effectivity with a single lookup instead of scanning the lists of types
+    """
+
+    def __init__(self) -> None:
+        """
+        This is the constructor of the chart, it starts without types nor signatures, they are added
+        when the pokemons are bound to the chart.
+        """
+        self._type_bits = dict[str, int]()
+        self._attack_rows = dict[int, int]()
+        self._defense_cols = dict[tuple[int, int], int]()
+        self._attack_masks = list[int]()
+        self._defense_masks = list[tuple[int, int]]()
+        self._table = list[list[int]]()
+
+    @property
+    def types(self) -> list[str]:
+        """
+        This function returns the interned types, ordered by their bit.
+        :return: A list of strings.
+        """
+        return list(self._type_bits)
+
+    @property
+    def table(self) -> list[list[int]]:
+        """
+        This function returns the effectivity categories, one row per attacker signature and one column
+        per defender signature.
+        :return: A list of lists of integers.
+        """
+        return self._table
+
+    def type_mask(self, types: list[str]) -> int:
+        """
+        This function interns the given types and returns the bitmask that represents them.
+        
+        :param types: list[str]
+        :return: an integer with one bit set per type.
+        """
+        mask = 0
+        for pkm_type in types:
+            mask |= 1 << self._type_bits.setdefault(pkm_type, len(self._type_bits))
+        return mask
+
+    @staticmethod
+    def __category(attack_mask: int, defense_mask: tuple[int, int]) -> int:
+        """
+        This function resolves the effectivity category of an attacker against a defender, with the same
+        rules as `Pokemon.calculate_dmg`.
+        
+        :param attack_mask: The bitmask of the attacker types
+        :param defense_mask: A tuple with the bitmasks of the defender weakness and strenghts
+        :return: NORMAL, WEAK or STRONG.
+        """
+        weakness_mask, strenghts_mask = defense_mask
+        has_weakness = bool(attack_mask & strenghts_mask)
+        has_strenghts = bool(attack_mask & weakness_mask)
+        if has_weakness and not has_strenghts:
+            return WEAK
+        if has_strenghts and not has_weakness:
+            return STRONG
+        return NORMAL
+
+    def attack_index(self, types: list[str]) -> int:
+        """
+        This function returns the row of the given attacker types, adding it to the chart if it is new.
+        
+        :param types: The types of the attacker
+        :return: the index of the row.
+        """
+        mask = self.type_mask(types)
+        row = self._attack_rows.get(mask)
+        if row is None:
+            row = self._attack_rows[mask] = len(self._attack_masks)
+            self._attack_masks.append(mask)
+            self._table.append([TypeChart.__category(mask, defense) for defense in self._defense_masks])
+        return row
+
+    def defense_index(self, weakness: list[str], strenghts: list[str]) -> int:
+        """
+        This function returns the column of the given defender weakness and strenghts, adding it to the
+        chart if it is new.
+        
+        :param weakness: The weakness of the defender
+        :param strenghts: The strenghts of the defender
+        :return: the index of the column.
+        """
+        masks = (self.type_mask(weakness), self.type_mask(strenghts))
+        col = self._defense_cols.get(masks)
+        if col is None:
+            col = self._defense_cols[masks] = len(self._defense_masks)
+            self._defense_masks.append(masks)
+            for attack_mask, row in zip(self._attack_masks, self._table):
+                row.append(TypeChart.__category(attack_mask, masks))
+        return col
+
+    def bind(self, species) -> None:
+        """
+        This function gives the species its row of the chart and its column, so its pokemons can resolve
+        the effectivity of their attacks with one lookup.
+        
+        :param species: The species to bind
+        """
+        row = self._table[self.attack_index(species.types)]
+        species.bind_type_chart(row, self.defense_index(species.weakness, species.strenghts))
@@ -0,0 +1,160 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+from modules.game_random import GameRandom
+from modules.pokemon import Pokemon
+from modules.poke_system import PokeSystem
+from modules.type_chart import TypeChart
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class VectorEngine:
+    """
+    The VectorEngine class resolves thousands of one versus one battles at once, keeping the HP, power
+    and type masks of every battle in NumPy arrays and applying the same rules as `Pokemon.calculate_dmg`
+    """
+    _MIN_HP: int = Pokemon._MIN_HP
+    _MAX_HP: int = Pokemon._MAX_HP
+    _MIN_DMG: int = 10
+    _MAX_DMG: int = 20
+    _CRITICAL_CHANCE: float = 0.25
+
+    def __init__(self, pokemons: list[dict]) -> None:
+        """
+        This is the constructor of the engine, it builds the power array and, from a `TypeChart`, the
+        effectivity matrix between every pair of species.
+        
+        :param pokemons: A list of dictionaries with the pokemons data, as returned by `PokeSystem.load_file`
+        """
+        if np is None:
+            raise ImportError('The vector engine needs NumPy, install it with "pip install numpy"')
+        chart = TypeChart()
+        rows = [chart.attack_index(pokemon['tipo']) for pokemon in pokemons]
+        cols = [chart.defense_index(pokemon['debilidad'], pokemon['fortaleza']) for pokemon in pokemons]
+        self.names = [str(pokemon['nombre']).capitalize() for pokemon in pokemons]
+        self.power = np.array([pokemon['poder'] for pokemon in pokemons], dtype=np.float64)
+        self.effectivity = np.array(chart.table, dtype=np.int8)[np.ix_(rows, cols)]
+        # Rows: NORMAL, WEAK, STRONG from the type chart. Columns: normal hit, critical hit.
+        self.boosters = np.array([[1, 1], [0.85, 0.95], [1.15, 1.25]], dtype=np.float64)
+
+    def random_pairs(self, amount: int, seed: int = None) -> tuple:
+        """
+        This function draws random pairs of species to fight against each other.
+        
+        :param amount: The amount of battles
+        :param seed: The seed (or `numpy.random.SeedSequence`) of the random generator
+        :return: a tuple with the arrays of species indexes of both sides.
+        """
+        rng = np.random.default_rng(seed)
+        return rng.integers(0, len(self.names), amount), rng.integers(0, len(self.names), amount)
+
+    def simulate(self, side_a, side_b, seed: int = None) -> tuple:
+        """
+        This function resolves every battle between the species of `side_a` and `side_b` at once. On
+        every step each active battle flips a coin for the turn, draws a damage and a critical roll in
+        bulk and applies the effectivity booster, until one of both pokemons faints.
+        
+        :param side_a: An array with the species indexes of the first side (the player)
+        :param side_b: An array with the species indexes of the second side (the enemy)
+        :param seed: The seed (or `numpy.random.SeedSequence`) of the random generator
+        :return: a tuple with a boolean array that is True where the first side won and an array with
+        the amount of turns of every battle.
+        """
+        rng = np.random.default_rng(seed)
+        side_a = np.asarray(side_a)
+        side_b = np.asarray(side_b)
+        amount = len(side_a)
+        hp_a = rng.integers(self._MIN_HP, self._MAX_HP + 1, amount).astype(np.float64)
+        hp_b = rng.integers(self._MIN_HP, self._MAX_HP + 1, amount).astype(np.float64)
+        turns = np.zeros(amount, dtype=np.int64)
+        active = np.arange(amount)
+        while active.size:
+            attack_a = rng.random(active.size) < 0.5
+            attacker = np.where(attack_a, side_a[active], side_b[active])
+            defender = np.where(attack_a, side_b[active], side_a[active])
+            damage = rng.integers(self._MIN_DMG, self._MAX_DMG + 1, active.size) + self.power[attacker]
+            critical = (rng.random(active.size) < self._CRITICAL_CHANCE).astype(np.int8)
+            damage = np.round(damage * self.boosters[self.effectivity[attacker, defender], critical], 2)
+            hp_defender = np.where(attack_a, hp_b[active], hp_a[active])
+            hp_defender = np.where(damage <= hp_defender, np.round(hp_defender - damage, 2), 0)
+            hp_b[active] = np.where(attack_a, hp_defender, hp_b[active])
+            hp_a[active] = np.where(attack_a, hp_a[active], hp_defender)
+            turns[active] += 1
+            active = active[hp_defender > 0]
+        return hp_a > 0, turns
+
+def object_duels(pokemons: list[dict], side_a, side_b, seed: int = None) -> tuple[list[bool], list[int]]:
+    """
+    This function resolves the same one versus one battles as `VectorEngine.simulate`, one object at a
+    time through `Pokemon.continue_battle`, so both engines can be compared.
+    
+    :param pokemons: A list of dictionaries with the pokemons data
+    :param side_a: The species indexes of the first side (the player)
+    :param side_b: The species indexes of the second side (the enemy)
+    :param seed: The seed of the random generator
+    :return: a tuple with a list that is True where the first side won and a list with the amount of
+    turns of every battle.
+    """
+    rng = GameRandom(seed)
+    won, turns = list[bool](), list[int]()
+    for index_a, index_b in zip(side_a, side_b):
+        poke_a, poke_b = PokeSystem.parse_objects([pokemons[index_a], pokemons[index_b]], rng)[::-1]
+        battle_turns = 0
+        while poke_a.has_hp() and poke_b.has_hp():
+            if rng.coin():
+                poke_a.continue_battle(poke_b)
+            else:
+                poke_b.continue_battle(poke_a)
+            battle_turns += 1
+        won.append(poke_a.has_hp())
+        turns.append(battle_turns)
+    return won, turns
+
+def show_comparison(amount: int, file_path: str, seed: int = None) -> None:
+    """
+    This function resolves the same random battles with the vector engine and the object engine and
+    prints the win rate, the average amount of turns and the throughput of both.
+    
+    :param amount: The amount of battles
+    :param file_path: The path of the JSON file that contains the pokemons data
+    :param seed: The seed of the random generators
+    """
+    pokemons = PokeSystem.load_file(file_path)
+    engine = VectorEngine(pokemons)
+    # Independent streams, otherwise the drawn species would be correlated with the drawn HP.
+    pairs_seed, battle_seed = np.random.SeedSequence(seed).spawn(2)
+    side_a, side_b = engine.random_pairs(amount, pairs_seed)
+    start = time.perf_counter()
+    won, turns = engine.simulate(side_a, side_b, battle_seed)
+    vector_elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    object_won, object_turns = object_duels(pokemons, side_a.tolist(), side_b.tolist(), int(battle_seed.generate_state(1)[0]))
+    object_elapsed = time.perf_counter() - start
+    for title, wins, turns_sum, elapsed in (
+            ('Vectorial', int(won.sum()), int(turns.sum()), vector_elapsed),
+            ('Objetos', sum(object_won), sum(object_turns), object_elapsed)):
+        print(f'{title:10s} victorias: {100 * wins / amount:6.2f}% | turnos promedio: {turns_sum / amount:6.2f} '
+              f'| batallas por segundo: {amount / elapsed if elapsed else 0:.2f}')
@@ -0,0 +1,178 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import random
+from array import array
+from typing import Callable
+
+class WildPool:
+    """
+    The WildPool class holds the wild pokemons of a game and draws them in O(1), uniformly or weighted by
+    their spawn weight, with replacement (`sample`) or without replacement (`draw`). The weights, the
+    alias table and the drawn flags are kept in flat arrays, and so are the items when they are integer
+    keys (a `range`), so a pool over a large pokedex doesn't hold a Python object per entry
+    """
+
+    def __init__(self, items: list = None, weights: list[float] = None, rng: random.Random = None,
+                factory: Callable = None) -> None:
+        """
+        This is the constructor of the pool, when every weight is the same the pool draws uniformly,
+        otherwise it builds an alias table over the weights.
+        
+        :param items: The items of the pool, a `range` is stored as an array of integers
+        :param weights: The spawn weight of every item, defaults to the same weight for all of them
+        :param rng: The random generator used for the draws, defaults to the `random` module
+        :param factory: An optional function applied to an item when it is drawn, so the pool can hold
+        cheap keys and build the real objects lazily
+        """
+        self._items = array('q', items) if isinstance(items, range) else list(items or [])
+        self._rng = rng or random
+        self._factory = factory
+        self._weights = None
+        if weights is not None and any(weight != weights[0] for weight in weights):
+            if len(weights) != len(self._items):
+                raise ValueError('The pool needs one weight per item')
+            if min(weights) <= 0:
+                raise ValueError('The spawn weights must be greater than 0')
+            self._weights = array('d', weights)
+        self._alive = bytearray(b'\x01') * len(self._items)
+        self._amount = len(self._items)
+        self.__build_alias()
+
+    def __len__(self) -> int:
+        """
+        This function returns the amount of items left in the pool.
+        :return: an integer.
+        """
+        return self._amount
+
+    def __bool__(self) -> bool:
+        """
+        This function returns whether the pool still has items.
+        :return: a boolean value.
+        """
+        return self._amount > 0
+
+    def __iter__(self):
+        """
+        This function iterates the items left in the pool, as they are stored (without the factory).
+        :return: an iterator of the items.
+        """
+        if self._weights is None:
+            return iter(self._items)
+        return (item for item, alive in zip(self._items, self._alive) if alive)
+
+    @property
+    def weighted(self) -> bool:
+        """
+        This function returns whether the pool draws weighted by the spawn weights.
+        :return: a boolean value.
+        """
+        return self._weights is not None
+
+    def __build_alias(self) -> None:
+        """
+        This function drops the items already drawn and builds the alias table (Vose's method) of the
+        weights of the items left, so a weighted index is drawn with one uniform index and one coin.
+        """
+        if self._weights is None:
+            return
+        if not all(self._alive):
+            alive = array('q', (index for index, is_alive in enumerate(self._alive) if is_alive))
+            items = (self._items[index] for index in alive)
+            self._items = array(self._items.typecode, items) if isinstance(self._items, array) else list(items)
+            self._weights = array('d', (self._weights[index] for index in alive))
+            self._alive = bytearray(b'\x01') * len(self._items)
+        size = len(self._weights)
+        total = sum(self._weights)
+        self._prob = array('d', bytes(8 * size))
+        self._alias = array('q', bytes(8 * size))
+        scaled = array('d', (weight * size / total for weight in self._weights)) if size else array('d')
+        small = array('q', (index for index, value in enumerate(scaled) if value < 1))
+        large = array('q', (index for index, value in enumerate(scaled) if value >= 1))
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self._prob[less] = scaled[less]
+            self._alias[less] = more
+            scaled[more] = scaled[more] + scaled[less] - 1
+            (small if scaled[more] < 1 else large).append(more)
+        for index in small + large:
+            self._prob[index] = 1.0
+        self._table_weight = total
+        self._alive_weight = total
+
+    def __sample_index(self) -> int:
+        """
+        This function draws an index of the items, uniformly or through the alias table.
+        :return: the index of the drawn item.
+        """
+        rng = self._rng
+        index = int(rng.random() * len(self._items))
+        if self._weights is None or rng.random() < self._prob[index]:
+            return index
+        return self._alias[index]
+
+    def sample(self):
+        """
+        This function draws an item with replacement, the item stays in the pool.
+        :return: the drawn item.
+        """
+        if not self:
+            raise IndexError('The wild pool is empty')
+        index = self.__sample_index()
+        while not self._alive[index]:
+            index = self.__sample_index()
+        return self.__build(self._items[index])
+
+    def draw(self):
+        """
+        This function draws an item without replacement. Uniform pools swap the drawn item with the last
+        one and pop it, weighted pools mark it as drawn and rebuild the alias table once less than half
+        of its weight is left, so the rejected draws stay bounded.
+        :return: the drawn item.
+        """
+        if not self:
+            raise IndexError('The wild pool is empty')
+        if self._weights is None:
+            index = int(self._rng.random() * self._amount)
+            self._items[index], self._items[-1] = self._items[-1], self._items[index]
+            self._amount -= 1
+            return self.__build(self._items.pop())
+        index = self.__sample_index()
+        while not self._alive[index]:
+            index = self.__sample_index()
+        self._alive[index] = 0
+        self._amount -= 1
+        self._alive_weight -= self._weights[index]
+        item = self._items[index]
+        if self._alive_weight < self._table_weight / 2:
+            self.__build_alias()
+        return self.__build(item)
+
+    def __build(self, item):
+        """
+        This function applies the factory of the pool to a drawn item, if the pool has one.
+        
+        :param item: The drawn item
+        :return: the item or the object built from it.
+        """
+        return self._factory(item) if self._factory else item
@@ -0,0 +1,49 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import pytest
+from modules.database import db_manager
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+
+@pytest.fixture(scope='session')
+def pokedex_file() -> str:
+    """
+    The path of the pokedex JSON file shipped with the game.
+    """
+    return os.path.join(ROOT, 'assets', 'configs', 'pokemons_data.json')
+
+@pytest.fixture
+def dao_manager(tmp_path, monkeypatch):
+    """
+    A factory of DAO Managers over a database in the temporary folder of the test, with the queries of
+    the project. The keyword arguments of the factory replace the sections of the configs.
+    """
+    monkeypatch.chdir(ROOT)
+    configs = db_manager.load_configs('./modules/configs.json')
+    configs['paths']['db_file'] = str(tmp_path / 'game.db')
+
+    def build(**changes) -> db_manager.DAOManager:
+        monkeypatch.setattr(db_manager, 'load_configs', lambda path: {**configs, **changes})
+        return db_manager.DAOManager()
+    return build
@@ -0,0 +1,143 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+import time
+import pytest
+from modules import audio
+from modules.audio import AudioManager, SilentSound
+
+class BrokenSound:
+    "A decoded sound whose volume can't be set"
+    def get_raw(self) -> bytes:
+        return b''
+
+    def set_volume(self, volume: float) -> None:
+        raise RuntimeError('no volume')
+
+class FakeMixer:
+    "A mixer that decodes every file into a BrokenSound"
+    def get_init(self) -> tuple:
+        return (44100, -16, 2)
+
+    def Sound(self, path: str = None, buffer: bytes = None) -> BrokenSound:
+        return BrokenSound()
+
+@pytest.fixture
+def sounds(tmp_path) -> dict[str, str]:
+    paths = dict()
+    for name in ('intro', 'battle'):
+        path = tmp_path / f'{name}.mp3'
+        path.write_bytes(b'not really an mp3')
+        paths[name] = str(path)
+    return paths
+
+def sound(manager: AudioManager, name: str):
+    "It returns the sound, failing if the manager made it wait until the timeout"
+    start = time.monotonic()
+    loaded = manager.sound(name, timeout=5)
+    assert time.monotonic() - start < 4
+    return loaded
+
+def test_failed_sounds_are_silent(monkeypatch, sounds):
+    monkeypatch.setattr(audio, 'load_mixer', FakeMixer)
+    manager = AudioManager(sounds)
+    assert isinstance(sound(manager, 'intro'), SilentSound)
+    assert isinstance(sound(manager, 'battle'), SilentSound)
+
+@pytest.mark.filterwarnings('ignore::pytest.PytestUnhandledThreadExceptionWarning')
+def test_sounds_are_ready_when_the_preload_dies(monkeypatch, sounds):
+    def load_mixer():
+        raise SystemExit
+    monkeypatch.setattr(audio, 'load_mixer', load_mixer)
+    manager = AudioManager(sounds)
+    assert isinstance(sound(manager, 'intro'), SilentSound)
+    assert isinstance(sound(manager, 'unknown'), SilentSound)
+    for thread in threading.enumerate():
+        if thread.name == 'audio-preload':
+            thread.join()
+
+class PlayedSound:
+    "A sound that remembers when it is played and stopped"
+    def __init__(self, name: str, played: list[str]) -> None:
+        self.name, self.played = name, played
+
+    def get_raw(self) -> bytes:
+        return b'samples'
+
+    def set_volume(self, volume: float) -> None:
+        pass
+
+    def play(self, loops: int = 0, maxtime: int = 0, fade_ms: int = 0) -> None:
+        self.played.append(self.name)
+
+    def fadeout(self, time: int) -> None:
+        self.played.append(f'fadeout {self.name}')
+
+    def stop(self) -> None:
+        self.played.append(f'stop {self.name}')
+
+class SlowMixer(FakeMixer):
+    "A mixer that decodes the intro only when it is released"
+    def __init__(self) -> None:
+        self.release, self.played = threading.Event(), list[str]()
+
+    def Sound(self, path: str = None, buffer: bytes = None) -> PlayedSound:
+        if path and path.endswith('intro.mp3'):
+            self.release.wait()
+        return PlayedSound('cached' if buffer is not None else path.rsplit('/', 1)[-1], self.played)
+
+def test_play_does_not_wait_for_the_decoding(monkeypatch, sounds):
+    mixer = SlowMixer()
+    monkeypatch.setattr(audio, 'load_mixer', lambda: mixer)
+    manager = AudioManager(sounds)
+    start = time.monotonic()
+    assert manager.play('intro') is None
+    assert time.monotonic() - start < 1
+    mixer.release.set()
+    assert isinstance(manager.sound('battle', timeout=5), PlayedSound)
+    assert mixer.played == ['intro.mp3']
+    manager.crossfade('battle')
+    assert mixer.played == ['intro.mp3', 'fadeout intro.mp3', 'battle.mp3']
+    manager.close()
+
+def test_a_newer_sound_replaces_the_pending_one(monkeypatch, sounds):
+    mixer = SlowMixer()
+    monkeypatch.setattr(audio, 'load_mixer', lambda: mixer)
+    manager = AudioManager(sounds)
+    manager.play('intro')
+    manager.play('battle')
+    mixer.release.set()
+    manager.sound('battle', timeout=5)
+    manager.close()
+    assert mixer.played == ['battle.mp3', 'stop battle.mp3']
+
+def test_close_unmaps_the_caches(monkeypatch, sounds):
+    mixer = SlowMixer()
+    mixer.release.set()
+    monkeypatch.setattr(audio, 'load_mixer', lambda: mixer)
+    AudioManager(sounds).start().close()
+    manager = AudioManager(sounds)
+    assert manager.sound('battle', timeout=5).name == 'cached'
+    maps = [mapped for samples, mapped in manager._AudioManager__maps]
+    manager.close()
+    assert len(maps) == 2 and all(mapped.closed for mapped in maps)
@@ -0,0 +1,109 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sqlite3
+import threading
+import pytest
+from modules.database.connection_pool import ConnectionPool
+
+def in_thread(action):
+    """
+    The function runs an action in a new thread and waits for it.
+    :param action: A callable without arguments
+    :return: The result of the action.
+    """
+    result = list()
+    thread = threading.Thread(target=lambda: result.append(action()))
+    thread.start()
+    thread.join()
+    return result[0]
+
+def test_release_keeps_the_connections_of_other_threads(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'game.db'))
+    main_connection = pool.connection()
+    main_connection.execute('CREATE TABLE scores (score INTEGER)')
+    worker_ready, worker_done = threading.Event(), threading.Event()
+
+    def worker():
+        connection = pool.connection()
+        worker_ready.set()
+        worker_done.wait()
+        return connection.execute('SELECT COUNT(*) FROM scores').fetchone()[0]
+
+    result = list()
+    thread = threading.Thread(target=lambda: result.append(worker()))
+    thread.start()
+    worker_ready.wait()
+    pool.release()
+    worker_done.set()
+    thread.join()
+    assert result == [0]
+    with pytest.raises(sqlite3.ProgrammingError):
+        main_connection.execute('SELECT 1')
+    assert pool.connection() is not main_connection
+    pool.close()
+
+def test_connections_of_finished_threads_are_closed(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'game.db'))
+    finished_connection = in_thread(pool.connection)
+    pool.connection()
+    with pytest.raises(sqlite3.ProgrammingError):
+        finished_connection.execute('SELECT 1')
+    pool.close()
+
+def test_run_once_retries_a_failed_action(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'game.db'))
+    calls = list()
+
+    def failing():
+        calls.append('fail')
+        raise sqlite3.OperationalError('locked')
+
+    with pytest.raises(sqlite3.OperationalError):
+        pool.run_once('view', failing)
+    pool.run_once('view', lambda: calls.append('false') or False)
+    pool.run_once('view', lambda: calls.append('done'))
+    pool.run_once('view', lambda: calls.append('again'))
+    assert calls == ['fail', 'false', 'done']
+
+def test_run_once_waits_for_a_running_action(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'game.db'))
+    started, finish, calls = threading.Event(), threading.Event(), list()
+
+    def slow():
+        started.set()
+        finish.wait()
+        calls.append('slow')
+
+    thread = threading.Thread(target=pool.run_once, args=('view', slow))
+    thread.start()
+    started.wait()
+    waiting = threading.Thread(target=pool.run_once, args=('view', lambda: calls.append('second')))
+    waiting.start()
+    waiting.join(0.2)
+    try:
+        assert waiting.is_alive()
+    finally:
+        finish.set()
+    thread.join()
+    waiting.join()
+    assert calls == ['slow']
@@ -0,0 +1,93 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from types import SimpleNamespace
+import pytest
+from modules.database.connection_pool import ConnectionPool
+
+def indexes(dao) -> set[str]:
+    connection = ConnectionPool.get(dao_file(dao)).connection()
+    return {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL")}
+
+def dao_file(dao) -> str:
+    return dao._DAOManager__db_output_file
+
+def game(name: str, status: str, score: int):
+    trainer = SimpleNamespace(name=name, status=status, defeated_pokemons=[], pokemons=[1, 2, 3])
+    return trainer, SimpleNamespace(player_score=score)
+
+def test_indexes_survive_deleting_before_insert(dao_manager):
+    dao = dao_manager(delete_before_insert=True)
+    dao.prepare_table()
+    for score in (10, 20):
+        dao.insert_table(*game('Ash', 'Won', score))
+    assert indexes(dao) == {'trainer_scores_ranking_idx', 'trainer_scores_trainer_idx'}
+    dao.prepare_table()
+    assert indexes(dao) == {'trainer_scores_ranking_idx', 'trainer_scores_trainer_idx'}
+    assert [row[4] for row in dao.leaderboard()] == []
+    dao.close()
+
+def insert_games(dao, games: list[tuple]) -> None:
+    connection = ConnectionPool.get(dao_file(dao)).connection()
+    with connection:
+        connection.executemany(
+            'INSERT INTO trainer_scores (trainer_name, status, amount_pokemons, score, dataingestiondttm) VALUES (?, ?, 3, ?, ?)',
+            games)
+
+@pytest.fixture
+def stats_dao(dao_manager):
+    dao = dao_manager(delete_before_insert=True)
+    dao.prepare_table()
+    insert_games(dao, [
+        ('Ash', 'Won', 10, '2024-01-01 10:00:00'),
+        ('Ash', 'Lose', 20, '2024-01-02 10:00:00'),
+        ('Ash', 'Won', 30, '2024-01-03 10:00:00'),
+        ('Ash', 'Won', 40, '2024-01-04 10:00:00'),
+        ('Misty', 'Lose', 50, '2024-01-01 11:00:00'),
+        ('Misty', 'Lose', 15, '2024-01-02 11:00:00'),
+        ('Brock', 'Won', 5, '2024-01-01 12:00:00')])
+    yield dao
+    dao.close()
+
+def test_trainer_stats(stats_dao):
+    assert stats_dao.trainer_stats('Ash') == {
+        'trainer_name': 'Ash', 'games': 4, 'wins': 3, 'win_rate': 0.75, 'best_score': 40,
+        'avg_score': 25.0, 'streak_status': 'Won', 'streak': 2, 'percentile': 50.0}
+    misty = stats_dao.trainer_stats('Misty')
+    assert (misty['win_rate'], misty['streak_status'], misty['streak'], misty['percentile']) == (0, 'Lose', 2, 100.0)
+    brock = stats_dao.trainer_stats('Brock')
+    assert (brock['win_rate'], brock['streak'], brock['percentile']) == (1, 1, 0)
+    assert stats_dao.trainer_stats('Gary') is None
+
+def test_trainer_stats_use_the_trainer_index(stats_dao):
+    connection = ConnectionPool.get(dao_file(stats_dao)).connection()
+    plan = connection.execute(
+        "EXPLAIN QUERY PLAN SELECT `status` FROM trainer_scores WHERE trainer_name = 'Ash' ORDER BY dataingestiondttm DESC").fetchall()
+    assert any('trainer_scores_trainer_idx' in row[-1] for row in plan)
+
+def test_show_trainer_stats(stats_dao, capsys):
+    stats_dao.show_trainer_stats('Ash')
+    output = capsys.readouterr().out
+    assert 'Partidas: 4' in output and 'Victorias: 3 (75.00%)' in output
+    assert 'Racha actual: 2 (Won)' in output and 'Percentil: 50.00' in output
+    stats_dao.show_trainer_stats('Gary')
+    assert 'Gary no tiene partidas registradas' in capsys.readouterr().out
@@ -0,0 +1,40 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+from modules.game_clock import InstantClock, RealClock, ScaledClock, VirtualClock, make_clock
+
+@pytest.mark.parametrize('mode, kind', [('real', RealClock), ('instant', InstantClock), ('virtual', VirtualClock), (' X4 ', ScaledClock)])
+def test_modes(mode, kind):
+    assert type(make_clock(mode)) is kind
+
+def test_scaled_speed():
+    assert make_clock('x2.5').speed == 2.5
+
+@pytest.mark.parametrize('mode', ['0', 'x0', '-1', 'nan', 'inf', '-inf'])
+def test_invalid_speed(mode):
+    with pytest.raises(ValueError, match='finite number greater than 0'):
+        make_clock(mode)
+
+def test_unknown_mode():
+    with pytest.raises(ValueError, match='Unknown clock mode: fast'):
+        make_clock('fast')
@@ -0,0 +1,45 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import os
+from modules.game_clock import make_clock
+from modules.game_server import GameServer
+from modules.load_generator import bot_session
+from modules.replay_log import ReplayReader
+
+def test_every_turn_is_measured(dao_manager, tmp_path):
+    dao_manager()
+    replay_dir = str(tmp_path / 'replays')
+    server = GameServer('./assets/configs/pokemons_data.json', str(tmp_path / 'log.txt'), make_clock('instant'), replay_dir)
+
+    async def play(sessions: int) -> list[list[float]]:
+        listener = await asyncio.start_server(server.handle, '127.0.0.1', 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            return [await bot_session('127.0.0.1', port, f'Bot {number}') for number in range(sessions)]
+
+    latencies = asyncio.run(play(3))
+    turns = [ReplayReader.open(os.path.join(replay_dir, name)).turns for name in sorted(os.listdir(replay_dir))]
+    # the first turn starts the clock, every next turn is one latency
+    assert [len(session) for session in latencies] == [played - 1 for played in turns]
+    assert min(turns) > 1
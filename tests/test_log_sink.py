@@ -0,0 +1,93 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import gzip
+import os
+import threading
+import time
+from modules import log_sink
+from modules.log_sink import LogRecord, LogSink
+
+def record(turn: int, message: str = 'list index out of range') -> LogRecord:
+    return LogRecord(time.time(), 'ERROR', 1, turn, message)
+
+def backups(folder) -> list[str]:
+    return sorted(name for name in os.listdir(folder) if name.endswith('.gz'))
+
+def lines(path) -> list[str]:
+    with open(path, encoding='utf-8') as file:
+        return file.read().splitlines()
+
+def test_records_are_written_in_order(tmp_path):
+    sink = LogSink(str(tmp_path / 'log.txt'))
+    for turn in range(100):
+        sink.emit(record(turn))
+    assert sink.flush(5)
+    written = lines(tmp_path / 'log.txt')
+    assert len(written) == 100
+    assert written[7].endswith(' - ERROR - session 1 - turn 7 - list index out of range')
+    sink.close()
+
+def test_size_rotation_compresses_and_prunes_the_backups(tmp_path):
+    sink = LogSink(str(tmp_path / 'log.txt'), max_bytes=100, backups=2)
+    for turn in range(6):
+        for line in range(3):
+            sink.emit(record(turn, f'line {line}'))
+        assert sink.flush(5)
+    sink.close()
+    kept = backups(tmp_path)
+    assert len(kept) == 2
+    assert not [name for name in os.listdir(tmp_path) if name not in kept and name != 'log.txt']
+    with gzip.open(tmp_path / kept[-1], 'rt', encoding='utf-8') as file:
+        assert file.read().splitlines()[-1].endswith('turn 4 - line 2')
+    assert lines(tmp_path / 'log.txt')[-1].endswith('turn 5 - line 2')
+
+def test_age_rotation(tmp_path):
+    sink = LogSink(str(tmp_path / 'log.txt'), max_age=0)
+    sink.emit(record(1))
+    assert sink.flush(5)
+    sink.emit(record(2))
+    sink.close()
+    assert len(backups(tmp_path)) == 1
+    assert lines(tmp_path / 'log.txt')[-1].endswith('turn 2 - list index out of range')
+
+def test_dropped_records_are_counted_and_reported(tmp_path, monkeypatch):
+    entered, release = threading.Event(), threading.Event()
+    format_records = log_sink.format_records
+
+    def slow_format(records):
+        entered.set()
+        release.wait()
+        return format_records(records)
+
+    monkeypatch.setattr(log_sink, 'format_records', slow_format)
+    sink = LogSink(str(tmp_path / 'log.txt'), capacity=8, flush_interval=60)
+    sink.emit(record(0))
+    assert entered.wait(5)
+    for turn in range(1, 14):
+        sink.emit(record(turn))
+    release.set()
+    assert sink.dropped == 5
+    sink.close()
+    written = lines(tmp_path / 'log.txt')
+    assert 'WARNING - session 0 - turn 0 - 5 records dropped, the log buffer was full' in written[1]
+    assert [line.rsplit(' - ', 2)[1] for line in written[2:]] == [f'turn {turn}' for turn in range(6, 14)]
@@ -0,0 +1,78 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import os
+import pickle
+import shutil
+import struct
+import pytest
+from modules import pokedex_cache
+from modules.pokedex_cache import cache_path, load_pokedex
+
+class Exploit:
+    "A pickle that creates a file when it is loaded"
+    def __init__(self, marker: str) -> None:
+        self.marker = marker
+
+    def __reduce__(self):
+        return (open, (self.marker, 'w'))
+
+@pytest.fixture
+def pokedex(tmp_path, pokedex_file):
+    path = str(tmp_path / 'pokemons_data.json')
+    shutil.copyfile(pokedex_file, path)
+    pokedex_cache._loaded_dexes.clear()
+    yield path
+    pokedex_cache._loaded_dexes.clear()
+
+@pytest.fixture
+def expected(pokedex_file) -> dict:
+    with open(pokedex_file, encoding='utf-8') as file:
+        return json.load(file)
+
+def test_cache_is_compiled_and_read_back(pokedex, expected):
+    assert load_pokedex(pokedex) == expected
+    assert os.path.exists(cache_path(pokedex))
+    pokedex_cache._loaded_dexes.clear()
+    assert load_pokedex(pokedex) == expected
+
+def test_touched_json_rewrites_the_header(pokedex, expected):
+    load_pokedex(pokedex)
+    pokedex_cache._loaded_dexes.clear()
+    stat = os.stat(pokedex)
+    os.utime(pokedex, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert load_pokedex(pokedex) == expected
+    with open(cache_path(pokedex), 'rb') as file:
+        header = file.read(pokedex_cache._HEADER.size)
+    assert pokedex_cache._HEADER.unpack(header)[2] == os.stat(pokedex).st_mtime_ns
+    assert not [name for name in os.listdir(os.path.dirname(pokedex)) if name.endswith('.tmp')]
+
+@pytest.mark.parametrize('version', [1, 2])
+def test_pickled_cache_is_never_loaded(pokedex, tmp_path, version, expected):
+    marker = str(tmp_path / 'exploited')
+    stat = os.stat(pokedex)
+    with open(cache_path(pokedex), 'wb') as file:
+        file.write(struct.pack('<4sHqq32s', b'PDEX', version, stat.st_mtime_ns, stat.st_size, bytes(32)))
+        file.write(pickle.dumps(Exploit(marker)))
+    assert load_pokedex(pokedex) == expected
+    assert not os.path.exists(marker)
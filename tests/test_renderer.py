@@ -0,0 +1,101 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import io
+import os
+import pytest
+from modules import renderer
+from modules.renderer import TerminalRenderer
+
+class FakeTTY(io.StringIO):
+    "A text stream that says it is a terminal and hands out what was written since the last read"
+    def isatty(self) -> bool:
+        return True
+
+    def take(self) -> str:
+        text = self.getvalue()
+        self.seek(0)
+        self.truncate()
+        return text
+
+@pytest.fixture
+def screen(monkeypatch):
+    monkeypatch.setattr(renderer.shutil, 'get_terminal_size', lambda: os.terminal_size((80, 24)))
+    stream = FakeTTY()
+    return stream, TerminalRenderer(stream)
+
+def frame(painter: TerminalRenderer, *rows: str) -> None:
+    painter.new_frame()
+    for row in rows:
+        painter.write(row)
+    painter.flush()
+
+def test_first_frame_clears_the_screen(screen):
+    stream, painter = screen
+    frame(painter, 'Pikachu', 'HP: 100.00')
+    assert stream.take() == '\033[2J\033[H\033[1;1HPikachu\033[K\033[2;1HHP: 100.00\033[K\033[3;1H'
+
+def test_unchanged_frame_emits_nothing(screen):
+    stream, painter = screen
+    frame(painter, 'Pikachu', 'HP: 100.00')
+    stream.take()
+    frame(painter, 'Pikachu', 'HP: 100.00')
+    assert stream.take() == ''
+
+def test_changed_row_emits_only_its_new_suffix(screen):
+    stream, painter = screen
+    frame(painter, 'Pikachu', 'HP: 100.00')
+    stream.take()
+    frame(painter, 'Pikachu', 'HP: 095.00')
+    assert stream.take() == '\033[2;5H095.00\033[K\033[3;1H'
+
+@pytest.mark.parametrize('old, new', [('Pokémon: Pikachu', 'Pokémon: Raichu'), ('\033[42mPikachu', '\033[42mRaichu')])
+def test_row_with_non_ascii_or_escapes_is_painted_whole(screen, old, new):
+    stream, painter = screen
+    frame(painter, old)
+    stream.take()
+    frame(painter, new)
+    assert stream.take() == f'\033[1;1H{new}\033[K\033[2;1H'
+
+def test_stale_rows_are_cleared(screen):
+    stream, painter = screen
+    frame(painter, 'Pikachu', 'HP: 100.00', 'Ataque: Impactrueno')
+    stream.take()
+    frame(painter, 'Pikachu')
+    assert stream.take() == '\033[2;1H\033[K\033[3;1H\033[K\033[2;1H'
+    frame(painter, 'Pikachu')
+    assert stream.take() == ''
+
+def test_scrolled_frame_is_painted_again(screen, monkeypatch):
+    stream, painter = screen
+    monkeypatch.setattr(renderer.shutil, 'get_terminal_size', lambda: os.terminal_size((80, 2)))
+    frame(painter, 'Pikachu', 'HP: 100.00')
+    stream.take()
+    frame(painter, 'Pikachu', 'HP: 100.00')
+    assert stream.take().startswith('\033[2J\033[H\033[1;1HPikachu')
+
+def test_output_that_is_not_a_terminal_gets_plain_lines():
+    stream = io.StringIO()
+    painter = TerminalRenderer(stream)
+    frame(painter, 'Pikachu', 'HP: 100.00')
+    frame(painter, 'Pikachu', 'HP: 100.00')
+    assert stream.getvalue() == 'Pikachu\nHP: 100.00\n\nPikachu\nHP: 100.00\n'
@@ -0,0 +1,85 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import io
+import pytest
+from modules.game_random import GameRandom
+from modules.poke_system import PokeSystem
+from modules.replay_log import ReplayReader, ReplayWriter
+from modules.replay_player import verify_replay
+from modules.simulation import simulate_game
+
+@pytest.fixture
+def record_game(pokedex_file):
+    records = PokeSystem.parse_species(PokeSystem.load_file(pokedex_file))
+
+    def record(path: str, seed: int, keyframe_every: int = 32) -> dict:
+        """
+        The function plays a headless game with the given seed and records its replay.
+        :param path: The path of the replay file
+        :param seed: The seed of the game
+        :param keyframe_every: The amount of turns between keyframes
+        :return: The result of the game.
+        """
+        writer = ReplayWriter(path, seed, 'Bot', keyframe_every)
+        try:
+            return simulate_game(records, path + '.log', 'Bot', GameRandom(seed), writer)
+        finally:
+            writer.close()
+    return record
+
+@pytest.mark.parametrize('seed', [5, -5, 2 ** 64 - 1])
+def test_replay_round_trip_verifies(tmp_path, seed, record_game, pokedex_file):
+    path = str(tmp_path / 'game.rpl')
+    result = record_game(path, seed)
+    reader = ReplayReader.open(path)
+    assert reader.seed == abs(seed)
+    assert reader.trainer_name == 'Bot'
+    assert reader.turns == result['turns']
+    assert verify_replay(path, pokedex_file, str(tmp_path / 'log.txt')) is None
+
+def test_replay_detects_another_game(tmp_path, record_game, pokedex_file):
+    path = str(tmp_path / 'game.rpl')
+    record_game(path, 5)
+    header = io.BytesIO()
+    ReplayWriter(header, 6, 'Bot')
+    with open(path, 'r+b') as file: # The turns of the seed 5 under the header of the seed 6
+        file.write(header.getvalue())
+    assert ReplayReader.open(path).seed == 6
+    assert verify_replay(path, pokedex_file, str(tmp_path / 'log.txt')) is not None
+
+def test_seed_out_of_the_header_is_not_stored(tmp_path, record_game):
+    path = str(tmp_path / 'game.rpl')
+    record_game(path, 2 ** 64)
+    assert ReplayReader.open(path).seed is None
+
+@pytest.mark.parametrize('keyframe_every', [1, 3, 32])
+def test_keyframe_seek_matches_reading_from_the_start(tmp_path, keyframe_every, record_game):
+    path = str(tmp_path / 'game.rpl')
+    record_game(path, 11, keyframe_every)
+    reader = ReplayReader.open(path)
+    state = reader.keyframe(0)
+    for turn, record in enumerate(reader.records()):
+        assert reader.keyframe(turn) == pytest.approx(state)
+        assert next(reader.records(turn)) == record
+        state = state.advance(record)
+    assert reader.keyframe(reader.turns) == pytest.approx(state)
@@ -0,0 +1,96 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import sqlite3
+import pytest
+from modules.database.score_writer import ScoreWriter
+
+class FakeDAO:
+    "A DAO that stores the rows in a list and fails the batches asked for"
+    def __init__(self, failures: list[Exception] = ()) -> None:
+        self.rows = list[tuple]()
+        self.failures = list(failures)
+
+    def prepare_table(self) -> None:
+        raise AssertionError('the writer must not prepare the table')
+
+    def insert_many(self, rows: list[tuple]) -> int:
+        if self.failures:
+            raise self.failures.pop(0)
+        self.rows.extend(rows)
+        return len(rows)
+
+def submit(writer: ScoreWriter, amount: int) -> None:
+    for index in range(amount):
+        writer.submit(f'Bot {index}', 'Won', 3, index)
+
+def test_scores_are_written_in_batches():
+    dao = FakeDAO()
+    writer = ScoreWriter(dao, batch_size=10, max_pending=5)
+    submit(writer, 95)
+    writer.close()
+    assert writer.written == 95 and writer.failed == 0
+    assert [row[3] for row in dao.rows] == list(range(95))
+
+def test_failed_batch_keeps_draining_and_is_raised_by_close():
+    dao = FakeDAO([ValueError('broken batch')])
+    writer = ScoreWriter(dao, batch_size=10)
+    submit(writer, 30)
+    with pytest.raises(RuntimeError) as error:
+        writer.close()
+    assert isinstance(error.value.__cause__, ValueError)
+    assert writer.failed == 10 and writer.written == 20
+
+def test_submit_after_close_fails():
+    writer = ScoreWriter(FakeDAO([sqlite3.OperationalError('locked')]))
+    submit(writer, 1)
+    with pytest.raises(RuntimeError):
+        writer.close()
+    writer.close()
+    with pytest.raises(RuntimeError):
+        writer.submit('Bot', 'Won', 3, 1)
+
+def test_scores_are_written_to_the_database(dao_manager, tmp_path):
+    dao = dao_manager()
+    dao.prepare_table()
+    writer = ScoreWriter(dao, batch_size=10)
+    submit(writer, 25)
+    writer.close()
+    assert writer.written == 25 and writer.failed == 0
+    with sqlite3.connect(tmp_path / 'game.db') as connection:
+        assert connection.execute('SELECT COUNT(*) FROM trainer_scores').fetchone() == (25,)
+
+def test_locked_database_is_counted_as_failed(dao_manager, tmp_path):
+    dao = dao_manager(busy_timeout=0.05)
+    dao.prepare_table()
+    locker = sqlite3.connect(tmp_path / 'game.db', isolation_level=None)
+    locker.execute('BEGIN EXCLUSIVE')
+    writer = ScoreWriter(dao, batch_size=10)
+    submit(writer, 10)
+    try:
+        with pytest.raises(RuntimeError) as error:
+            writer.close()
+    finally:
+        locker.rollback()
+        locker.close()
+    assert isinstance(error.value.__cause__, sqlite3.OperationalError)
+    assert writer.failed == 10 and writer.written == 0
@@ -0,0 +1,101 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import io
+import os
+import pytest
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from modules.game_random import GameRandom
+from modules.pokedex_stream import PokedexIndex
+from modules.poke_system import PokeSystem
+from modules.renderer import TerminalRenderer
+from modules.simulation import simulate_game
+from modules.trainer import Trainer
+
+@pytest.fixture(scope='module')
+def records(pokedex_file):
+    return PokeSystem.parse_species(PokeSystem.load_file(pokedex_file))
+
+@pytest.mark.parametrize('seed', [1, 7, 12345])
+def test_seeded_game_is_deterministic(records, tmp_path, seed):
+    log_path = str(tmp_path / 'log.txt')
+    first = simulate_game(records, log_path, rng=GameRandom(seed))
+    assert simulate_game(records, log_path, rng=GameRandom(seed)) == first
+    assert not os.path.exists(log_path)
+
+def test_games_in_threads_are_the_same_as_serial_games(records, tmp_path):
+    log_path = str(tmp_path / 'log.txt')
+    seeds = range(16)
+    serial = [simulate_game(records, log_path, f'Bot {seed}', GameRandom(seed)) for seed in seeds]
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6) # switch threads as often as possible so the games interleave
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            threaded = list(executor.map(lambda seed: simulate_game(records, log_path, f'Bot {seed}', GameRandom(seed)), seeds))
+    finally:
+        sys.setswitchinterval(interval)
+    assert threaded == serial
+    assert not os.path.exists(log_path)
+
+@pytest.mark.parametrize('seed', [138, 286])
+def test_won_game_without_pokemon_in_battle_keeps_the_score(records, tmp_path, seed):
+    # in these games the pokemon in battle faints on the last turn
+    result = simulate_game(records, str(tmp_path / 'log.txt'), rng=GameRandom(seed))
+    assert result['status'] == 'Won' and result['pokemons_left'] and result['score'] > 0
+
+def test_score_without_pokemon_in_battle(records, tmp_path):
+    sys_manager = PokeSystem('', str(tmp_path / 'log.txt'))
+    sys_manager.init_pokemons(records)
+    trainer = Trainer('Bot')
+    sys_manager.assign_init_pokemons(trainer)
+    sys_manager.player_score = 25
+    assert trainer.pokemon_in_battle is None and trainer.pokemons
+    assert sys_manager.calculate_score(trainer) == 25
+
+def test_errors_are_written_to_the_renderer_of_the_system(tmp_path, capsys):
+    stream = io.StringIO()
+    sys_manager = PokeSystem(str(tmp_path / 'missing.json'), str(tmp_path / 'log.txt'), renderer=TerminalRenderer(stream))
+    sys_manager.init_pokemons()
+    assert sys_manager.next_pokemon() is None
+    assert 'Error al inicializar pokemones' in stream.getvalue()
+    assert 'Error Al cargar pokemones' in stream.getvalue()
+    assert capsys.readouterr().out == ''
+
+@pytest.mark.parametrize('seed', [0, 7, 12345])
+def test_lazy_game_is_the_same_as_the_eager_game(records, tmp_path, seed, pokedex_file):
+    log_path = str(tmp_path / 'log.txt')
+    lazy = simulate_game(None, log_path, rng=GameRandom(seed), file_path=pokedex_file)
+    assert lazy == simulate_game(records, log_path, rng=GameRandom(seed))
+    assert not os.path.exists(log_path)
+
+def test_lazy_pokedex_is_closed_when_the_pool_is_exhausted(tmp_path, monkeypatch, pokedex_file):
+    closed = []
+    monkeypatch.setattr(PokedexIndex, 'close', lambda index: closed.append(index._map))
+    sys_manager = PokeSystem(pokedex_file, str(tmp_path / 'log.txt'), headless=True)
+    sys_manager.init_pokemons(lazy=True)
+    while sys_manager.pokemons:
+        assert not closed
+        assert sys_manager.next_pokemon()
+    assert len(closed) == 1 and closed[0] is not None
+    sys_manager.close()
+    assert len(closed) == 1
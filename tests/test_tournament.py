@@ -0,0 +1,47 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+from modules import tournament
+from modules.log_sink import LogRecord, get_log_sink
+from modules.simulation import simulate_game
+from modules.tournament import run_tournament
+
+def test_seed_reproduces_the_tournament_with_any_amount_of_workers(tmp_path, pokedex_file):
+    log_path = str(tmp_path / 'log.txt')
+    results = [run_tournament(250, pokedex_file, log_path, workers, seed=4) for workers in (1, 2, 3)]
+    for total in results:
+        assert total['games'] == 250
+        for key in ('wins', 'scores', 'species', 'teams'):
+            assert total[key] == results[0][key]
+
+def test_records_logged_by_the_workers_are_written(tmp_path, monkeypatch, pokedex_file):
+    log_path = str(tmp_path / 'log.txt')
+
+    def logged_game(records, log_path, *args, **kwargs):
+        get_log_sink(log_path).emit(LogRecord(time.time(), 'ERROR', 1, 1, 'logged by a worker'))
+        return simulate_game(records, log_path, *args, **kwargs)
+
+    monkeypatch.setattr(tournament, 'simulate_game', logged_game)
+    run_tournament(30, pokedex_file, log_path, 2, seed=1)
+    with open(log_path, encoding='utf-8') as file:
+        assert file.read().count('logged by a worker') == 30
@@ -0,0 +1,62 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import math
+import pytest
+from modules.poke_system import PokeSystem
+
+np = pytest.importorskip('numpy')
+from modules.vector_engine import VectorEngine, object_duels
+
+BATTLES = 20000
+
+def agree(values_a, values_b) -> bool:
+    """
+    The function checks that two samples have the same mean, allowing four standard errors of the
+    difference between both means.
+    :param values_a: The first sample
+    :param values_b: The second sample
+    :return: True if the means agree.
+    """
+    values_a, values_b = np.asarray(values_a, dtype=np.float64), np.asarray(values_b, dtype=np.float64)
+    error = math.sqrt(values_a.var() / len(values_a) + values_b.var() / len(values_b))
+    return abs(values_a.mean() - values_b.mean()) <= 4 * error
+
+@pytest.mark.parametrize('seed', [1, 2])
+def test_vector_and_object_engines_match(seed, pokedex_file):
+    pokemons = PokeSystem.load_file(pokedex_file)
+    engine = VectorEngine(pokemons)
+    pairs_seed, vector_seed, object_seed = np.random.SeedSequence(seed).spawn(3)
+    side_a, side_b = engine.random_pairs(BATTLES, pairs_seed)
+    won, turns = engine.simulate(side_a, side_b, vector_seed)
+    object_won, object_turns = object_duels(pokemons, side_a.tolist(), side_b.tolist(), int(object_seed.generate_state(1)[0]))
+    assert agree(won, object_won)
+    assert agree(turns, object_turns)
+    # Both engines fight the same matchups, their win rates must also be within two points
+    assert abs(won.mean() - np.mean(object_won)) < 0.02
+
+def test_vector_engine_is_reproducible(pokedex_file):
+    engine = VectorEngine(PokeSystem.load_file(pokedex_file))
+    side_a, side_b = engine.random_pairs(1000, 7)
+    first_won, first_turns = engine.simulate(side_a, side_b, 8)
+    second_won, second_turns = engine.simulate(side_a, side_b, 8)
+    assert (first_won == second_won).all() and (first_turns == second_turns).all()
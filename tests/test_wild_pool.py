@@ -0,0 +1,56 @@
+# MIT License
+#
+# Copyright (c) 2023 [FacuFalcone] All rights reserved.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import random
+from array import array
+from modules.pokedex_stream import PokedexIndex, iter_pokedex
+from modules.wild_pool import WildPool
+
+def test_weighted_draw_returns_every_item_once():
+    pool = WildPool(range(1000), [1 + index % 7 for index in range(1000)], rng=random.Random(1))
+    drawn = [pool.draw() for _ in range(1000)]
+    assert sorted(drawn) == list(range(1000))
+    assert not pool
+
+def test_uniform_draw_returns_every_item_once():
+    pool = WildPool(list('abcdef'), rng=random.Random(2))
+    assert sorted(pool.draw() for _ in range(6)) == list('abcdef')
+
+def test_index_pool_is_stored_in_flat_arrays():
+    pool = WildPool(range(100), [1 + index % 3 for index in range(100)], rng=random.Random(3))
+    for _ in range(60): # past half of the weight, so the alias table is rebuilt
+        pool.draw()
+    assert isinstance(pool._items, array) and isinstance(pool._weights, array)
+    assert isinstance(pool._alive, bytearray)
+    assert isinstance(pool._prob, array) and isinstance(pool._alias, array)
+
+def test_weighted_sample_follows_the_weights():
+    pool = WildPool(range(2), [1, 3], rng=random.Random(4))
+    heavy = sum(pool.sample() for _ in range(20000)) / 20000
+    assert abs(heavy - 0.75) < 0.02
+
+def test_pokedex_index_reads_every_record(pokedex_file):
+    index = PokedexIndex(pokedex_file)
+    assert [index.record(position) for position in range(len(index))] == list(iter_pokedex(pokedex_file))
+    index.close()
+    assert index.record(0) == next(iter_pokedex(pokedex_file))
+    index.close()